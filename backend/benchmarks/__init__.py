@@ -0,0 +1,11 @@
+"""
+Benchmarks reproduzíveis da API do SisPromo.
+
+- data_generator: popula o banco com volumes realistas
+- scenarios: requisições exercitadas em cada rodada
+- runner: executa os cenários e mede latência, consultas e memória
+
+Uso:
+    python manage.py benchmark_seed --scale small
+    python manage.py benchmark_run --iterations 20
+"""
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import clear_url_caches
+from rest_framework_simplejwt.tokens import RefreshToken
+from core.models import User
+from .runner import percentile
+from .scenarios import Scenario
+
+# Cenários de leitura atendidos pelas views assíncronas de config.urls_async
+ASYNC_SCENARIOS = [
+    "visits_list",
+    "visits_list_promoter",
+    "dashboard",
+    "dashboard_promoter",
+    "export_excel",
+]
+
+# URLconf de cada modo de deploy
+URLCONFS = {"wsgi": "config.urls", "asgi": "config.urls_async"}
+
+
+class ConcurrencyBenchmark:
+    """
+    Compara a vazão do deploy WSGI (views síncronas, uma thread por
+    requisição) com a do deploy ASGI (views assíncronas no event loop)
+    com N requisições simultâneas.
+
+    As requisições são feitas no próprio processo, passando por todos os
+    middlewares: no modo WSGI pelo Client do Django em um pool de N
+    threads; no modo ASGI pelo AsyncClient, com até N requisições em
+    andamento ao mesmo tempo.
+
+    Args:
+        scenarios: Cenários GET a executar
+        requests: Requisições medidas por cenário e modo
+        concurrency: Requisições simultâneas
+    """
+
+    def __init__(
+        self,
+        scenarios: Iterable[Scenario],
+        requests: int = 200,
+        concurrency: int = 50
+    ):
+        self.scenarios = list(scenarios)
+        self.requests = requests
+        self.concurrency = concurrency
+        self._tokens: Dict[str, str] = {}
+
+    def _authorization(self, username) -> Dict[str, str]:
+        if username is None:
+            return {}
+        if username not in self._tokens:
+            user = User.objects.get(username=username)
+            self._tokens[username] = str(RefreshToken.for_user(user).access_token)
+        return {"Authorization": f"Bearer {self._tokens[username]}"}
+
+    def _summary(self, results: List[Tuple[float, int]], elapsed: float) -> Dict:
+        latencies = sorted(latency for latency, _ in results)
+        statuses = {}
+        for _, status_code in results:
+            statuses[str(status_code)] = statuses.get(str(status_code), 0) + 1
+        return {
+            "requests": len(results),
+            "concurrency": self.concurrency,
+            "rps": round(len(results) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "statuses": statuses,
+        }
+
+    def _run_wsgi(self, scenario: Scenario) -> Dict:
+        headers = self._authorization(scenario.username)
+
+        def request(_):
+            # Client não é thread-safe: um por requisição
+            client = Client(raise_request_exception=False)
+            start = time.perf_counter()
+            response = client.get(scenario.path, scenario.params(), headers=headers)
+            return (time.perf_counter() - start) * 1000, response.status_code
+
+        request(None)  # aquecimento
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(request, range(self.requests)))
+            elapsed = time.perf_counter() - start
+        return self._summary(results, elapsed)
+
+    async def _run_asgi(self, scenario: Scenario) -> Dict:
+        headers = self._authorization(scenario.username)
+        client = AsyncClient(raise_request_exception=False)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def request():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(
+                    scenario.path, scenario.params(), headers=headers)
+                return (time.perf_counter() - start) * 1000, response.status_code
+
+        await request()  # aquecimento
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(request() for _ in range(self.requests)))
+        elapsed = time.perf_counter() - start
+        return self._summary(results, elapsed)
+
+    def run_scenario(self, scenario: Scenario) -> Dict:
+        # Os tokens são gerados antes, fora do event loop
+        self._authorization(scenario.username)
+        result = {}
+        for mode, urlconf in URLCONFS.items():
+            with override_settings(ROOT_URLCONF=urlconf):
+                clear_url_caches()
+                if mode == "wsgi":
+                    result[mode] = self._run_wsgi(scenario)
+                else:
+                    result[mode] = asyncio.run(self._run_asgi(scenario))
+            clear_url_caches()
+        return result
+
+    def run(self, log=None) -> Dict:
+        results = {}
+        for scenario in self.scenarios:
+            results[scenario.name] = self.run_scenario(scenario)
+            if log:
+                log(scenario.name, results[scenario.name])
+        return results
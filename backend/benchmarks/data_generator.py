@@ -0,0 +1,240 @@
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import islice, product
+from typing import Callable, Iterable, Iterator, Optional
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from core.models import User
+from core.infrastructure.models.brand_model import BrandModel, BrandStore
+from core.infrastructure.models.promoter_brand_model import PromoterBrand
+from core.infrastructure.models.state_model import StateChoices
+from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.models.visit_price_model import VisitPriceModel
+
+# Usuários fixos usados pelos cenários de benchmark
+BENCH_PASSWORD = "bench-sispromo"
+BENCH_MANAGER_USERNAME = "bench_manager"
+BENCH_PROMOTER_USERNAME = "bench_promoter_0"
+
+CITIES = [
+    "São Paulo", "Campinas", "Rio de Janeiro", "Belo Horizonte",
+    "Curitiba", "Porto Alegre", "Salvador", "Recife", "Fortaleza",
+    "Goiânia", "Florianópolis", "Manaus",
+]
+
+
+@dataclass(frozen=True)
+class Scale:
+    stores: int
+    brands: int
+    promoters: int
+    visits: int
+    # Dias de histórico sobre os quais as visitas são distribuídas
+    days: int
+    # Fração das combinações marca x loja com BrandStore/VisitPrice
+    matrix_density: float = 1.0
+
+
+SCALES = {
+    "tiny": Scale(stores=50, brands=10, promoters=10, visits=2_000,
+                  days=90),
+    "small": Scale(stores=500, brands=40, promoters=40, visits=100_000,
+                   days=365),
+    "realistic": Scale(stores=3_000, brands=300, promoters=300,
+                       visits=2_000_000, days=730),
+}
+
+
+def cnpj_with_check_digits(base: str) -> str:
+    """Completa 12 dígitos com os dígitos verificadores do CNPJ"""
+    weights = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+    for _ in range(2):
+        total = sum(int(digit) * weight for digit, weight in zip(base, weights))
+        digit = 11 - (total % 11)
+        base += str(digit if digit < 10 else 0)
+        weights = [6] + weights
+    return base
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class DataGenerator:
+    """
+    Popula o banco com dados sintéticos determinísticos (mesma semente,
+    mesmos dados), inserindo em lotes com bulk_create.
+
+    Args:
+        scale: Volumes a gerar
+        seed: Semente do gerador aleatório
+        batch_size: Tamanho dos lotes de inserção
+        log: Função chamada com mensagens de progresso
+    """
+
+    def __init__(
+        self,
+        scale: Scale,
+        seed: int = 42,
+        batch_size: int = 5_000,
+        log: Optional[Callable[[str], None]] = None
+    ):
+        self.scale = scale
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.prices = {}
+
+    def run(self) -> None:
+        with transaction.atomic():
+            store_ids = self._create_stores()
+            brand_ids = self._create_brands()
+            promoter_ids = self._create_users()
+            pairs = self._create_matrices(brand_ids, store_ids)
+            self._create_promoter_brands(promoter_ids, brand_ids)
+        self._create_visits(promoter_ids, pairs)
+
+    @staticmethod
+    def clear() -> None:
+        """Remove os dados gerados por execuções anteriores"""
+        with transaction.atomic():
+            VisitModel.objects.filter(
+                promoter__username__startswith="bench_").delete()
+            User.objects.filter(username__startswith="bench_").delete()
+            StoreModel.objects.filter(name__startswith="Loja Bench ").delete()
+            BrandModel.objects.filter(name__startswith="Marca Bench ").delete()
+
+    def _bulk_create(self, model, objects: Iterable) -> int:
+        total = 0
+        for chunk in _chunks(objects, self.batch_size):
+            model.objects.bulk_create(chunk, batch_size=self.batch_size)
+            total += len(chunk)
+        return total
+
+    def _create_stores(self):
+        states = [choice for choice, _label in StateChoices.choices]
+        stores = (
+            StoreModel(
+                name=f"Loja Bench {n}",
+                number=n,
+                city=self.random.choice(CITIES),
+                state=self.random.choice(states),
+                cnpj=cnpj_with_check_digits(f"{n:08d}0001"),
+            )
+            for n in range(1, self.scale.stores + 1)
+        )
+        self.log(f"Lojas: {self._bulk_create(StoreModel, stores)}")
+        return list(
+            StoreModel.objects.filter(name__startswith="Loja Bench ")
+            .order_by("id").values_list("id", flat=True)
+        )
+
+    def _create_brands(self):
+        brands = (
+            BrandModel(name=f"Marca Bench {n}")
+            for n in range(1, self.scale.brands + 1)
+        )
+        self.log(f"Marcas: {self._bulk_create(BrandModel, brands)}")
+        return list(
+            BrandModel.objects.filter(name__startswith="Marca Bench ")
+            .order_by("id").values_list("id", flat=True)
+        )
+
+    def _create_users(self):
+        password = make_password(BENCH_PASSWORD)
+
+        def user(username, role, n):
+            return User(
+                username=username,
+                email=f"{username}@bench.sispromo.local",
+                first_name="Bench",
+                last_name=f"{role}-{n}",
+                cpf=f"bench{role}{n}",
+                phone="0",
+                role=role,
+                status=1,
+                password=password,
+            )
+
+        users = [user(BENCH_MANAGER_USERNAME, 3, 0)]
+        users += [
+            user(f"bench_promoter_{n}", 1, n)
+            for n in range(self.scale.promoters)
+        ]
+        self.log(f"Usuários: {self._bulk_create(User, users)}")
+        return list(
+            User.objects.filter(username__startswith="bench_promoter_")
+            .order_by("id").values_list("id", flat=True)
+        )
+
+    def _create_matrices(self, brand_ids, store_ids):
+        """BrandStore e VisitPriceModel para as combinações marca x loja"""
+        density = self.scale.matrix_density
+        pairs = [
+            pair for pair in product(brand_ids, store_ids)
+            if density >= 1 or self.random.random() < density
+        ]
+        brand_stores = (
+            BrandStore(
+                brand_id=brand_id,
+                store_id=store_id,
+                visit_frequency=self.random.randint(1, 3),
+            )
+            for brand_id, store_id in pairs
+        )
+        self.log(f"BrandStore: {self._bulk_create(BrandStore, brand_stores)}")
+        self.prices = {
+            pair: Decimal(self.random.randint(1500, 9000)) / 100
+            for pair in pairs
+        }
+        prices = (
+            VisitPriceModel(brand_id=brand_id, store_id=store_id, price=price)
+            for (brand_id, store_id), price in self.prices.items()
+        )
+        self.log(
+            f"Preços de visita: {self._bulk_create(VisitPriceModel, prices)}")
+        return pairs
+
+    def _create_promoter_brands(self, promoter_ids, brand_ids):
+        links = (
+            PromoterBrand(promoter_id=promoter_id, brand_id=brand_id)
+            for promoter_id in promoter_ids
+            for brand_id in self.random.sample(
+                brand_ids, min(len(brand_ids), 5))
+        )
+        self.log(
+            f"Vínculos promotor-marca: "
+            f"{self._bulk_create(PromoterBrand, links)}"
+        )
+
+    def _create_visits(self, promoter_ids, pairs):
+        today = date.today()
+        statuses = [1, 2, 3, 3, 3, 4]
+        visits = (
+            VisitModel(
+                promoter_id=self.random.choice(promoter_ids),
+                brand_id=brand_id,
+                store_id=store_id,
+                visit_date=today - timedelta(
+                    days=self.random.randrange(self.scale.days)),
+                status=self.random.choice(statuses),
+                # Preço congelado, como em DjangoVisitRepository.create
+                price=self.prices[(brand_id, store_id)],
+            )
+            for brand_id, store_id in (
+                self.random.choice(pairs) for _ in range(self.scale.visits)
+            )
+        )
+        total = 0
+        for chunk in _chunks(visits, self.batch_size):
+            with transaction.atomic():
+                VisitModel.objects.bulk_create(chunk)
+            total += len(chunk)
+            if total % (self.batch_size * 20) == 0:
+                self.log(f"Visitas: {total}/{self.scale.visits}")
+        self.log(f"Visitas: {total}")
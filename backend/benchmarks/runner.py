@@ -0,0 +1,147 @@
+import json
+import math
+import os
+import resource
+import subprocess
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List
+from django.db import connection
+from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
+from core.models import User
+from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.monitoring.query_collector import QueryCollector
+from .scenarios import Scenario
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Percentil pelo método nearest-rank"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    """Pico de memória residente do processo (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS em bytes
+    divisor = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class BenchmarkRunner:
+    """
+    Executa os cenários no próprio processo (cliente de teste do Django,
+    passando por todos os middlewares) e mede latência, consultas SQL e
+    pico de memória.
+
+    Args:
+        scenarios: Cenários a executar
+        iterations: Repetições medidas por cenário
+        warmup: Repetições descartadas antes da medição
+    """
+
+    def __init__(
+        self,
+        scenarios: Iterable[Scenario],
+        iterations: int = 20,
+        warmup: int = 2
+    ):
+        self.scenarios = list(scenarios)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.client = Client(raise_request_exception=False)
+        self._tokens: Dict[str, str] = {}
+
+    def _auth_headers(self, username):
+        if username is None:
+            return {}
+        if username not in self._tokens:
+            user = User.objects.get(username=username)
+            self._tokens[username] = str(RefreshToken.for_user(user).access_token)
+        return {"HTTP_AUTHORIZATION": f"Bearer {self._tokens[username]}"}
+
+    def _request(self, scenario: Scenario):
+        headers = self._auth_headers(scenario.username)
+        method = getattr(self.client, scenario.method)
+        if scenario.method == "get":
+            return method(scenario.path, scenario.params(), **headers)
+        return method(
+            scenario.path,
+            json.dumps(scenario.params()),
+            content_type="application/json",
+            **headers
+        )
+
+    def run_scenario(self, scenario: Scenario) -> Dict:
+        for _ in range(self.warmup):
+            self._request(scenario)
+
+        latencies = []
+        queries = []
+        statuses = {}
+        for _ in range(self.iterations):
+            with QueryCollector() as collector:
+                start = time.perf_counter()
+                response = self._request(scenario)
+                latencies.append((time.perf_counter() - start) * 1000)
+            queries.append(collector.count)
+            statuses[response.status_code] = (
+                statuses.get(response.status_code, 0) + 1)
+
+        latencies.sort()
+        return {
+            "path": scenario.path,
+            "iterations": self.iterations,
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "max_ms": round(latencies[-1], 3),
+            "queries": max(queries),
+            "statuses": {str(code): n for code, n in statuses.items()},
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    def run(self, log=None) -> Dict:
+        results = {
+            "commit": current_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "database": connection.vendor,
+            "volumes": {
+                "stores": StoreModel.objects.count(),
+                "users": User.objects.count(),
+                "visits": VisitModel.objects.count(),
+            },
+            "scenarios": {},
+        }
+        for scenario in self.scenarios:
+            results["scenarios"][scenario.name] = self.run_scenario(scenario)
+            if log:
+                log(scenario.name, results["scenarios"][scenario.name])
+        return results
+
+    @staticmethod
+    def save(results: Dict, directory: str = RESULTS_DIR) -> str:
+        """Salva o resultado em <diretório>/<data>_<commit>.json"""
+        os.makedirs(directory, exist_ok=True)
+        stamp = results["timestamp"].replace(":", "").replace("-", "")
+        path = os.path.join(directory, f"{stamp}_{results['commit']}.json")
+        with open(path, "w", encoding="utf-8") as results_file:
+            json.dump(results, results_file, indent=2)
+        return path
@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, Optional
+from .data_generator import (
+    BENCH_MANAGER_USERNAME,
+    BENCH_PASSWORD,
+    BENCH_PROMOTER_USERNAME,
+)
+
+
+def _last_days(days: int) -> Dict[str, str]:
+    today = date.today()
+    return {
+        "start_date": (today - timedelta(days=days)).isoformat(),
+        "end_date": today.isoformat(),
+    }
+
+
+@dataclass
+class Scenario:
+    """
+    Uma requisição exercitada pelo benchmark.
+
+    Args:
+        name: Nome do cenário no relatório
+        method: Método HTTP
+        path: Caminho da rota
+        params: Função que gera a query string ou o corpo da requisição
+        username: Usuário autenticado (None para rotas públicas)
+    """
+
+    name: str
+    method: str
+    path: str
+    params: Callable[[], Dict[str, str]] = field(default=dict)
+    username: Optional[str] = BENCH_MANAGER_USERNAME
+
+
+SCENARIOS = [
+    Scenario(
+        "login",
+        "post",
+        "/api/token/",
+        params=lambda: {
+            "username": BENCH_MANAGER_USERNAME,
+            "password": BENCH_PASSWORD,
+        },
+        username=None,
+    ),
+    Scenario("visits_list", "get", "/api/visits/"),
+    Scenario(
+        "visits_list_promoter",
+        "get",
+        "/api/visits/",
+        username=BENCH_PROMOTER_USERNAME,
+    ),
+    Scenario(
+        "visits_reports",
+        "get",
+        "/api/visits/reports/",
+        params=lambda: _last_days(30),
+    ),
+    Scenario("visits_report", "get", "/api/visits/report/"),
+    Scenario(
+        "visits_report_year",
+        "get",
+        "/api/visits/report/",
+        params=lambda: _last_days(365),
+    ),
+    Scenario(
+        "export_excel",
+        "get",
+        "/api/visits/export_excel/",
+        params=lambda: _last_days(30),
+    ),
+    Scenario(
+        "export_pdf",
+        "get",
+        "/api/visits/export_pdf/",
+        params=lambda: _last_days(30),
+    ),
+    Scenario("dashboard", "get", "/api/dashboard/"),
+    Scenario(
+        "dashboard_promoter",
+        "get",
+        "/api/dashboard/",
+        username=BENCH_PROMOTER_USERNAME,
+    ),
+]
+
+SCENARIOS_BY_NAME = {scenario.name: scenario for scenario in SCENARIOS}
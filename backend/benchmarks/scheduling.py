@@ -0,0 +1,85 @@
+import random
+import time
+from datetime import date, timedelta
+from statistics import mean, pstdev
+from typing import Dict
+from core.infrastructure.domain.entities.planning import PlannedVisit
+from core.infrastructure.domain.use_cases.schedule_generator import (
+    generate_schedule,
+)
+
+
+def synthetic_inputs(
+    promoters: int = 300,
+    stores: int = 2_000,
+    brands: int = 100,
+    brands_per_store: int = 5,
+    brands_per_promoter: int = 5,
+    max_frequency: int = 2,
+    seed: int = 42,
+) -> Dict:
+    """
+    Entradas sintéticas do gerador de agenda (sem banco): matriz marca x
+    loja com periodicidade de 1 a max_frequency e vínculos promotor-marca
+    em que toda marca tem ao menos um promotor.
+    """
+    rng = random.Random(seed)
+    brand_ids = list(range(1, brands + 1))
+    matrix = [
+        PlannedVisit(brand_id, store_id, rng.randint(1, max_frequency))
+        for store_id in range(1, stores + 1)
+        for brand_id in rng.sample(brand_ids, brands_per_store)
+    ]
+
+    promoters_by_brand = {brand_id: [] for brand_id in brand_ids}
+    for promoter_id in range(1, promoters + 1):
+        for brand_id in rng.sample(brand_ids, brands_per_promoter):
+            promoters_by_brand[brand_id].append(promoter_id)
+    for index, brand_id in enumerate(brand_ids):
+        if not promoters_by_brand[brand_id]:
+            promoters_by_brand[brand_id].append(index % promoters + 1)
+
+    return {"matrix": matrix, "promoters_by_brand": promoters_by_brand}
+
+
+def run_schedule_benchmark(
+    iterations: int = 5,
+    workdays: int = 6,
+    max_visits_per_day: int = 10,
+    **scale
+) -> Dict:
+    """Mede o tempo do gerador de agenda e a qualidade do plano"""
+    inputs = synthetic_inputs(**scale)
+    monday = date.today() - timedelta(days=date.today().weekday())
+    days = [monday + timedelta(days=offset) for offset in range(workdays)]
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        schedule = generate_schedule(
+            days,
+            inputs["matrix"],
+            inputs["promoters_by_brand"],
+            max_visits_per_day,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+
+    loads = list(schedule.load.values()) or [0]
+    # Idas a lojas: visitas do mesmo promotor na mesma loja e dia contam 1
+    trips = {
+        (visit.promoter_id, visit.store_id, visit.visit_date)
+        for visit in schedule.visits
+    }
+    return {
+        "matrix": len(inputs["matrix"]),
+        "demand": sum(item.visit_frequency for item in inputs["matrix"]),
+        "assigned": len(schedule.visits),
+        "unassigned": len(schedule.unassigned),
+        "store_trips": len(trips),
+        "min_ms": round(min(timings), 1),
+        "mean_ms": round(mean(timings), 1),
+        "load_min": min(loads),
+        "load_max": max(loads),
+        "load_mean": round(mean(loads), 1),
+        "load_stdev": round(pstdev(loads), 1),
+    }
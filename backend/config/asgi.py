@@ -3,6 +3,12 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Para servir as views assíncronas (config.urls_async), com um servidor ASGI:
+
+    ASYNC_VIEWS=true uvicorn config.asgi:application --workers 4
+    ASYNC_VIEWS=true gunicorn config.asgi:application \
+        -k uvicorn.workers.UvicornWorker
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -51,6 +51,7 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = 'core.User'
 
 MIDDLEWARE = [
+    "core.infrastructure.monitoring.metrics_middleware.MetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -59,9 +60,15 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.infrastructure.monitoring.query_inspector_middleware.QueryInspectorMiddleware",
+    "core.infrastructure.monitoring.profiling_middleware.ProfilingMiddleware",
 ]
 
-ROOT_URLCONF = "config.urls"
+# Deploy ASGI (uvicorn config.asgi:application): as rotas de leitura mais
+# acessadas passam a usar views assíncronas (config.urls_async)
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", "false").lower() == "true"
+
+ROOT_URLCONF = "config.urls_async" if ASYNC_VIEWS else "config.urls"
 
 TEMPLATES = [
     {
@@ -80,6 +87,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 
 # Database
@@ -96,6 +104,13 @@ DATABASES = {
     }
 }
 
+# Permite apontar para outro banco (ex: Postgres local ou SQLite nos
+# benchmarks) com DATABASE_URL
+if os.getenv("DATABASE_URL"):
+    import dj_database_url
+
+    DATABASES["default"] = dj_database_url.parse(os.environ["DATABASE_URL"])
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -262,3 +277,52 @@ LOGGING = {
         },
     },
 }
+
+# Detecção de N+1: conta as consultas por requisição (apenas em DEBUG)
+QUERY_INSPECTOR = {
+    "ENABLED": DEBUG,
+    "MAX_QUERIES": 50,
+    "MAX_DUPLICATES": 10,
+    "RAISE": False,
+}
+
+# Orçamento de consultas por rota (manage.py check_query_budgets)
+QUERY_BUDGETS = {
+    "default": 15,
+}
+
+# Consultas agregadas do dashboard executadas em paralelo, cada uma na
+# própria conexão (com até 4 conexões extras por processo)
+DASHBOARD_PARALLEL_QUERIES = os.getenv(
+    "DASHBOARD_PARALLEL_QUERIES", "true").lower() == "true"
+
+# Cache do dashboard por período: o período em aberto expira rápido; os
+# encerrados só mudam por edição retroativa (que troca a geração do mês)
+DASHBOARD_CACHE = {
+    "OPEN_TIMEOUT": timedelta(minutes=1),
+    "CLOSED_TIMEOUT": timedelta(days=30),
+}
+
+# Métricas por rota, expostas em /metrics/ no formato Prometheus
+METRICS = {
+    "ENABLED": True,
+    "ALLOWED_IPS": ["127.0.0.1", "::1"],
+}
+
+# Perfis de requisições selecionadas (cabeçalho X-Profile: 1 ou amostragem),
+# apenas para gestores. Listagem e resumo: manage.py profiles
+PROFILING = {
+    "ENABLED": os.getenv("PROFILING_ENABLED", "false").lower() == "true",
+    "SAMPLE_RATE": float(os.getenv("PROFILING_SAMPLE_RATE", "0")),
+    "DIRECTORY": os.path.join(BASE_DIR, "profiles"),
+    "ENGINE": "cprofile",
+}
+
+# Arquivo frio das visitas antigas (manage.py archive_visits). Relatórios e
+# exportações leem dos arquivos o período anterior à marca d'água
+VISIT_ARCHIVE = {
+    "DIRECTORY": os.getenv(
+        "VISIT_ARCHIVE_DIR", os.path.join(BASE_DIR, "archive")),
+    # "parquet" (requer pyarrow), "csv" (CSV gzip) ou "auto"
+    "FORMAT": os.getenv("VISIT_ARCHIVE_FORMAT", "auto"),
+}
@@ -27,7 +27,13 @@ from core.infrastructure.views.brand_view import BrandViewSet
 from core.infrastructure.views.user_view import UserViewSet
 from core.infrastructure.views.promoter_brand_view import PromoterBrandViewSet
 from core.infrastructure.views.visit_price_view import VisitPriceViewSet
-from core.infrastructure.views.dashboard_view import DashboardView
+from core.infrastructure.views.dashboard_view import (
+    DashboardPlanningView,
+    DashboardView,
+)
+from core.infrastructure.views.metrics_view import MetricsView
+from core.infrastructure.views.search_view import SearchView
+from core.infrastructure.views.autocomplete_view import AutocompleteView
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularSwaggerView,
@@ -54,6 +60,11 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include(router.urls)),
     path("api/dashboard/", DashboardView.as_view(), name="dashboard"),
+    path(
+        "api/dashboard/planning/",
+        DashboardPlanningView.as_view(),
+        name="dashboard-planning"
+    ),
     path(
         "api/token/",
         TokenObtainPairView.as_view(),
@@ -66,6 +77,13 @@ urlpatterns = [
     ),
     path("api/logout/", LogoutView.as_view(), name="logout"),
     path("api/states/", StateListView.as_view(), name="state-list"),
+    path("api/search/", SearchView.as_view(), name="search"),
+    path(
+        "api/autocomplete/",
+        AutocompleteView.as_view(),
+        name="autocomplete"
+    ),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path(
         "api/schema/",
         SpectacularAPIView.as_view(
@@ -0,0 +1,59 @@
+"""
+URLs do deploy ASGI (settings.ASYNC_VIEWS).
+
+As rotas de leitura mais acessadas são atendidas por views assíncronas e
+as exportações rodam no pool de threads; todas as demais rotas são as de
+config.urls.
+"""
+
+from django.urls import path
+from core.infrastructure.views.async_views import (
+    AsyncDashboardView,
+    AsyncUserMeView,
+    AsyncVisitDetailView,
+    AsyncVisitListView,
+    async_get,
+    offload,
+)
+from core.infrastructure.views.visit_view import VisitViewSet
+from config.urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path(
+        "api/visits/",
+        async_get(
+            AsyncVisitListView.as_view(),
+            VisitViewSet.as_view({"get": "list", "post": "create"})
+        ),
+        name="visit-list"
+    ),
+    path(
+        "api/visits/export_excel/",
+        offload(VisitViewSet.as_view({"get": "export_excel"})),
+        name="visit-export-excel"
+    ),
+    path(
+        "api/visits/export_pdf/",
+        offload(VisitViewSet.as_view({"get": "export_pdf"})),
+        name="visit-export-pdf"
+    ),
+    path(
+        "api/visits/<int:id>/",
+        async_get(
+            AsyncVisitDetailView.as_view(),
+            VisitViewSet.as_view({
+                "get": "retrieve",
+                "put": "update",
+                "patch": "partial_update",
+                "delete": "destroy",
+            })
+        ),
+        name="visit-detail"
+    ),
+    path(
+        "api/dashboard/",
+        AsyncDashboardView.as_view(),
+        name="dashboard"
+    ),
+    path("api/users/me/", AsyncUserMeView.as_view(), name="user-me"),
+] + sync_urlpatterns
@@ -1,9 +1,18 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db import transaction
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.cache.dashboard_cache import DashboardCache
 from core.infrastructure.models.store_model import StoreModel
 from core.infrastructure.models.brand_model import BrandModel
 from core.infrastructure.models.visit_model import VisitModel
 from core.infrastructure.models.promoter_brand_model import PromoterBrand
+from core.infrastructure.repositories.promoter_stats_repository import (
+    PromoterStatsRepository,
+)
+from core.infrastructure.repositories.visit_repository import (
+    DjangoVisitRepository,
+)
 from .infrastructure.models.user_model import User
 
 
@@ -58,13 +67,76 @@ class StoreModelAdmin(admin.ModelAdmin):
 @admin.register(VisitModel)
 class VisitAdmin(admin.ModelAdmin):
     list_display = ('promoter', 'brand', 'visit_date', 'status')
+    list_select_related = ('promoter', 'brand')
     search_fields = ('promoter__first_name', 'brand__name')
     list_filter = ('visit_date', 'brand', 'status')
+    actions = ('mark_pending', 'mark_in_progress', 'mark_completed',
+               'mark_cancelled')
+
+    # Edições pelo admin também mantêm os contadores e os caches
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            previous = []
+            if change:
+                previous = [PromoterStatsRepository.state(
+                    VisitModel.objects.select_for_update().get(pk=obj.pk))]
+            super().save_model(request, obj, form, change)
+            PromoterStatsRepository.apply(
+                removed=previous,
+                added=[PromoterStatsRepository.state(obj)]
+            )
+        CacheConfig.delete(
+            CacheConfig.get_key(CacheConfig.VISIT_PREFIX, obj.pk))
+        DashboardCache.invalidate_dates(
+            [state.visit_date for state in previous] + [obj.visit_date])
+
+    def delete_model(self, request, obj):
+        DjangoVisitRepository().delete(obj.pk)
+
+    def delete_queryset(self, request, queryset):
+        ids = list(queryset.values_list('id', flat=True))
+        with transaction.atomic():
+            dates = PromoterStatsRepository.remove_visits(
+                VisitModel.objects.filter(id__in=ids))
+            super().delete_queryset(request, queryset)
+        CacheConfig.delete_many(
+            CacheConfig.get_key(CacheConfig.VISIT_PREFIX, visit_id)
+            for visit_id in ids
+        )
+        DashboardCache.invalidate_dates(dates)
+
+    def _transition(self, request, queryset, target):
+        # Pelo repositório, para atualizar contadores e caches
+        result = DjangoVisitRepository().transition_status(
+            queryset.values_list('id', flat=True), target)
+        self.message_user(
+            request,
+            f"{len(result['updated'])} visitas alteradas, "
+            f"{len(result['skipped'])} ignoradas."
+        )
+
+    @admin.action(description='Marcar como Pendente')
+    def mark_pending(self, request, queryset):
+        self._transition(request, queryset, 1)
+
+    @admin.action(description='Marcar como Em Andamento')
+    def mark_in_progress(self, request, queryset):
+        self._transition(request, queryset, 2)
+
+    @admin.action(description='Marcar como Concluída')
+    def mark_completed(self, request, queryset):
+        self._transition(request, queryset, 3)
+
+    @admin.action(description='Marcar como Cancelada')
+    def mark_cancelled(self, request, queryset):
+        self._transition(request, queryset, 4)
 
 
 @admin.register(PromoterBrand)
 class PromoterBrandAdmin(admin.ModelAdmin):
     list_display = ('promoter', 'brand', 'created_at', 'updated_at')
+    list_select_related = ('promoter', 'brand')
     search_fields = ('promoter__first_name',
                      'promoter__last_name', 'brand__name')
     list_filter = ('brand', 'created_at')
@@ -18,4 +18,8 @@ class CoreConfig(AppConfig):
             brand_model,
             visit_model,
             visit_price_model,
+            promoter_daily_stats_model,
         )
+
+        # Conecta os receivers de invalidação de cache
+        from .infrastructure import signals  # noqa: F401
@@ -0,0 +1,214 @@
+import threading
+import unicodedata
+import uuid
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from core.infrastructure.cache.cache_config import CacheConfig
+
+
+def normalize(text) -> str:
+    """Minúsculas, sem acentos e com espaços simples"""
+    text = unicodedata.normalize("NFKD", str(text or ""))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.lower().split())
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    id: int
+    label: str
+    detail: str
+
+
+class PrefixIndex:
+    """
+    Lista ordenada de chaves (texto normalizado, id) pesquisada com bisect.
+
+    Cada termo entra a partir de cada palavra ("loja centro 12" gera
+    "loja centro 12", "centro 12" e "12"), para que o prefixo case com
+    qualquer palavra do nome.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[str, int]] = []
+        self._entries: Dict[int, Tuple[Suggestion, Tuple[str, ...]]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _terms_keys(terms: Iterable[str]) -> Tuple[str, ...]:
+        keys = set()
+        for term in terms:
+            words = normalize(term).split()
+            keys.update(" ".join(words[i:]) for i in range(len(words)))
+        return tuple(keys)
+
+    def load(self, entries: Iterable[Tuple[Suggestion, Iterable[str]]]):
+        """Substitui o conteúdo, ordenando as chaves uma única vez"""
+        self._entries = {
+            suggestion.id: (suggestion, self._terms_keys(terms))
+            for suggestion, terms in entries
+        }
+        self._keys = sorted(
+            (key, entry_id)
+            for entry_id, (_, keys) in self._entries.items()
+            for key in keys
+        )
+
+    def remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            position = bisect_left(self._keys, (key, entry_id))
+            if position < len(self._keys) and \
+                    self._keys[position] == (key, entry_id):
+                del self._keys[position]
+
+    def upsert(self, suggestion: Suggestion, terms: Iterable[str]) -> None:
+        self.remove(suggestion.id)
+        keys = self._terms_keys(terms)
+        self._entries[suggestion.id] = (suggestion, keys)
+        for key in keys:
+            insort(self._keys, (key, suggestion.id))
+
+    def search(self, prefix: str, limit: int) -> List[Suggestion]:
+        """Entradas com alguma chave começando pelo prefixo, em ordem
+        alfabética da chave"""
+        prefix = normalize(prefix)
+        results, seen = [], set()
+        position = bisect_left(self._keys, (prefix,))
+        while position < len(self._keys) and len(results) < limit:
+            key, entry_id = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            if entry_id not in seen:
+                seen.add(entry_id)
+                results.append(self._entries[entry_id][0])
+            position += 1
+        return results
+
+
+def store_entry(store) -> Tuple[Suggestion, List[str]]:
+    number = f" - {store.number}" if store.number else ""
+    terms = [store.name]
+    if store.number:
+        terms.append(str(store.number))
+    return (
+        Suggestion(store.id, f"{store.name}{number}",
+                   f"{store.city}/{store.state}"),
+        terms,
+    )
+
+
+def brand_entry(brand) -> Tuple[Suggestion, List[str]]:
+    return Suggestion(brand.id, brand.name, ""), [brand.name]
+
+
+def promoter_entry(user) -> Tuple[Suggestion, List[str]]:
+    name = f"{user.first_name} {user.last_name}".strip()
+    return Suggestion(user.id, name, ""), [name]
+
+
+def is_indexed_promoter(user) -> bool:
+    return user.role == 1 and user.is_active
+
+
+class AutocompleteIndex:
+    """
+    Índices de prefixo em memória de lojas, marcas e promotores.
+
+    Montados do banco na primeira consulta do processo e atualizados pelos
+    sinais de gravação e remoção (signals.py). Cada alteração troca uma
+    geração (token aleatório) no cache compartilhado: os outros processos,
+    que não receberam o sinal, percebem a troca na consulta seguinte e
+    remontam o índice. Escritas em massa chamam invalidate().
+    """
+
+    GENERATION_KEY = "autocomplete:generation"
+    KINDS = ("stores", "brands", "promoters")
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._indexes: Optional[Dict[str, PrefixIndex]] = None
+        self._generation = None
+
+    @classmethod
+    def _new_generation(cls) -> str:
+        generation = uuid.uuid4().hex[:12]
+        CacheConfig.set(
+            cls.GENERATION_KEY, generation, CacheConfig.LONG_TIMEOUT)
+        return generation
+
+    @staticmethod
+    def _load() -> Dict[str, PrefixIndex]:
+        from core.infrastructure.models.brand_model import BrandModel
+        from core.infrastructure.models.store_model import StoreModel
+        from core.infrastructure.models.user_model import User
+
+        sources = {
+            "stores": (StoreModel.objects.only(
+                "id", "name", "number", "city", "state"), store_entry),
+            "brands": (BrandModel.objects.only("id", "name"), brand_entry),
+            "promoters": (
+                User.objects.filter(role=1, is_active=True).only(
+                    "id", "first_name", "last_name"),
+                promoter_entry
+            ),
+        }
+        indexes = {}
+        for kind, (queryset, build) in sources.items():
+            indexes[kind] = PrefixIndex()
+            indexes[kind].load(map(build, queryset.order_by().iterator()))
+        return indexes
+
+    def _current(self) -> Dict[str, PrefixIndex]:
+        """Índices do processo, remontados se a geração mudou"""
+        generation = CacheConfig.get(self.GENERATION_KEY)
+        with self._lock:
+            if self._indexes is None or generation != self._generation:
+                if generation is None:
+                    generation = self._new_generation()
+                self._indexes = self._load()
+                self._generation = generation
+            return self._indexes
+
+    def search(
+        self, prefix: str, kinds: Iterable[str], limit: int = 10
+    ) -> Dict[str, List[Suggestion]]:
+        indexes = self._current()
+        with self._lock:
+            return {
+                kind: indexes[kind].search(prefix, limit) for kind in kinds
+            }
+
+    def _change(self, kind: str, apply) -> None:
+        with self._lock:
+            up_to_date = (
+                self._indexes is not None
+                and CacheConfig.get(self.GENERATION_KEY) == self._generation
+            )
+            generation = self._new_generation()
+            if up_to_date:
+                apply(self._indexes[kind])
+                self._generation = generation
+            else:
+                # Índice ainda não montado ou desatualizado: remonta depois
+                self._indexes = None
+
+    def upsert(self, kind: str, entry: Tuple[Suggestion, List[str]]) -> None:
+        self._change(kind, lambda index: index.upsert(*entry))
+
+    def remove(self, kind: str, entry_id: int) -> None:
+        self._change(kind, lambda index: index.remove(entry_id))
+
+    def invalidate(self) -> None:
+        """Força a remontagem em todos os processos"""
+        with self._lock:
+            self._new_generation()
+            self._indexes = None
+
+
+autocomplete_index = AutocompleteIndex()
@@ -1,6 +1,7 @@
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
 from django.core.cache import cache
 from datetime import timedelta
+from core.infrastructure.monitoring.metrics import record_cache_lookup
 
 
 class CacheConfig:
@@ -42,7 +43,22 @@ class CacheConfig:
         Returns:
             Any: Valor armazenado ou None se não encontrado
         """
-        return cache.get(key)
+        value = cache.get(key)
+        record_cache_lookup(key.split(":", 1)[0], value is not None)
+        return value
+
+    @classmethod
+    def get_many(cls, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Busca vários valores no cache numa única operação
+
+        Args:
+            keys: Chaves do cache
+
+        Returns:
+            Dict: Valores encontrados, por chave
+        """
+        return cache.get_many(list(keys))
 
     @classmethod
     def set(cls, key: str, value: Any, timeout: Optional[timedelta] = None) -> None:
@@ -68,6 +84,16 @@ class CacheConfig:
         """
         cache.delete(key)
 
+    @classmethod
+    def delete_many(cls, keys: Iterable[str]) -> None:
+        """
+        Remove vários valores do cache numa única operação
+
+        Args:
+            keys: Chaves do cache
+        """
+        cache.delete_many(list(keys))
+
     @classmethod
     def clear_entity_cache(cls, prefix: str) -> None:
         """
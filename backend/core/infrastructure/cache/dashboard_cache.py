@@ -0,0 +1,125 @@
+import uuid
+from datetime import date, timedelta
+from typing import Iterable, List, Optional
+from django.conf import settings
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.database.partitioning import add_months, month_start
+from core.infrastructure.domain.entities.dashboard import (
+    DashboardData,
+    DashboardPeriod,
+)
+
+DEFAULTS = {
+    # Período em aberto (termina hoje ou depois): novas visitas chegam a
+    # todo momento, então o resultado vale pouco tempo
+    "OPEN_TIMEOUT": timedelta(minutes=1),
+    # Período encerrado: só muda por edição retroativa, que troca a geração
+    # do mês. O prazo apenas descarta as entradas de gerações antigas.
+    "CLOSED_TIMEOUT": timedelta(days=30),
+}
+
+
+def get_dashboard_cache_config():
+    """Configuração DASHBOARD_CACHE mesclada com os valores padrão"""
+    return {**DEFAULTS, **getattr(settings, "DASHBOARD_CACHE", {})}
+
+
+class DashboardCache:
+    """
+    Cache dos dados do dashboard por (período, escopo).
+
+    Cada mês tem uma geração (token aleatório) que entra na chave de todos
+    os períodos que o incluem. Gravar, alterar ou remover uma visita troca a
+    geração do mês da visita: apenas os períodos daquele mês deixam de ser
+    encontrados, e os períodos encerrados dos outros meses continuam em
+    cache.
+    """
+
+    PREFIX = "dashboard:"
+    GENERATION_PREFIX = "dashboard-gen:"
+
+    @staticmethod
+    def _months(start_date: date, end_date: date) -> List[date]:
+        months, month = [], month_start(start_date)
+        while month <= end_date:
+            months.append(month)
+            month = add_months(month, 1)
+        return months
+
+    @staticmethod
+    def _generation_key(month: date) -> str:
+        return CacheConfig.get_key(
+            DashboardCache.GENERATION_PREFIX, f"{month:%Y-%m}")
+
+    @staticmethod
+    def _new_generation(key: str) -> str:
+        generation = uuid.uuid4().hex[:12]
+        CacheConfig.set(
+            key, generation, get_dashboard_cache_config()["CLOSED_TIMEOUT"])
+        return generation
+
+    @staticmethod
+    def key(period: DashboardPeriod, scope: str) -> str:
+        """
+        Chave com as gerações atuais dos meses do período. Deve ser lida
+        antes da consulta e usada no get e no set: se uma escrita trocar a
+        geração durante a consulta, o resultado fica sob a geração antiga
+        e não é servido.
+        """
+        keys = [
+            DashboardCache._generation_key(month)
+            for month in DashboardCache._months(
+                period.start_date, period.end_date)
+        ]
+        generations = CacheConfig.get_many(keys)
+        # Uma geração ausente (nunca criada ou expirada) recebe um token
+        # novo, o que descarta qualquer entrada anterior do mês
+        tokens = [
+            generations.get(key) or DashboardCache._new_generation(key)
+            for key in keys
+        ]
+        return CacheConfig.get_key(
+            DashboardCache.PREFIX,
+            f"{scope}:{period.start_date}:{period.end_date}:"
+            f"{'.'.join(tokens)}"
+        )
+
+    @staticmethod
+    def scope(promoter_id: Optional[int] = None) -> str:
+        """Escopo do papel: o promotor vê só as próprias visitas"""
+        return f"promoter-{promoter_id}" if promoter_id else "all"
+
+    @staticmethod
+    def get(key: str) -> Optional[DashboardData]:
+        return CacheConfig.get(key)
+
+    @staticmethod
+    def set(
+        key: str,
+        period: DashboardPeriod,
+        data: DashboardData,
+        today: date
+    ) -> None:
+        config = get_dashboard_cache_config()
+        timeout = (
+            config["CLOSED_TIMEOUT"] if period.is_closed(today)
+            else config["OPEN_TIMEOUT"]
+        )
+        CacheConfig.set(key, data, timeout)
+
+    @staticmethod
+    def invalidate_dates(dates: Iterable) -> None:
+        """
+        Troca a geração dos meses das datas informadas (date ou
+        "YYYY-MM-DD"). Chamado a cada escrita de visitas.
+        """
+        months = {
+            month_start(
+                value if isinstance(value, date)
+                else date.fromisoformat(str(value))
+            )
+            for value in dates if value
+        }
+        for month in months:
+            DashboardCache._new_generation(
+                DashboardCache._generation_key(month))
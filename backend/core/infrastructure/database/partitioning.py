@@ -0,0 +1,427 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional
+from django.db import connection as default_connection, transaction
+from django.db.migrations.operations.base import Operation
+from django.utils.dateparse import parse_date
+from core.infrastructure.models.visit_model import VisitModel
+
+
+class PartitioningError(Exception):
+    """Operação de particionamento inválida para o banco atual"""
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def visit_date_filters(start=None, end=None) -> dict:
+    """
+    Filtros de intervalo sobre visit_date com os limites convertidos para
+    date.
+
+    Comparações diretas da chave de partição com datas permitem ao
+    PostgreSQL descartar as partições fora do intervalo (partition
+    pruning); funções sobre a coluna (ex: visit_date__month) impedem.
+
+    Args:
+        start: Data inicial inclusiva (date, datetime ou "YYYY-MM-DD")
+        end: Data final inclusiva (date, datetime ou "YYYY-MM-DD")
+    """
+    filters = {}
+    for lookup, value in (("visit_date__gte", start), ("visit_date__lte", end)):
+        if not value:
+            continue
+        if isinstance(value, datetime):
+            value = value.date()
+        elif isinstance(value, str):
+            value = parse_date(value)
+            if value is None:
+                raise ValueError("Data inválida. Use o formato YYYY-MM-DD.")
+        filters[lookup] = value
+    return filters
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    month: Optional[date]  # None para a partição DEFAULT
+    rows: int = 0
+
+
+class VisitPartitionManager:
+    """
+    Particionamento mensal (RANGE por visit_date) da tabela de visitas no
+    PostgreSQL.
+
+    O modelo do Django continua o mesmo: as consultas vão para a tabela
+    pai e o PostgreSQL descarta as partições fora do intervalo de datas
+    filtrado (partition pruning). Por exigência do PostgreSQL a chave
+    primária passa a ser (id, visit_date); o id continua único pela
+    sequência.
+
+    Usado pelo comando visit_partitions e pela operação de migração
+    PartitionVisitsTable.
+    """
+
+    TABLE = VisitModel._meta.db_table
+    LEGACY_TABLE = f"{TABLE}_legacy"
+    DEFAULT_PARTITION = f"{TABLE}_default"
+
+    def __init__(self, connection=None):
+        self.connection = connection or default_connection
+        if self.connection.vendor != "postgresql":
+            raise PartitioningError(
+                "O particionamento de visitas requer PostgreSQL.")
+
+    # Nomes e consultas auxiliares
+
+    @classmethod
+    def partition_name(cls, month: date) -> str:
+        return f"{cls.TABLE}_p{month:%Y_%m}"
+
+    def _execute(self, sql, params=None):
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def _fetchall(self, sql, params=None):
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def _quote(self, name: str) -> str:
+        return self.connection.ops.quote_name(name)
+
+    def is_partitioned(self) -> bool:
+        rows = self._fetchall(
+            "SELECT relkind FROM pg_class WHERE relname = %s "
+            "AND relnamespace = to_regnamespace(current_schema())::oid",
+            [self.TABLE]
+        )
+        return bool(rows) and rows[0][0] == "p"
+
+    def partitions(self, with_counts: bool = False) -> List[Partition]:
+        """Partições anexadas, da mais antiga para a mais recente"""
+        names = [
+            row[0] for row in self._fetchall(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+                ORDER BY child.relname
+                """,
+                [self.TABLE]
+            )
+        ]
+        partitions = []
+        for name in names:
+            month = None
+            if name != self.DEFAULT_PARTITION:
+                year, month_number = name.rsplit("_p", 1)[1].split("_")
+                month = date(int(year), int(month_number), 1)
+            rows = 0
+            if with_counts:
+                rows = self._fetchall(
+                    f"SELECT COUNT(*) FROM {self._quote(name)}")[0][0]
+            partitions.append(Partition(name, month, rows))
+        return partitions
+
+    # Operações
+
+    def create_partition(self, month: date) -> bool:
+        """
+        Cria a partição do mês, movendo para ela as linhas desse mês que
+        estejam na partição DEFAULT.
+
+        Returns:
+            bool: False se a partição já existia
+        """
+        name = self.partition_name(month)
+        if any(partition.name == name for partition in self.partitions()):
+            return False
+
+        table = self._quote(self.TABLE)
+        partition = self._quote(name)
+        default = self._quote(self.DEFAULT_PARTITION)
+        bounds = [month, add_months(month, 1)]
+
+        with transaction.atomic(using=self.connection.alias):
+            self._execute(
+                f"CREATE TABLE {partition} (LIKE {table} "
+                f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            # A partição DEFAULT não pode conter linhas do novo intervalo
+            self._execute(
+                f"WITH moved AS (DELETE FROM {default} "
+                f"WHERE visit_date >= %s AND visit_date < %s RETURNING *) "
+                f"INSERT INTO {partition} SELECT * FROM moved",
+                bounds
+            )
+            self._execute(
+                f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+                f"FOR VALUES FROM (%s) TO (%s)",
+                bounds
+            )
+        return True
+
+    def create_future_partitions(self, months_ahead: int, today=None) -> List[str]:
+        """Garante as partições do mês atual e dos próximos meses"""
+        current = month_start(today or date.today())
+        created = []
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if self.create_partition(month):
+                created.append(self.partition_name(month))
+        return created
+
+    def detach_partition(self, partition: Partition, drop: bool = False) -> None:
+        """
+        Desanexa a partição. Sem drop, ela continua no banco como tabela
+        comum (fora das consultas da aplicação).
+        """
+        name = self._quote(partition.name)
+        with transaction.atomic(using=self.connection.alias):
+            self._execute(
+                f"ALTER TABLE {self._quote(self.TABLE)} "
+                f"DETACH PARTITION {name}"
+            )
+            if drop:
+                self._execute(f"DROP TABLE {name}")
+
+    def partitions_before(self, cutoff: date) -> List[Partition]:
+        """Partições mensais inteiramente anteriores ao mês de corte"""
+        cutoff = month_start(cutoff)
+        return [
+            partition for partition in self.partitions(with_counts=True)
+            if partition.month is not None and partition.month < cutoff
+        ]
+
+    # Conversão e reversão
+
+    def _table_definition(self):
+        """Sequência do id, chave primária, índices e restrições da tabela"""
+        identity, sequence = self._fetchall(
+            "SELECT is_identity = 'YES', pg_get_serial_sequence(%s, 'id') "
+            "FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "AND table_name = %s AND column_name = 'id'",
+            [self.TABLE, self.TABLE]
+        )[0]
+        primary_key = [
+            row[0] for row in self._fetchall(
+                "SELECT conname FROM pg_constraint "
+                "WHERE conrelid = %s::regclass AND contype = 'p'",
+                [self.TABLE]
+            )
+        ]
+        indexes = [
+            (name, definition) for name, definition in self._fetchall(
+                "SELECT indexname, indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = %s",
+                [self.TABLE]
+            )
+            if name not in primary_key
+        ]
+        constraints = self._fetchall(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('f', 'c')",
+            [self.TABLE]
+        )
+        return identity, sequence, primary_key, indexes, constraints
+
+    def _rebuild(self, partition_clause: str, primary_key_columns: str,
+                 create_partitions, keep_legacy: bool) -> int:
+        """
+        Recria a tabela de visitas a partir da atual, renomeada para
+        *_legacy: copia as linhas e recria índices, restrições e a
+        sequência do id.
+
+        Args:
+            partition_clause: Cláusula PARTITION BY da nova tabela ("" para
+                tabela comum)
+            primary_key_columns: Colunas da nova chave primária
+            create_partitions: Função que cria as partições antes da cópia
+            keep_legacy: Mantém a tabela antiga em vez de removê-la
+
+        Returns:
+            int: Quantidade de visitas copiadas
+        """
+        table = self._quote(self.TABLE)
+        legacy = self._quote(self.LEGACY_TABLE)
+
+        self._execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        identity, sequence, primary_key, indexes, constraints = (
+            self._table_definition())
+
+        # Libera os nomes da tabela, da chave primária e dos índices
+        self._execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        for constraint in primary_key:
+            self._execute(
+                f"ALTER TABLE {legacy} RENAME CONSTRAINT "
+                f"{self._quote(constraint)} "
+                f"TO {self._quote(constraint + '_legacy')}"
+            )
+        for index_name, _definition in indexes:
+            self._execute(
+                f"ALTER INDEX {self._quote(index_name)} "
+                f"RENAME TO {self._quote(index_name + '_legacy')}"
+            )
+
+        self._execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) "
+            f"{partition_clause}"
+        )
+        self._execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT "
+            f"{self._quote(self.TABLE + '_pkey')} "
+            f"PRIMARY KEY ({primary_key_columns})"
+        )
+        if identity:
+            # Antes do PostgreSQL 17 as partições não herdam colunas
+            # identity: o id passa a usar uma sequência comum (como serial),
+            # com o mesmo nome. A sequência identity antiga sai com a
+            # tabela legada
+            self._execute(
+                f"ALTER SEQUENCE {sequence} RENAME TO "
+                f"{self._quote(self.TABLE + '_id_seq_legacy')}"
+            )
+            self._execute(f"CREATE SEQUENCE {sequence} AS bigint")
+            self._execute(
+                f"ALTER TABLE {table} ALTER COLUMN id "
+                f"SET DEFAULT nextval('{sequence}'::regclass)"
+            )
+        create_partitions()
+
+        self._execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+        copied = self._fetchall(f"SELECT COUNT(*) FROM {table}")[0][0]
+
+        # O indexdef referencia a tabela pelo nome, que agora é o da nova
+        # tabela; em tabela particionada o índice é propagado às partições
+        for _index_name, definition in indexes:
+            self._execute(definition)
+        for constraint, definition in constraints:
+            self._execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT "
+                f"{self._quote(constraint)} {definition}"
+            )
+
+        if sequence:
+            self._execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+            self._execute(
+                f"SELECT setval(%s, COALESCE(MAX(id), 0) + 1, false) "
+                f"FROM {table}",
+                [sequence]
+            )
+
+        if not keep_legacy:
+            # Numa tabela particionada remove também as partições anexadas
+            self._execute(f"DROP TABLE {legacy}")
+        return copied
+
+    def convert(self, months_ahead: int = 3, keep_legacy: bool = False) -> int:
+        """
+        Converte a tabela comum em tabela particionada por mês, com uma
+        partição DEFAULT e as partições mensais do período dos dados até
+        months_ahead meses à frente.
+
+        Returns:
+            int: Quantidade de visitas copiadas
+        """
+        if self.is_partitioned():
+            raise PartitioningError("A tabela de visitas já é particionada.")
+
+        def create_partitions():
+            table = self._quote(self.TABLE)
+            self._execute(
+                f"CREATE TABLE {self._quote(self.DEFAULT_PARTITION)} "
+                f"PARTITION OF {table} DEFAULT"
+            )
+            first, last = self._fetchall(
+                f"SELECT MIN(visit_date), MAX(visit_date) "
+                f"FROM {self._quote(self.LEGACY_TABLE)}"
+            )[0]
+            today = date.today()
+            month = month_start(first or today)
+            last = add_months(month_start(max(last or today, today)),
+                              months_ahead)
+            while month <= last:
+                self._execute(
+                    f"CREATE TABLE {self._quote(self.partition_name(month))} "
+                    f"PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)",
+                    [month, add_months(month, 1)]
+                )
+                month = add_months(month, 1)
+
+        with transaction.atomic(using=self.connection.alias):
+            # O PostgreSQL exige a chave de partição na chave primária; o id
+            # continua único pela sequência
+            return self._rebuild(
+                "PARTITION BY RANGE (visit_date)", "id, visit_date",
+                create_partitions, keep_legacy
+            )
+
+    def revert(self, keep_legacy: bool = False) -> int:
+        """
+        Volta a tabela particionada para uma tabela comum com chave
+        primária (id). Partições já desanexadas não são incluídas.
+
+        Returns:
+            int: Quantidade de visitas copiadas
+        """
+        if not self.is_partitioned():
+            raise PartitioningError("A tabela de visitas não é particionada.")
+
+        with transaction.atomic(using=self.connection.alias):
+            return self._rebuild("", "id", lambda: None, keep_legacy)
+
+
+class PartitionVisitsTable(Operation):
+    """
+    Operação de migração que particiona a tabela de visitas por mês.
+
+    Não altera o estado dos modelos e é ignorada em bancos que não sejam
+    PostgreSQL (ex: SQLite local). Uso, numa migração do app core:
+
+        from core.infrastructure.database.partitioning import (
+            PartitionVisitsTable,
+        )
+
+        operations = [PartitionVisitsTable(months_ahead=3)]
+    """
+
+    reversible = True
+    reduces_to_sql = False
+
+    def __init__(self, months_ahead: int = 3):
+        self.months_ahead = months_ahead
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            VisitPartitionManager(schema_editor.connection).convert(
+                months_ahead=self.months_ahead)
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            VisitPartitionManager(schema_editor.connection).revert()
+
+    def describe(self):
+        return "Particiona a tabela de visitas por mês (visit_date)"
+
+    def deconstruct(self):
+        return (
+            self.__class__.__name__,
+            [],
+            {"months_ahead": self.months_ahead},
+        )
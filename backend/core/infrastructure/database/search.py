@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import List, Tuple, Type
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import connection as default_connection, models
+from core.infrastructure.models.brand_model import BrandModel
+from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.models.user_model import User
+
+# Configuração do full-text: sem stemming, pois os textos são nomes
+SEARCH_CONFIG = "simple"
+
+
+class SearchIndexError(Exception):
+    """Operação de índice de busca inválida para o banco atual"""
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """Tabela pesquisável e as colunas usadas na busca"""
+    model: Type[models.Model]
+    # Colunas comparadas por similaridade de trigramas
+    fields: Tuple[str, ...]
+    # Colunas do documento do full-text (tsvector)
+    document_fields: Tuple[str, ...]
+    prefix: str
+
+    def document(self) -> SearchVector:
+        """
+        Documento do full-text. O índice GIN é criado a partir da mesma
+        expressão, para que o PostgreSQL o use nas consultas.
+        """
+        return SearchVector(*self.document_fields, config=SEARCH_CONFIG)
+
+    def indexes(self) -> List[GinIndex]:
+        indexes = [
+            GinIndex(
+                fields=[field],
+                opclasses=["gin_trgm_ops"],
+                name=f"{self.prefix}_{field}_trgm"
+            )
+            for field in self.fields
+        ]
+        indexes.append(
+            GinIndex(self.document(), name=f"{self.prefix}_search_doc"))
+        return indexes
+
+
+SEARCH_TARGETS = {
+    "stores": SearchTarget(
+        StoreModel, ("name", "city", "cnpj"), ("name", "city"), "core_store"),
+    "brands": SearchTarget(BrandModel, ("name",), ("name",), "core_brand"),
+    "users": SearchTarget(
+        User,
+        ("first_name", "last_name", "cpf"),
+        ("first_name", "last_name"),
+        "core_user"
+    ),
+}
+
+
+class SearchIndexManager:
+    """
+    Índices GIN da busca no PostgreSQL: trigramas (pg_trgm) em cada coluna
+    pesquisada e um tsvector por tabela.
+
+    Ficam fora dos modelos porque dependem do PostgreSQL; usados pelo
+    comando search_indexes.
+    """
+
+    def __init__(self, connection=None):
+        self.connection = connection or default_connection
+        if self.connection.vendor != "postgresql":
+            raise SearchIndexError("Os índices de busca requerem PostgreSQL.")
+
+    def _existing(self, model) -> set:
+        with self.connection.cursor() as cursor:
+            return set(self.connection.introspection.get_constraints(
+                cursor, model._meta.db_table))
+
+    def status(self) -> List[Tuple[str, bool]]:
+        """Índices esperados e se já existem"""
+        rows = []
+        for target in SEARCH_TARGETS.values():
+            existing = self._existing(target.model)
+            rows.extend(
+                (index.name, index.name in existing)
+                for index in target.indexes()
+            )
+        return rows
+
+    def create(self) -> List[str]:
+        """Cria a extensão pg_trgm e os índices que faltam"""
+        created = []
+        with self.connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        with self.connection.schema_editor() as editor:
+            for target in SEARCH_TARGETS.values():
+                existing = self._existing(target.model)
+                for index in target.indexes():
+                    if index.name not in existing:
+                        editor.add_index(target.model, index)
+                        created.append(index.name)
+        return created
+
+    def drop(self) -> List[str]:
+        """Remove os índices de busca existentes"""
+        dropped = []
+        with self.connection.schema_editor() as editor:
+            for target in SEARCH_TARGETS.values():
+                existing = self._existing(target.model)
+                for index in target.indexes():
+                    if index.name in existing:
+                        editor.remove_index(target.model, index)
+                        dropped.append(index.name)
+        return dropped
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from typing import List
-from datetime import date
+from typing import List, Optional
+from datetime import date, timedelta
 
 @dataclass
 class BrandProgress:
@@ -34,4 +34,61 @@ class DashboardData:
     total_pending: int
     brands_progress: List[BrandProgress]
     promoters_progress: List[PromoterProgress]
-    stores_progress: List[StoreProgress]
\ No newline at end of file
+    stores_progress: List[StoreProgress]
+
+@dataclass(frozen=True)
+class DashboardPeriod:
+    """
+    Intervalo de datas exibido no dashboard (limites inclusivos).
+
+    Períodos: current_week (padrão), last_week, month_to_date e custom
+    (com start_date e end_date).
+    """
+    name: str
+    start_date: date
+    end_date: date
+
+    PERIODS = ("current_week", "last_week", "month_to_date", "custom")
+    MAX_CUSTOM_DAYS = 366
+
+    @classmethod
+    def resolve(
+        cls,
+        name: str,
+        today: date,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> "DashboardPeriod":
+        """
+        Calcula as datas do período em relação a hoje.
+
+        Raises:
+            ValueError: Período desconhecido ou intervalo custom inválido
+        """
+        start_of_week = today - timedelta(days=today.weekday())
+        if name == "current_week":
+            return cls(name, start_of_week, start_of_week + timedelta(days=6))
+        if name == "last_week":
+            start = start_of_week - timedelta(days=7)
+            return cls(name, start, start + timedelta(days=6))
+        if name == "month_to_date":
+            return cls(name, today.replace(day=1), today)
+        if name == "custom":
+            if start_date is None or end_date is None:
+                raise ValueError(
+                    "O período custom exige start_date e end_date "
+                    "(YYYY-MM-DD).")
+            if start_date > end_date:
+                raise ValueError("start_date deve ser anterior a end_date.")
+            if (end_date - start_date).days >= cls.MAX_CUSTOM_DAYS:
+                raise ValueError(
+                    f"O período custom pode ter no máximo "
+                    f"{cls.MAX_CUSTOM_DAYS} dias.")
+            return cls(name, start_date, end_date)
+        raise ValueError(
+            f"Período inválido. Use um de: {', '.join(cls.PERIODS)}.")
+
+    def is_closed(self, today: date) -> bool:
+        """Períodos encerrados antes de hoje não recebem novas visitas do
+        dia a dia; só mudam por edições retroativas"""
+        return self.end_date < today
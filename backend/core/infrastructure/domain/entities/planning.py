@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class PlannedVisit:
+    """Uma combinação marca x loja do planejamento (BrandStore)"""
+    brand_id: int
+    store_id: int
+    visit_frequency: int  # visitas por semana
+
+
+@dataclass
+class PlanningProgress:
+    """Visitas esperadas x concluídas de uma marca ou loja no período"""
+    id: int
+    name: str
+    expected_visits: float
+    visits_done: int
+    completion: Optional[float]  # % concluído (None sem visitas esperadas)
+    number: Optional[str] = None  # número da loja
+
+
+@dataclass
+class PlanningData:
+    start_date: date
+    end_date: date
+    total_expected: float
+    total_done: int
+    completion: Optional[float]
+    brands_progress: List[PlanningProgress]
+    stores_progress: List[PlanningProgress]
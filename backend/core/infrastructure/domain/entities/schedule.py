@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class ScheduledVisit:
+    """Visita planejada numa loja/marca e dia (promoter_id None: sem
+    promotor disponível)"""
+    promoter_id: Optional[int]
+    store_id: int
+    brand_id: int
+    visit_date: date
+
+
+@dataclass
+class Schedule:
+    """
+    Plano de visitas da semana.
+
+    Args:
+        visits: Visitas atribuídas a um promotor
+        unassigned: Visitas sem promotor vinculado à marca com agenda livre
+        load: Visitas da semana por promotor (incluindo as já existentes)
+    """
+    visits: List[ScheduledVisit] = field(default_factory=list)
+    unassigned: List[ScheduledVisit] = field(default_factory=list)
+    load: Dict[int, int] = field(default_factory=dict)
@@ -1,3 +1,7 @@
+from decimal import Decimal
+from typing import Optional
+
+
 class Visit:
     def __init__(
         self,
@@ -5,10 +9,34 @@ class Visit:
         promoter_id: int,
         store_id: int,
         brand_id: int,
-        visit_date: str
+        visit_date: str,
+        status: int = 1,
+        price: Optional[Decimal] = None
     ):
         self.id = id
         self.promoter_id = promoter_id
         self.store_id = store_id
         self.brand_id = brand_id
         self.visit_date = visit_date
+        self.status = status
+        self.price = price
+
+
+# Status da visita (VisitModel.STATUS_CHOICES)
+PENDING, IN_PROGRESS, COMPLETED, CANCELLED = 1, 2, 3, 4
+
+# Status de destino permitidos a partir de cada status
+ALLOWED_TRANSITIONS = {
+    PENDING: {IN_PROGRESS, COMPLETED, CANCELLED},
+    IN_PROGRESS: {PENDING, COMPLETED, CANCELLED},
+    COMPLETED: {IN_PROGRESS},  # reabertura
+    CANCELLED: {PENDING},  # reativação
+}
+
+
+def allowed_sources(target: int) -> set:
+    """Status a partir dos quais uma visita pode ir para o destino"""
+    return {
+        source for source, targets in ALLOWED_TRANSITIONS.items()
+        if target in targets
+    }
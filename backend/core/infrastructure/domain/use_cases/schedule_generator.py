@@ -0,0 +1,166 @@
+import heapq
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from core.infrastructure.domain.entities.planning import PlannedVisit
+from core.infrastructure.domain.entities.schedule import (
+    Schedule,
+    ScheduledVisit,
+)
+
+
+def visit_days(store_id: int, frequency: int, days: Sequence[date]) -> List[date]:
+    """
+    Dias das visitas semanais de uma marca na loja, espaçados ao longo da
+    semana.
+
+    O deslocamento depende só da loja: marcas da mesma loja com a mesma
+    periodicidade caem nos mesmos dias (uma ida do promotor atende várias
+    marcas), e lojas diferentes se espalham pelos dias da semana.
+    """
+    count = len(days)
+    offset = store_id % count
+    return [
+        days[(offset + visit * count // frequency) % count]
+        for visit in range(frequency)
+    ]
+
+
+class _PromoterPool:
+    """
+    Promotores vinculados a cada marca em heaps por carga semanal.
+
+    As entradas são atualizadas sob demanda: a carga só cresce, então uma
+    entrada desatualizada sempre sai do heap antes da hora e é reinserida
+    com a carga atual.
+    """
+
+    def __init__(self, promoters_by_brand: Dict[int, Iterable[int]],
+                 load: Dict[int, int], daily: Dict[Tuple[int, date], int],
+                 max_visits_per_day: int):
+        self.load = load
+        self.daily = daily
+        self.max_visits_per_day = max_visits_per_day
+        self.eligible = {
+            brand_id: set(promoters)
+            for brand_id, promoters in promoters_by_brand.items()
+        }
+        self.heaps = {}
+        for brand_id, promoters in self.eligible.items():
+            heap = [(load[promoter_id], promoter_id) for promoter_id in promoters]
+            heapq.heapify(heap)
+            self.heaps[brand_id] = heap
+
+    def available(self, promoter_id: int, day: date) -> bool:
+        return self.daily[(promoter_id, day)] < self.max_visits_per_day
+
+    def pick(self, brand_id: int, day: date,
+             preferred: Iterable[int]) -> Optional[int]:
+        """
+        Promotor para a visita: de preferência um que já vai à loja no
+        dia; senão o de menor carga na semana com agenda livre no dia.
+        """
+        eligible = self.eligible.get(brand_id, ())
+        candidates = [
+            promoter_id for promoter_id in preferred
+            if promoter_id in eligible and self.available(promoter_id, day)
+        ]
+        if candidates:
+            return min(
+                candidates,
+                key=lambda promoter_id: (self.load[promoter_id], promoter_id))
+
+        heap = self.heaps.get(brand_id)
+        if not heap:
+            return None
+        full, chosen = [], None
+        while heap:
+            entry_load, promoter_id = heapq.heappop(heap)
+            if entry_load != self.load[promoter_id]:
+                heapq.heappush(heap, (self.load[promoter_id], promoter_id))
+            elif not self.available(promoter_id, day):
+                full.append((entry_load, promoter_id))
+            else:
+                chosen = promoter_id
+                heapq.heappush(heap, (entry_load + 1, promoter_id))
+                break
+        for entry in full:
+            heapq.heappush(heap, entry)
+        return chosen
+
+    def assign(self, promoter_id: int, day: date) -> None:
+        self.load[promoter_id] += 1
+        self.daily[(promoter_id, day)] += 1
+
+
+def generate_schedule(
+    days: Sequence[date],
+    matrix: Iterable[PlannedVisit],
+    promoters_by_brand: Dict[int, Iterable[int]],
+    max_visits_per_day: int,
+    scheduled: Optional[Dict[Tuple[int, int], int]] = None,
+    existing_load: Optional[Dict[Tuple[int, date], int]] = None,
+) -> Schedule:
+    """
+    Gera o plano de visitas da semana (heurística gulosa).
+
+    Cada combinação marca x loja recebe visit_frequency visitas, menos as
+    já agendadas na semana, em dias espaçados (visit_days). As visitas de
+    cada loja/dia são atribuídas primeiro às marcas com menos promotores
+    vinculados, ao promotor que já vai à loja no dia ou, senão, ao
+    promotor vinculado à marca com menor carga semanal e menos de
+    max_visits_per_day visitas no dia. O custo é O(V log P) para V
+    visitas e P promotores por marca.
+
+    Args:
+        days: Dias úteis da semana
+        matrix: Combinações marca x loja com a periodicidade semanal
+        promoters_by_brand: Promotores vinculados a cada marca
+        max_visits_per_day: Limite de visitas de um promotor por dia
+        scheduled: Visitas já agendadas na semana por (brand_id, store_id)
+        existing_load: Visitas já agendadas por (promoter_id, dia)
+    """
+    scheduled = scheduled or {}
+    load = defaultdict(int)
+    daily = defaultdict(int)
+    for (promoter_id, day), count in (existing_load or {}).items():
+        load[promoter_id] += count
+        daily[(promoter_id, day)] += count
+
+    # Marcas a visitar em cada (dia, loja)
+    demand = defaultdict(list)
+    for item in matrix:
+        remaining = item.visit_frequency - scheduled.get(
+            (item.brand_id, item.store_id), 0)
+        if remaining <= 0:
+            continue
+        for day in visit_days(item.store_id, remaining, days):
+            demand[(day, item.store_id)].append(item.brand_id)
+
+    pool = _PromoterPool(promoters_by_brand, load, daily, max_visits_per_day)
+
+    def eligible_count(brand_id):
+        return len(pool.eligible.get(brand_id, ()))
+
+    schedule = Schedule()
+    groups = sorted(
+        demand.items(),
+        key=lambda group: (
+            group[0][0], min(map(eligible_count, group[1])), group[0][1])
+    )
+    for (day, store_id), brand_ids in groups:
+        # Promotores que já vão a esta loja neste dia
+        at_store = []
+        for brand_id in sorted(brand_ids, key=eligible_count):
+            promoter_id = pool.pick(brand_id, day, at_store)
+            visit = ScheduledVisit(promoter_id, store_id, brand_id, day)
+            if promoter_id is None:
+                schedule.unassigned.append(visit)
+                continue
+            pool.assign(promoter_id, day)
+            if promoter_id not in at_store:
+                at_store.append(promoter_id)
+            schedule.visits.append(visit)
+
+    schedule.load = dict(load)
+    return schedule
@@ -0,0 +1,95 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+from core.infrastructure.domain.entities.dashboard import DashboardPeriod
+from core.infrastructure.domain.entities.planning import (
+    PlannedVisit,
+    PlanningData,
+    PlanningProgress,
+)
+
+DAYS_PER_WEEK = 7
+
+
+def expected_visits(visit_frequency: int, days: int) -> float:
+    """
+    Visitas esperadas em N dias para uma periodicidade semanal,
+    proporcional aos dias (uma semana completa = visit_frequency).
+    """
+    return visit_frequency * days / DAYS_PER_WEEK
+
+
+def completion(done: int, expected: float) -> Optional[float]:
+    """Percentual concluído (None quando nada era esperado)"""
+    if not expected:
+        return None
+    return round(done / expected * 100, 1)
+
+
+def build_planning(
+    period: DashboardPeriod,
+    matrix: Iterable[PlannedVisit],
+    done: Dict[Tuple[int, int], int],
+    brand_names: Dict[int, str],
+    stores: Dict[int, Tuple[str, Optional[str]]],
+) -> PlanningData:
+    """
+    Calcula as visitas esperadas x concluídas do período por marca e por
+    loja.
+
+    Apenas as combinações da matriz contam: visitas concluídas de uma
+    marca numa loja que não faz parte dela não entram no progresso.
+
+    Args:
+        period: Período do planejamento
+        matrix: Combinações marca x loja com a periodicidade semanal
+        done: Visitas concluídas no período por (brand_id, store_id)
+        brand_names: Nome de cada marca
+        stores: Nome e número de cada loja
+    """
+    days = (period.end_date - period.start_date).days + 1
+    expected_by_brand = defaultdict(float)
+    expected_by_store = defaultdict(float)
+    done_by_brand = defaultdict(int)
+    done_by_store = defaultdict(int)
+
+    for item in matrix:
+        expected = expected_visits(item.visit_frequency, days)
+        count = done.get((item.brand_id, item.store_id), 0)
+        expected_by_brand[item.brand_id] += expected
+        expected_by_store[item.store_id] += expected
+        done_by_brand[item.brand_id] += count
+        done_by_store[item.store_id] += count
+
+    def progress(item_id, name, expected, count, number=None):
+        return PlanningProgress(
+            id=item_id,
+            name=name,
+            expected_visits=round(expected, 2),
+            visits_done=count,
+            completion=completion(count, expected),
+            number=number,
+        )
+
+    brands_progress = [
+        progress(brand_id, brand_names.get(brand_id, ""),
+                 expected_by_brand[brand_id], done_by_brand[brand_id])
+        for brand_id in sorted(expected_by_brand)
+    ]
+    stores_progress = []
+    for store_id in sorted(expected_by_store):
+        name, number = stores.get(store_id, ("", None))
+        stores_progress.append(progress(
+            store_id, name, expected_by_store[store_id],
+            done_by_store[store_id], number=number))
+
+    total_expected = sum(expected_by_brand.values())
+    total_done = sum(done_by_brand.values())
+    return PlanningData(
+        start_date=period.start_date,
+        end_date=period.end_date,
+        total_expected=round(total_expected, 2),
+        total_done=total_done,
+        completion=completion(total_done, total_expected),
+        brands_progress=brands_progress,
+        stores_progress=stores_progress,
+    )
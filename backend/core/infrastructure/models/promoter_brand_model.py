@@ -26,4 +26,4 @@ class PromoterBrand(BaseModel):
         ordering = ['created_at']
 
     def __str__(self):
-        return f"{self.promoter.get_full_name()} - {self.brand.brand_name}"
+        return f"{self.promoter.get_full_name()} - {self.brand.name}"
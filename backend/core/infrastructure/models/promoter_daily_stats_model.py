@@ -0,0 +1,37 @@
+from django.db import models
+from ..models.user_model import User
+
+
+class PromoterDailyStats(models.Model):
+    """
+    Contadores das visitas de um promotor num dia, por status, e a soma dos
+    preços (como nos totais do relatório: preço nulo conta 0).
+
+    Mantidos a cada escrita de visitas (PromoterStatsRepository) e
+    conferidos com reconcile_promoter_stats.
+    """
+
+    promoter = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='daily_stats'
+    )
+    date = models.DateField()
+    pending = models.IntegerField(default=0)
+    in_progress = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    cancelled = models.IntegerField(default=0)
+    total_value = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0
+    )
+
+    class Meta:
+        db_table = 'core_promoter_daily_stats'
+        unique_together = ('promoter', 'date')
+        verbose_name = 'estatística diária do promotor'
+        verbose_name_plural = 'estatísticas diárias dos promotores'
+
+    def __str__(self):
+        return f'Estatísticas {self.promoter_id} - {self.date}'
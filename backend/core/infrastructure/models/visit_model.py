@@ -32,6 +32,14 @@ class VisitModel(models.Model):
         on_delete=models.CASCADE,
         related_name='visits'
     )
+    # Preço da visita congelado na criação (VisitPriceModel da loja/marca).
+    # Nulo para visitas ainda não preenchidas (backfill_visit_prices).
+    price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True
+    )
 
     class Meta:
         verbose_name = 'visita'
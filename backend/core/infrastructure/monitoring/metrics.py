@@ -0,0 +1,185 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+class Counter:
+    """Contador monotônico com rótulos"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Labels = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} "
+            f"{_format_number(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Histogram:
+    """
+    Histograma com buckets fixos.
+
+    As contagens são guardadas por bucket e acumuladas apenas na
+    renderização, mantendo o observe() barato.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float],
+        label_names: Labels = ()
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        # Por série: [contagem por bucket..., +Inf, soma, total]
+        self._series: Dict[Labels, list] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series.setdefault(
+                labels, [0] * (len(self.buckets) + 1) + [0.0, 0])
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = []
+        bucket_names = self.label_names + ("le",)
+        bounds = self.buckets + (float("inf"),)
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, n in zip(bounds, series):
+                cumulative += n
+                bucket_labels = _format_labels(
+                    bucket_names, labels + (_format_number(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            formatted = _format_labels(self.label_names, labels)
+            lines.append(
+                f"{self.name}_sum{formatted} {_format_number(series[-2])}")
+            lines.append(f"{self.name}_count{formatted} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registro de métricas do processo, exportado no formato Prometheus"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._metrics: List = []
+
+    def counter(self, name, help_text, label_names=()) -> Counter:
+        metric = Counter(name, help_text, tuple(label_names))
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help_text, buckets, label_names=()) -> Histogram:
+        metric = Histogram(name, help_text, buckets, tuple(label_names))
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        with self.lock:
+            for metric in self._metrics:
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+                lines.append(f"# TYPE {metric.name} {metric.type_name}")
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+_REQUEST_LABELS = ("route", "method", "status")
+_SECONDS_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+REQUEST_DURATION = registry.histogram(
+    "sispromo_request_duration_seconds",
+    "Tempo total da requisição por rota.",
+    _SECONDS_BUCKETS,
+    _REQUEST_LABELS
+)
+REQUEST_DB_DURATION = registry.histogram(
+    "sispromo_request_db_duration_seconds",
+    "Tempo gasto no banco de dados por requisição.",
+    _SECONDS_BUCKETS,
+    _REQUEST_LABELS
+)
+REQUEST_QUERIES = registry.histogram(
+    "sispromo_request_queries",
+    "Número de consultas SQL por requisição.",
+    (1, 2, 5, 10, 20, 50, 100, 200, 500),
+    _REQUEST_LABELS
+)
+RESPONSE_SIZE = registry.histogram(
+    "sispromo_response_size_bytes",
+    "Tamanho do corpo da resposta.",
+    (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+    _REQUEST_LABELS
+)
+CACHE_LOOKUPS = registry.counter(
+    "sispromo_cache_lookups_total",
+    "Consultas ao cache por prefixo e resultado (hit/miss).",
+    ("cache", "result")
+)
+
+
+def observe_request(labels: Labels, duration, db_duration, queries, size):
+    """Registra as métricas de uma requisição"""
+    with registry.lock:
+        REQUEST_DURATION.observe(labels, duration)
+        REQUEST_DB_DURATION.observe(labels, db_duration)
+        REQUEST_QUERIES.observe(labels, queries)
+        if size is not None:
+            RESPONSE_SIZE.observe(labels, size)
+
+
+def record_cache_lookup(cache_name: str, hit: bool) -> None:
+    """Registra um hit ou miss de cache"""
+    with registry.lock:
+        CACHE_LOOKUPS.inc((cache_name, "hit" if hit else "miss"))
@@ -0,0 +1,54 @@
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from .metrics import observe_request
+from .query_collector import QueryCollector
+from .query_inspector_middleware import get_endpoint_name
+
+
+class MetricsMiddleware:
+    """
+    Registra latência, tempo de banco, número de consultas e tamanho da
+    resposta de cada requisição, rotulados por rota, método e status.
+
+    Desativado com METRICS["ENABLED"] = False. Funciona em WSGI e ASGI
+    (sem forçar as views assíncronas a rodar de forma síncrona).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not getattr(settings, "METRICS", {}).get("ENABLED", False):
+            raise MiddlewareNotUsed
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        with QueryCollector() as collector:
+            response = self.get_response(request)
+        return self._observe(request, response, start, collector)
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        with QueryCollector() as collector:
+            response = await self.get_response(request)
+        return self._observe(request, response, start, collector)
+
+    def _observe(self, request, response, start, collector):
+        duration = time.perf_counter() - start
+
+        size = None if response.streaming else len(response.content)
+        labels = (
+            get_endpoint_name(request),
+            request.method,
+            str(response.status_code),
+        )
+        observe_request(
+            labels, duration, collector.duration, collector.count, size)
+        return response
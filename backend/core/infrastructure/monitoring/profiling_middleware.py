@@ -0,0 +1,152 @@
+import cProfile
+import json
+import logging
+import os
+import random
+import re
+import time
+from datetime import datetime
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from .query_collector import QueryCollector
+from .query_inspector_middleware import get_endpoint_name
+
+logger = logging.getLogger(__name__)
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:  # pragma: no cover - dependência opcional
+    PyinstrumentProfiler = None
+
+DEFAULTS = {
+    "ENABLED": False,
+    "HEADER": "HTTP_X_PROFILE",
+    # Fração das requisições (de gestores) perfiladas sem o cabeçalho
+    "SAMPLE_RATE": 0.0,
+    "DIRECTORY": "profiles",
+    # "cprofile" ou "pyinstrument" (se instalado)
+    "ENGINE": "cprofile",
+}
+
+MANAGER_ROLE = 3
+
+
+def get_profiling_config():
+    """Configuração PROFILING mesclada com os valores padrão"""
+    return {**DEFAULTS, **getattr(settings, "PROFILING", {})}
+
+
+class ProfilingMiddleware:
+    """
+    Captura o perfil de chamadas de requisições selecionadas.
+
+    Uma requisição é perfilada quando traz o cabeçalho X-Profile: 1 ou é
+    sorteada por PROFILING["SAMPLE_RATE"], e apenas se o usuário for
+    Gestor (role=3). O perfil é salvo em PROFILING["DIRECTORY"] junto de
+    um JSON com rota, filtros e consultas SQL executadas.
+
+    Apenas síncrono: sob ASGI, ativá-lo faz o Django executar as views
+    assíncronas de forma síncrona (o perfil cobre uma única thread).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_profiling_config()
+        if not self.config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.authenticator = JWTAuthentication()
+
+    def __call__(self, request):
+        if not self._should_profile(request):
+            return self.get_response(request)
+
+        engine = self.config["ENGINE"]
+        if engine == "pyinstrument" and PyinstrumentProfiler is None:
+            engine = "cprofile"
+        profiler = (
+            PyinstrumentProfiler() if engine == "pyinstrument"
+            else cProfile.Profile()
+        )
+
+        start = time.perf_counter()
+        with QueryCollector(keep_queries=True) as collector:
+            if engine == "cprofile":
+                profiler.enable()
+            else:
+                profiler.start()
+            try:
+                response = self.get_response(request)
+            finally:
+                if engine == "cprofile":
+                    profiler.disable()
+                else:
+                    profiler.stop()
+        duration = time.perf_counter() - start
+
+        try:
+            self._save(request, response, profiler, engine, collector,
+                       duration)
+        except OSError as e:
+            logger.error(f"Erro ao salvar perfil da requisição: {e}")
+        return response
+
+    def _should_profile(self, request):
+        """Cabeçalho ou amostragem, restrito a gestores"""
+        requested = request.META.get(self.config["HEADER"]) == "1"
+        sampled = (
+            self.config["SAMPLE_RATE"] > 0
+            and random.random() < self.config["SAMPLE_RATE"]
+        )
+        if not (requested or sampled):
+            return False
+        return self._get_role(request) == MANAGER_ROLE
+
+    def _get_role(self, request):
+        """Papel do usuário autenticado por sessão ou JWT"""
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return user.role
+        try:
+            result = self.authenticator.authenticate(request)
+        except Exception:
+            return None
+        return result[0].role if result else None
+
+    def _save(self, request, response, profiler, engine, collector,
+              duration):
+        directory = self.config["DIRECTORY"]
+        os.makedirs(directory, exist_ok=True)
+
+        endpoint = get_endpoint_name(request)
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        safe_endpoint = re.sub(r"[^\w.-]", "_", endpoint)
+        base_name = os.path.join(directory, f"{timestamp}_{safe_endpoint}")
+
+        if engine == "cprofile":
+            profile_path = f"{base_name}.prof"
+            profiler.dump_stats(profile_path)
+        else:
+            profile_path = f"{base_name}.html"
+            with open(profile_path, "w", encoding="utf-8") as profile_file:
+                profile_file.write(profiler.output_html())
+
+        metadata = {
+            "endpoint": endpoint,
+            "method": request.method,
+            "path": request.path,
+            "filters": dict(request.GET.lists()),
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 3),
+            "engine": engine,
+            "profile": os.path.basename(profile_path),
+            "query_count": collector.count,
+            "query_time_ms": round(collector.duration * 1000, 3),
+            "queries": [
+                {"sql": query["sql"],
+                 "time_ms": round(query["time"] * 1000, 3)}
+                for query in collector.queries
+            ],
+        }
+        with open(f"{base_name}.json", "w", encoding="utf-8") as meta_file:
+            json.dump(metadata, meta_file, indent=2, ensure_ascii=False)
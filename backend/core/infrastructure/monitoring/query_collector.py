@@ -0,0 +1,126 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# Literais e listas de parâmetros removidos para agrupar consultas de
+# mesmo formato (ex: o mesmo SELECT repetido com ids diferentes)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAM_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normaliza uma consulta SQL para o seu formato
+
+    Args:
+        sql: Consulta SQL
+
+    Returns:
+        str: Consulta com literais e parâmetros substituídos por "?"
+    """
+    sql = _LITERALS.sub("?", sql.replace("%s", "?"))
+    sql = _PARAM_LISTS.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+# Coletores ativos no contexto atual. O contexto (e não a conexão) é o que
+# acompanha a requisição: views assíncronas executam as consultas em threads
+# do sync_to_async, cada uma com a sua conexão, e o asgiref copia as
+# ContextVars para essas threads.
+_active_collectors: ContextVar[tuple] = ContextVar(
+    "query_collectors", default=())
+
+
+def _collect(execute, sql, params, many, context):
+    """execute_wrapper instalado em todas as conexões"""
+    collectors = _active_collectors.get()
+    if not collectors:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        for collector in collectors:
+            collector.record(sql, elapsed)
+
+
+def _install(connection, **kwargs):
+    if _collect not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_collect)
+
+
+connection_created.connect(_install)
+for _connection in connections.all(initialized_only=True):
+    _install(_connection)
+
+
+class QueryCollector:
+    """
+    Coleta as consultas executadas no contexto atual, em qualquer conexão
+    (inclusive as feitas via sync_to_async por views assíncronas).
+
+    Uso:
+        with QueryCollector() as collector:
+            ...
+        collector.count, collector.duration, collector.duplicates
+
+    Args:
+        track_shapes: Agrupa as consultas por formato (normalize_sql)
+        keep_queries: Guarda o SQL e o tempo de cada consulta
+    """
+
+    def __init__(self, track_shapes: bool = False, keep_queries: bool = False):
+        self.track_shapes = track_shapes
+        self.keep_queries = keep_queries
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.queries: List[Dict[str, Any]] = []
+        self._token = None
+
+    def record(self, sql: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        if self.track_shapes:
+            self.shapes[normalize_sql(sql)] += 1
+        if self.keep_queries:
+            self.queries.append({"sql": sql, "time": elapsed})
+
+    def __enter__(self) -> "QueryCollector":
+        self._token = _active_collectors.set(
+            _active_collectors.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active_collectors.reset(self._token)
+        self._token = None
+
+    @property
+    def duplicates(self) -> Dict[str, int]:
+        """Formatos de consulta executados mais de uma vez"""
+        return {sql: n for sql, n in self.shapes.items() if n > 1}
+
+    @property
+    def max_duplicates(self) -> int:
+        """Maior número de repetições de um mesmo formato de consulta"""
+        return max(self.shapes.values(), default=0)
+
+    def summary(self, top: Optional[int] = 5) -> Dict[str, Any]:
+        """Resumo serializável em JSON"""
+        duplicates = sorted(
+            self.duplicates.items(), key=lambda item: item[1], reverse=True
+        )
+        return {
+            "queries": self.count,
+            "duration_ms": round(self.duration * 1000, 3),
+            "max_duplicates": self.max_duplicates,
+            "duplicates": [
+                {"sql": sql, "count": n} for sql, n in duplicates[:top]
+            ],
+        }
@@ -0,0 +1,145 @@
+import json
+import logging
+import threading
+from typing import Any, Dict
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from .query_collector import QueryCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": False,
+    # Limite de consultas por requisição
+    "MAX_QUERIES": 50,
+    # Limite de execuções de um mesmo formato de consulta (N+1)
+    "MAX_DUPLICATES": 10,
+    # Levanta QueryBudgetExceeded em vez de apenas registrar no log
+    "RAISE": False,
+}
+
+
+class QueryBudgetExceeded(Exception):
+    """Requisição excedeu o limite de consultas configurado"""
+
+
+def get_inspector_config() -> Dict[str, Any]:
+    """Configuração QUERY_INSPECTOR mesclada com os valores padrão"""
+    return {**DEFAULTS, **getattr(settings, "QUERY_INSPECTOR", {})}
+
+
+# Rótulo das requisições que não resolvem para nenhuma rota (404,
+# varreduras). Usar o caminho criaria uma série nova por URL inválida.
+UNMATCHED_ENDPOINT = "unmatched"
+
+
+def get_endpoint_name(request) -> str:
+    """Nome da rota resolvida (ex: visit-list) ou UNMATCHED_ENDPOINT"""
+    match = getattr(request, "resolver_match", None)
+    if match and match.view_name:
+        return match.view_name
+    return UNMATCHED_ENDPOINT
+
+
+class QueryReport:
+    """Agrega o número de consultas por endpoint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, endpoint: str, collector: QueryCollector) -> None:
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, {
+                "requests": 0,
+                "total_queries": 0,
+                "max_queries": 0,
+                "max_duplicates": 0,
+                "duplicates": [],
+            })
+            stats["requests"] += 1
+            stats["total_queries"] += collector.count
+            if collector.count >= stats["max_queries"]:
+                stats["max_queries"] = collector.count
+            if collector.max_duplicates > stats["max_duplicates"]:
+                stats["max_duplicates"] = collector.max_duplicates
+                stats["duplicates"] = collector.summary()["duplicates"]
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                endpoint: dict(stats)
+                for endpoint, stats in sorted(self._endpoints.items())
+            }
+
+    def write_json(self, path: str) -> None:
+        """Exporta o relatório em JSON"""
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(self.to_dict(), report_file, indent=2,
+                      ensure_ascii=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+# Relatório do processo, alimentado pelo middleware
+query_report = QueryReport()
+
+
+class QueryInspectorMiddleware:
+    """
+    Conta as consultas de cada requisição e detecta padrões N+1.
+
+    Ativado por QUERY_INSPECTOR["ENABLED"] (por padrão, apenas em DEBUG).
+    Adiciona o cabeçalho X-Query-Count à resposta e registra um aviso
+    (ou levanta QueryBudgetExceeded, com RAISE) quando os limites
+    MAX_QUERIES ou MAX_DUPLICATES são excedidos.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_inspector_config()
+        if not self.config["ENABLED"]:
+            raise MiddlewareNotUsed
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with QueryCollector(track_shapes=True) as collector:
+            response = self.get_response(request)
+        return self._inspect(request, response, collector)
+
+    async def __acall__(self, request):
+        with QueryCollector(track_shapes=True) as collector:
+            response = await self.get_response(request)
+        return self._inspect(request, response, collector)
+
+    def _inspect(self, request, response, collector):
+        endpoint = get_endpoint_name(request)
+        query_report.record(endpoint, collector)
+        response["X-Query-Count"] = str(collector.count)
+
+        problems = []
+        if collector.count > self.config["MAX_QUERIES"]:
+            problems.append(
+                f"{collector.count} consultas "
+                f"(limite {self.config['MAX_QUERIES']})"
+            )
+        if collector.max_duplicates > self.config["MAX_DUPLICATES"]:
+            sql, n = max(collector.shapes.items(), key=lambda item: item[1])
+            problems.append(f"consulta repetida {n} vezes: {sql}")
+
+        if problems:
+            message = f"{request.method} {endpoint}: " + "; ".join(problems)
+            if self.config["RAISE"]:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        return response
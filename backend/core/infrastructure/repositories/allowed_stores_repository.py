@@ -0,0 +1,101 @@
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.models.brand_model import BrandStore
+from core.infrastructure.models.promoter_brand_model import PromoterBrand
+
+
+class AllowedStoresRepository:
+    """
+    Pares (loja, marca) que cada promotor pode visitar: as lojas das
+    marcas do promotor (PromoterBrand + BrandStore).
+
+    O índice de cada promotor fica em cache com as lojas já agrupadas para
+    o formulário de visitas e o conjunto de pares para a validação; cada
+    uso é uma única leitura do cache. A chave é removida quando mudam os
+    vínculos do promotor, as lojas das suas marcas ou os nomes das lojas e
+    marcas (signals.py e as escritas em massa dos repositórios).
+    """
+
+    PREFIX = "allowed_stores:"
+
+    @staticmethod
+    def cache_key(promoter_id: int) -> str:
+        return CacheConfig.get_key(AllowedStoresRepository.PREFIX, promoter_id)
+
+    @staticmethod
+    def cache_keys(promoter_ids: Iterable[int]) -> List[str]:
+        return [
+            AllowedStoresRepository.cache_key(promoter_id)
+            for promoter_id in promoter_ids
+        ]
+
+    @staticmethod
+    def _load(promoter_id: int) -> Dict:
+        rows = BrandStore.objects.filter(
+            brand__promoter_brands__promoter_id=promoter_id
+        ).values_list(
+            "store_id", "store__name", "store__number", "store__city",
+            "store__state", "brand_id", "brand__name"
+        ).order_by("store__name", "store_id", "brand__name")
+
+        stores, pairs = [], set()
+        for store, group in groupby(rows, key=itemgetter(0, 1, 2, 3, 4)):
+            brands = [
+                {"id": brand_id, "name": brand_name}
+                for *_, brand_id, brand_name in group
+            ]
+            pairs.update((store[0], brand["id"]) for brand in brands)
+            stores.append({
+                "id": store[0],
+                "name": store[1],
+                "number": store[2],
+                "city": store[3],
+                "state": store[4],
+                "brands": brands,
+            })
+        return {"stores": stores, "pairs": frozenset(pairs)}
+
+    @staticmethod
+    def get(promoter_id: int) -> Dict:
+        """
+        Returns:
+            Dict: stores (lojas com as marcas permitidas) e pairs
+                (conjunto de (store_id, brand_id))
+        """
+        key = AllowedStoresRepository.cache_key(promoter_id)
+        index = CacheConfig.get(key)
+        if index is None:
+            index = AllowedStoresRepository._load(promoter_id)
+            CacheConfig.set(key, index, CacheConfig.LONG_TIMEOUT)
+        return index
+
+    @staticmethod
+    def is_allowed(promoter_id: int, store_id: int, brand_id: int) -> bool:
+        return (store_id, brand_id) in AllowedStoresRepository.get(
+            promoter_id)["pairs"]
+
+    # Invalidação
+
+    @staticmethod
+    def keys_for_brands(brand_ids: Iterable[int]) -> List[str]:
+        """Chaves dos promotores vinculados às marcas"""
+        return AllowedStoresRepository.cache_keys(
+            PromoterBrand.objects.filter(brand_id__in=list(brand_ids))
+            .values_list("promoter_id", flat=True).distinct()
+        )
+
+    @staticmethod
+    def keys_for_stores(store_ids: Iterable[int]) -> List[str]:
+        """Chaves dos promotores das marcas que atendem as lojas"""
+        return AllowedStoresRepository.cache_keys(
+            PromoterBrand.objects.filter(
+                brand__brandstore__store_id__in=list(store_ids)
+            ).values_list("promoter_id", flat=True).distinct()
+        )
+
+    @staticmethod
+    def clear(promoter_ids: Iterable[int]) -> None:
+        CacheConfig.delete_many(
+            AllowedStoresRepository.cache_keys(promoter_ids))
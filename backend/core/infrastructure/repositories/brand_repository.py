@@ -1,5 +1,18 @@
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List
 from django.core.cache import cache
-from core.infrastructure.models.brand_model import BrandModel
+from django.db import transaction
+from django.db.models import Prefetch, QuerySet
+from core.infrastructure.monitoring.metrics import record_cache_lookup
+from core.infrastructure.models.brand_model import BrandModel, BrandStore
+from core.infrastructure.repositories.planning_repository import (
+    PlanningRepository,
+)
+from core.infrastructure.repositories.promoter_brand_repository import (
+    PromoterBrandRepository,
+)
 
 
 class BrandRepository:
@@ -15,6 +28,7 @@ class BrandRepository:
         """
         # Tenta buscar do cache
         cached_data = cache.get(BrandRepository.CACHE_KEY_ALL)
+        record_cache_lookup("brand", cached_data is not None)
         if cached_data is not None:
             return cached_data
 
@@ -40,6 +54,7 @@ class BrandRepository:
 
         # Tenta buscar do cache
         cached_data = cache.get(cache_key)
+        record_cache_lookup("brand", cached_data is not None)
         if cached_data is not None:
             return cached_data
 
@@ -96,6 +111,51 @@ class BrandRepository:
         # Limpa os caches relacionados
         BrandRepository.clear_cache(brand_id)
 
+    @staticmethod
+    def with_stores() -> QuerySet:
+        """
+        Marcas com as associações e as lojas pré-carregadas (duas
+        consultas no total), para BrandSerializer
+        """
+        return BrandModel.objects.prefetch_related(Prefetch(
+            "brandstore_set",
+            queryset=BrandStore.objects.select_related("store").only(
+                "id", "brand_id", "store_id", "visit_frequency",
+                "store__name"
+            ).order_by("store__name", "store_id")
+        ))
+
+    @staticmethod
+    def grouped_stores() -> List[Dict]:
+        """
+        Marcas com as lojas agrupadas, no formato de BrandSerializer.
+
+        Uma única consulta (marca LEFT JOIN associação LEFT JOIN loja)
+        ordenada por marca, agrupada numa passada; marcas sem lojas saem
+        com a lista vazia.
+        """
+        rows = BrandModel.objects.values_list(
+            "id", "name", "brandstore__store_id", "brandstore__store__name",
+            "brandstore__visit_frequency"
+        ).order_by("name", "id", "brandstore__store__name")
+        return [
+            {
+                "brand_id": brand_id,
+                "brand_name": brand_name,
+                "stores": [
+                    {
+                        "store_id": store_id,
+                        "store_name": store_name,
+                        "visit_frequency": visit_frequency,
+                    }
+                    for _, _, store_id, store_name, visit_frequency in group
+                    if store_id is not None
+                ],
+            }
+            for (brand_id, brand_name), group in groupby(
+                rows, key=itemgetter(0, 1))
+        ]
+
     @staticmethod
     def clear_cache(brand_id=None):
         """
@@ -106,3 +166,67 @@ class BrandRepository:
         if brand_id:
             cache_key = BrandRepository.CACHE_KEY_BY_ID.format(brand_id)
             cache.delete(cache_key)
+
+    @staticmethod
+    def clear_brands_cache(brand_ids):
+        """
+        Limpa, numa única operação, o cache de várias marcas e das
+        associações promotor-marca que as incluem.
+        """
+        cache.delete_many(
+            [BrandRepository.CACHE_KEY_ALL]
+            + [BrandRepository.CACHE_KEY_BY_ID.format(brand_id)
+               for brand_id in brand_ids]
+            + PromoterBrandRepository.cache_keys_for_brands(brand_ids)
+        )
+
+    @staticmethod
+    def bulk_set_store_frequencies(assignments, batch_size=1000):
+        """
+        Aplica uma matriz marca x loja x periodicidade numa única transação.
+
+        Combinações com visit_frequency > 0 são inseridas ou têm a
+        periodicidade atualizada (INSERT ... ON CONFLICT); com 0 são
+        removidas. Apenas o cache das marcas afetadas é limpo.
+
+        Args:
+            assignments: Lista de dicts com brand_id, store_id e
+                visit_frequency
+            batch_size: Tamanho dos lotes de inserção
+
+        Returns:
+            dict: Quantidade de combinações gravadas e removidas
+        """
+        upserts = []
+        removals = defaultdict(list)
+        for item in assignments:
+            if item["visit_frequency"] > 0:
+                upserts.append(BrandStore(
+                    brand_id=item["brand_id"],
+                    store_id=item["store_id"],
+                    visit_frequency=item["visit_frequency"],
+                ))
+            else:
+                removals[item["brand_id"]].append(item["store_id"])
+
+        removed = 0
+        with transaction.atomic():
+            if upserts:
+                BrandStore.objects.bulk_create(
+                    upserts,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=["brand", "store"],
+                    update_fields=["visit_frequency"],
+                )
+            for brand_id, store_ids in removals.items():
+                removed += BrandStore.objects.filter(
+                    brand_id=brand_id, store_id__in=store_ids
+                ).delete()[0]
+
+        BrandRepository.clear_brands_cache(
+            {item["brand_id"] for item in assignments})
+        # bulk_create não dispara os sinais que limpam a matriz
+        PlanningRepository.clear_matrix_cache()
+
+        return {"saved": len(upserts), "removed": removed}
@@ -1,84 +1,191 @@
-from datetime import datetime, timedelta
-from django.db.models import Count
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import date, datetime
+from typing import Callable, Dict, Optional
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import Count, FilteredRelation, Q
+from ..cache.dashboard_cache import DashboardCache
+from ..database.partitioning import visit_date_filters
 from ..domain.entities.dashboard import (
-    DashboardData, BrandProgress, StoreProgress, PromoterProgress
+    DashboardData, DashboardPeriod, BrandProgress, StoreProgress,
+    PromoterProgress
 )
 from ..models.visit_model import VisitModel
 from ..models.brand_model import BrandModel
 from ..models.store_model import StoreModel
 from ..models.user_model import User
+from .promoter_stats_repository import PromoterStatsRepository
+
+# Consultas independentes do dashboard executadas ao mesmo tempo, cada uma
+# na própria thread e conexão com o banco
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dashboard")
+
+
+def _in_thread(query: Callable):
+    """Executa a consulta numa thread do pool, como uma requisição: a
+    conexão da thread é reaproveitada ou fechada conforme CONN_MAX_AGE"""
+    close_old_connections()
+    try:
+        return query()
+    finally:
+        close_old_connections()
+
+
+def run_queries(queries: Dict[str, Callable]) -> Dict:
+    """
+    Executa as consultas em paralelo e devolve os resultados por nome.
+
+    Dentro de uma transação as consultas rodam em sequência na conexão
+    atual, pois as outras conexões não enxergariam os dados ainda não
+    confirmados (ex: testes com TestCase). O mesmo vale com
+    DASHBOARD_PARALLEL_QUERIES = False.
+    """
+    if (connection.in_atomic_block
+            or not getattr(settings, "DASHBOARD_PARALLEL_QUERIES", True)):
+        return {name: query() for name, query in queries.items()}
+
+    # copy_context leva as ContextVars (ex: QueryCollector) para a thread
+    futures = {
+        name: _executor.submit(copy_context().run, _in_thread, query)
+        for name, query in queries.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def _with_progress(queryset, relation: str, visits_filter: Q):
+    """
+    Anota em cada registro as visitas do período: total, concluídas e
+    pendentes. O filtro fica no ON do LEFT JOIN (FilteredRelation), então
+    registros sem visitas aparecem zerados e o intervalo de datas continua
+    descartando as partições fora do período.
+    """
+    return queryset.annotate(
+        period_visits=FilteredRelation(relation, condition=visits_filter)
+    ).annotate(
+        total=Count("period_visits"),
+        done=Count("period_visits", filter=Q(period_visits__status=3)),
+        pending=Count("period_visits", filter=Q(period_visits__status=1)),
+    ).order_by("id")
+
+
+def _relation_filter(relation: str, **filters) -> Q:
+    return Q(**{f"{relation}__{lookup}": value for lookup, value in filters.items()})
+
 
 class DashboardRepository:
-    def get_promoter_dashboard(self, user_id: int, start_date: datetime, end_date: datetime) -> DashboardData:
-        visits = VisitModel.objects.filter(
-            promoter_id=user_id,
-            visit_date__range=[start_date, end_date]
-        )
+    def get_dashboard(self, period: DashboardPeriod, today: date, promoter_id: Optional[int] = None) -> DashboardData:
+        """
+        Dados do dashboard do período, primeiro no cache, depois no banco.
 
-        brands_progress = [
-            BrandProgress(
-                brand_id=brand.id,
-                brand_name=brand.name,
-                visits_done=visits.filter(brand=brand, status=3).count(),
-                visits_pending=visits.filter(brand=brand, status=1).count(),
-                total_visits=visits.filter(brand=brand).count()
-            )
-            for brand in BrandModel.objects.all()
-        ]
+        Args:
+            period: Período exibido
+            today: Data atual (define se o período está encerrado)
+            promoter_id: Promotor logado; None para analistas e gestores
+        """
+        key = DashboardCache.key(period, DashboardCache.scope(promoter_id))
+        cached = DashboardCache.get(key)
+        if cached is not None:
+            return cached
 
-        return DashboardData(
-            total_visits=visits.count(),
-            total_completed=visits.filter(status=3).count(),
-            total_pending=visits.filter(status=1).count(),
-            brands_progress=brands_progress,
-            promoters_progress=[],
-            stores_progress=[]
-        )
+        if promoter_id:
+            data = self.get_promoter_dashboard(
+                promoter_id, period.start_date, period.end_date)
+        else:
+            data = self.get_manager_dashboard(
+                period.start_date, period.end_date)
+        DashboardCache.set(key, period, data, today)
+        return data
 
-    def get_manager_dashboard(self, start_date: datetime, end_date: datetime) -> DashboardData:
-        visits = VisitModel.objects.filter(
-            visit_date__range=[start_date, end_date]
+    def _totals(self, filters: Dict) -> Dict:
+        return VisitModel.objects.filter(**filters).aggregate(
+            total=Count("id"),
+            done=Count("id", filter=Q(status=3)),
+            pending=Count("id", filter=Q(status=1)),
         )
 
-        brands_progress = [
+    def _brands_progress(self, filters: Dict):
+        brands = _with_progress(
+            BrandModel.objects.all(), "visits",
+            _relation_filter("visits", **filters))
+        return [
             BrandProgress(
                 brand_id=brand.id,
                 brand_name=brand.name,
-                visits_done=visits.filter(brand=brand, status=3).count(),
-                visits_pending=visits.filter(brand=brand, status=1).count(),
-                total_visits=visits.filter(brand=brand).count()
+                visits_done=brand.done,
+                visits_pending=brand.pending,
+                total_visits=brand.total
             )
-            for brand in BrandModel.objects.all()
+            for brand in brands.only("id", "name")
         ]
 
-        promoters_progress = [
+    def _promoters_progress(self, filters: Dict):
+        promoters = _with_progress(
+            User.objects.filter(role=1), "promoter_visits",
+            _relation_filter("promoter_visits", **filters))
+        return [
             PromoterProgress(
                 promoter_id=promoter.id,
                 promoter_name=f"{promoter.first_name} {promoter.last_name}",
-                visits_done=visits.filter(promoter=promoter, status=3).count(),
-                visits_pending=visits.filter(promoter=promoter, status=1).count(),
-                total_visits=visits.filter(promoter=promoter).count()
+                visits_done=promoter.done,
+                visits_pending=promoter.pending,
+                total_visits=promoter.total
             )
-            for promoter in User.objects.filter(role=1)
+            for promoter in promoters.only("id", "first_name", "last_name")
         ]
 
-        stores_progress = [
+    def _stores_progress(self, filters: Dict):
+        stores = _with_progress(
+            StoreModel.objects.all(), "visits",
+            _relation_filter("visits", **filters))
+        return [
             StoreProgress(
                 store_id=store.id,
                 store_name=store.name,
                 store_number=store.number,
-                visits_done=visits.filter(store=store, status=3).count(),
-                visits_pending=visits.filter(store=store, status=1).count(),
-                total_visits=visits.filter(store=store).count()
+                visits_done=store.done,
+                visits_pending=store.pending,
+                total_visits=store.total
             )
-            for store in StoreModel.objects.all()
+            for store in stores.only("id", "name", "number")
         ]
 
+    def get_promoter_dashboard(self, user_id: int, start_date: datetime, end_date: datetime) -> DashboardData:
+        filters = {"promoter_id": user_id, **visit_date_filters(start_date, end_date)}
+
+        # Totais lidos dos contadores diários (PromoterDailyStats)
+        results = run_queries({
+            "totals": lambda: PromoterStatsRepository.totals(
+                user_id, filters["visit_date__gte"], filters["visit_date__lte"]),
+            "brands": lambda: self._brands_progress(filters),
+        })
+
         return DashboardData(
-            total_visits=visits.count(),
-            total_completed=visits.filter(status=3).count(),
-            total_pending=visits.filter(status=1).count(),
-            brands_progress=brands_progress,
-            promoters_progress=promoters_progress,
-            stores_progress=stores_progress
-        )
\ No newline at end of file
+            total_visits=results["totals"]["total_visits"],
+            total_completed=results["totals"]["completed"],
+            total_pending=results["totals"]["pending"],
+            brands_progress=results["brands"],
+            promoters_progress=[],
+            stores_progress=[]
+        )
+
+    def get_manager_dashboard(self, start_date: datetime, end_date: datetime) -> DashboardData:
+        filters = visit_date_filters(start_date, end_date)
+
+        # Quatro consultas agregadas independentes: a latência fica próxima
+        # à da mais lenta, e não à soma delas
+        results = run_queries({
+            "totals": lambda: self._totals(filters),
+            "brands": lambda: self._brands_progress(filters),
+            "promoters": lambda: self._promoters_progress(filters),
+            "stores": lambda: self._stores_progress(filters),
+        })
+
+        return DashboardData(
+            total_visits=results["totals"]["total"],
+            total_completed=results["totals"]["done"],
+            total_pending=results["totals"]["pending"],
+            brands_progress=results["brands"],
+            promoters_progress=results["promoters"],
+            stores_progress=results["stores"]
+        )
@@ -0,0 +1,77 @@
+from typing import Dict
+from django.db.models import Count
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.database.partitioning import visit_date_filters
+from core.infrastructure.domain.entities.dashboard import DashboardPeriod
+from core.infrastructure.domain.entities.planning import (
+    PlannedVisit,
+    PlanningData,
+)
+from core.infrastructure.domain.use_cases.visit_planning import build_planning
+from core.infrastructure.models.brand_model import BrandStore
+from core.infrastructure.models.visit_model import VisitModel
+
+
+class PlanningRepository:
+    """
+    Visitas esperadas (BrandStore.visit_frequency) x concluídas.
+
+    A matriz marca x loja fica em cache até uma alteração em BrandStore,
+    marcas ou lojas (core.infrastructure.signals); o progresso de todas
+    as lojas custa no máximo duas consultas.
+    """
+
+    MATRIX_KEY = CacheConfig.get_key("planning:", "matrix")
+
+    @staticmethod
+    def get_matrix() -> Dict:
+        """
+        Matriz do planejamento, primeiro no cache, depois no banco.
+
+        Returns:
+            Dict: matrix (PlannedVisit), brand_names e stores (nome, número)
+        """
+        cached = CacheConfig.get(PlanningRepository.MATRIX_KEY)
+        if cached is not None:
+            return cached
+
+        matrix, brand_names, stores = [], {}, {}
+        rows = BrandStore.objects.filter(visit_frequency__gt=0).values_list(
+            "brand_id", "store_id", "visit_frequency",
+            "brand__name", "store__name", "store__number"
+        ).order_by("brand_id", "store_id")
+        for (brand_id, store_id, visit_frequency,
+             brand_name, store_name, store_number) in rows:
+            matrix.append(PlannedVisit(brand_id, store_id, visit_frequency))
+            brand_names[brand_id] = brand_name
+            stores[store_id] = (store_name, store_number)
+
+        data = {"matrix": matrix, "brand_names": brand_names, "stores": stores}
+        CacheConfig.set(
+            PlanningRepository.MATRIX_KEY, data, CacheConfig.LONG_TIMEOUT)
+        return data
+
+    @staticmethod
+    def clear_matrix_cache() -> None:
+        CacheConfig.delete(PlanningRepository.MATRIX_KEY)
+
+    @staticmethod
+    def get_planning(period: DashboardPeriod) -> PlanningData:
+        """Visitas esperadas x concluídas do período por marca e loja"""
+        matrix = PlanningRepository.get_matrix()
+        done = {
+            (brand_id, store_id): count
+            for brand_id, store_id, count in VisitModel.objects.filter(
+                status=3,
+                **visit_date_filters(period.start_date, period.end_date)
+            ).values("brand_id", "store_id").annotate(
+                count=Count("id")
+            ).values_list("brand_id", "store_id", "count").order_by()
+        }
+        return build_planning(
+            period,
+            matrix["matrix"],
+            done,
+            matrix["brand_names"],
+            matrix["stores"],
+        )
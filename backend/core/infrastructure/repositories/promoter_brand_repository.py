@@ -1,6 +1,15 @@
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable
 from django.core.cache import cache
-from django.db.models import Prefetch
+from django.db import transaction
+from django.db.models import Q
+from core.infrastructure.monitoring.metrics import record_cache_lookup
 from core.infrastructure.models.promoter_brand_model import PromoterBrand
+from core.infrastructure.repositories.allowed_stores_repository import (
+    AllowedStoresRepository,
+)
 
 
 class PromoterBrandRepository:
@@ -9,69 +18,59 @@ class PromoterBrandRepository:
     CACHE_TIMEOUT = 300  # 5 minutos em segundos
 
     @staticmethod
-    def get_all_promoter_brands():
+    def _get_cached(cache_key, queryset, query_plan=None):
         """
-        Retorna todas as associações entre promotores e marcas.
-        Utiliza cache para melhorar a performance.
+        Cada chave guarda os querysets por plano de consulta (os joins
+        carregados dependem do plano), para que a invalidação continue
+        removendo uma única chave.
         """
+        plan_id = query_plan.cache_id if query_plan else ""
+
         # Tenta buscar do cache
-        cached_data = cache.get(PromoterBrandRepository.CACHE_KEY_ALL)
-        if cached_data is not None:
-            return cached_data
+        cached_data = cache.get(cache_key) or {}
+        record_cache_lookup("promoter_brand", plan_id in cached_data)
+        if plan_id in cached_data:
+            return cached_data[plan_id]
 
         # Se não estiver em cache, busca do banco de dados
-        promoter_brands = PromoterBrand.objects.select_related(
-            'promoter',
-            'brand'
-        ).prefetch_related(
-            Prefetch(
-                'brand__stores',
-                to_attr='store_list'
-            )
-        ).all()
+        if query_plan:
+            queryset = query_plan.apply(queryset)
 
         # Salva no cache
+        cached_data[plan_id] = queryset
         cache.set(
-            PromoterBrandRepository.CACHE_KEY_ALL,
-            promoter_brands,
+            cache_key,
+            cached_data,
             PromoterBrandRepository.CACHE_TIMEOUT
         )
 
-        return promoter_brands
+        return queryset
 
     @staticmethod
-    def get_promoter_brands_by_promoter(promoter_id):
+    def get_all_promoter_brands(query_plan=None):
         """
-        Retorna todas as marcas associadas a um promotor específico.
+        Retorna todas as associações entre promotores e marcas.
         Utiliza cache para melhorar a performance.
+        O query_plan (opcional) define os joins carregados junto.
         """
-        cache_key = PromoterBrandRepository.CACHE_KEY_BY_PROMOTER.format(
-            promoter_id)
-
-        # Tenta buscar do cache
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
-
-        # Se não estiver em cache, busca do banco de dados
-        promoter_brands = PromoterBrand.objects.select_related(
-            'promoter',
-            'brand'
-        ).prefetch_related(
-            Prefetch(
-                'brand__stores',
-                to_attr='store_list'
-            )
-        ).filter(promoter_id=promoter_id)
-
-        # Salva no cache
-        cache.set(
-            cache_key,
-            promoter_brands,
-            PromoterBrandRepository.CACHE_TIMEOUT
+        return PromoterBrandRepository._get_cached(
+            PromoterBrandRepository.CACHE_KEY_ALL,
+            PromoterBrand.objects.all(),
+            query_plan
         )
 
-        return promoter_brands
+    @staticmethod
+    def get_promoter_brands_by_promoter(promoter_id, query_plan=None):
+        """
+        Retorna todas as marcas associadas a um promotor específico.
+        Utiliza cache para melhorar a performance.
+        O query_plan (opcional) define os joins carregados junto.
+        """
+        return PromoterBrandRepository._get_cached(
+            PromoterBrandRepository.CACHE_KEY_BY_PROMOTER.format(promoter_id),
+            PromoterBrand.objects.filter(promoter_id=promoter_id),
+            query_plan
+        )
 
     @staticmethod
     def create_promoter_brand(promoter_id, brand_id):
@@ -114,28 +113,95 @@ class PromoterBrandRepository:
                 promoter_id)
             cache.delete(cache_key)
 
+    @staticmethod
+    def cache_keys_for_brands(brand_ids):
+        """
+        Chaves de cache que incluem as marcas informadas (as associações
+        são armazenadas com as lojas e periodicidades de cada marca, e o
+        índice de lojas permitidas dos promotores com as suas lojas).
+        """
+        promoter_ids = list(PromoterBrand.objects.filter(
+            brand_id__in=brand_ids
+        ).values_list("promoter_id", flat=True).distinct())
+        return [PromoterBrandRepository.CACHE_KEY_ALL] + [
+            PromoterBrandRepository.CACHE_KEY_BY_PROMOTER.format(promoter_id)
+            for promoter_id in promoter_ids
+        ] + AllowedStoresRepository.cache_keys(promoter_ids)
+
     @staticmethod
     def update_promoter_brands(promoter_id, brand_ids):
         """
         Atualiza as marcas de um promotor.
-        Remove as associações antigas e cria as novas.
+        Remove apenas as associações que saíram e cria as que entraram.
         """
-        # Remove todas as associações existentes
-        PromoterBrand.objects.filter(promoter_id=promoter_id).delete()
+        return PromoterBrandRepository.replace_promoter_brands(
+            {promoter_id: brand_ids})
 
-        # Cria as novas associações
-        promoter_brands = []
-        for brand_id in brand_ids:
-            promoter_brands.append(
-                PromoterBrand(
-                    promoter_id=promoter_id,
-                    brand_id=brand_id
-                )
-            )
+    @staticmethod
+    def replace_promoter_brands(
+        assignments: Dict[int, Iterable[int]]
+    ) -> Dict[str, int]:
+        """
+        Define as marcas de vários promotores numa única transação.
 
-        # Salva todas as novas associações de uma vez
-        if promoter_brands:
-            PromoterBrand.objects.bulk_create(promoter_brands)
+        Compara as marcas atuais com as desejadas e faz apenas as
+        inserções e remoções necessárias (uma consulta de cada), sem
+        tocar nos vínculos mantidos. As linhas atuais ficam travadas até o
+        fim da transação.
 
-        # Limpa os caches relacionados
-        PromoterBrandRepository.clear_cache(promoter_id)
+        Args:
+            assignments: Marcas desejadas por ID do promotor
+
+        Returns:
+            dict: Quantidade de vínculos criados, removidos e mantidos
+        """
+        desired = {
+            promoter_id: set(brand_ids)
+            for promoter_id, brand_ids in assignments.items()
+        }
+        with transaction.atomic():
+            current = defaultdict(set)
+            for promoter_id, brand_id in PromoterBrand.objects.filter(
+                promoter_id__in=desired
+            ).select_for_update().order_by().values_list(
+                    "promoter_id", "brand_id"):
+                current[promoter_id].add(brand_id)
+
+            removals = {
+                promoter_id: current[promoter_id] - brand_ids
+                for promoter_id, brand_ids in desired.items()
+            }
+            removals = {
+                promoter_id: brand_ids
+                for promoter_id, brand_ids in removals.items() if brand_ids
+            }
+            additions = [
+                PromoterBrand(promoter_id=promoter_id, brand_id=brand_id)
+                for promoter_id, brand_ids in desired.items()
+                for brand_id in sorted(brand_ids - current[promoter_id])
+            ]
+
+            removed = 0
+            if removals:
+                removed = PromoterBrand.objects.filter(reduce(or_, (
+                    Q(promoter_id=promoter_id, brand_id__in=brand_ids)
+                    for promoter_id, brand_ids in removals.items()
+                ))).delete()[0]
+            if additions:
+                PromoterBrand.objects.bulk_create(additions)
+
+        cache.delete_many(
+            [PromoterBrandRepository.CACHE_KEY_ALL]
+            + [PromoterBrandRepository.CACHE_KEY_BY_PROMOTER.format(
+                promoter_id) for promoter_id in desired]
+            + AllowedStoresRepository.cache_keys(desired)
+        )
+
+        return {
+            "added": len(additions),
+            "removed": removed,
+            "unchanged": sum(
+                len(current[promoter_id] & brand_ids)
+                for promoter_id, brand_ids in desired.items()
+            ),
+        }
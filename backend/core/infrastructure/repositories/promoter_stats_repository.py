@@ -0,0 +1,266 @@
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from django.db import transaction
+from functools import reduce
+from operator import or_
+from django.db.models import (
+    Case, Count, DecimalField, F, IntegerField, Q, Sum, Value, When,
+)
+from django.db.models.functions import Coalesce
+from core.infrastructure.database.partitioning import visit_date_filters
+from core.infrastructure.models.promoter_daily_stats_model import (
+    PromoterDailyStats,
+)
+from core.infrastructure.models.visit_model import VisitModel
+
+# Campo do contador de cada status de visita
+STATUS_FIELDS = {1: "pending", 2: "in_progress", 3: "completed", 4: "cancelled"}
+COUNTER_FIELDS = (*STATUS_FIELDS.values(), "total_value")
+
+ZERO = Decimal("0.00")
+# Dias (promotor, data) atualizados por UPDATE
+UPDATE_BATCH_SIZE = 500
+
+
+class VisitState(NamedTuple):
+    """O que uma visita soma nos contadores"""
+    promoter_id: int
+    visit_date: date
+    status: int
+    price: Optional[Decimal]
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+class PromoterStatsRepository:
+    """
+    Contadores diários por promotor (PromoterDailyStats), atualizados com
+    F() na mesma transação da escrita das visitas.
+    """
+
+    @staticmethod
+    def state(visit: VisitModel) -> VisitState:
+        return VisitState(
+            visit.promoter_id,
+            _as_date(visit.visit_date),
+            int(visit.status),
+            visit.price,
+        )
+
+    @staticmethod
+    def apply(
+        removed: Iterable[VisitState] = (),
+        added: Iterable[VisitState] = ()
+    ) -> None:
+        """
+        Desconta as visitas removidas (ou o estado anterior das alteradas)
+        e soma as adicionadas. Deve rodar na transação da escrita.
+        """
+        deltas = defaultdict(lambda: defaultdict(int))
+        for sign, states in ((-1, removed), (1, added)):
+            for state in states:
+                delta = deltas[(state.promoter_id, _as_date(state.visit_date))]
+                delta[STATUS_FIELDS[state.status]] += sign
+                delta["total_value"] += sign * (state.price or ZERO)
+        PromoterStatsRepository._apply_deltas(deltas)
+
+    @staticmethod
+    def remove_visits(queryset) -> List[date]:
+        """
+        Desconta as visitas do queryset com uma consulta agrupada, antes de
+        removê-las em massa (remoções em cascata de marcas e lojas, admin).
+        Deve rodar na transação da remoção.
+
+        Returns:
+            List[date]: Datas das visitas descontadas
+        """
+        counters = PromoterStatsRepository._aggregate(queryset)
+        PromoterStatsRepository._apply_deltas({
+            key: {field: -value for field, value in row.items()}
+            for key, row in counters.items()
+        })
+        return sorted({day for _, day in counters})
+
+    @staticmethod
+    def _apply_deltas(deltas: Dict) -> None:
+        deltas = {
+            key: {field: value for field, value in delta.items() if value}
+            for key, delta in deltas.items()
+        }
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        with transaction.atomic():
+            # Garante a linha do dia; a atualização é sempre relativa
+            PromoterDailyStats.objects.bulk_create(
+                [
+                    PromoterDailyStats(promoter_id=promoter_id, date=day)
+                    for promoter_id, day in deltas
+                ],
+                ignore_conflicts=True,
+            )
+            keys = list(deltas)
+            for offset in range(0, len(keys), UPDATE_BATCH_SIZE):
+                PromoterStatsRepository._update_batch({
+                    key: deltas[key]
+                    for key in keys[offset:offset + UPDATE_BATCH_SIZE]
+                })
+
+    @staticmethod
+    def _update_batch(deltas: Dict) -> None:
+        """Um único UPDATE com o incremento de cada dia num CASE"""
+        conditions = {
+            key: Q(promoter_id=key[0], date=key[1]) for key in deltas
+        }
+        fields = {field for delta in deltas.values() for field in delta}
+        updates = {}
+        for field in fields:
+            output_field = (
+                DecimalField(max_digits=14, decimal_places=2)
+                if field == "total_value" else IntegerField()
+            )
+            whens = [
+                When(conditions[key], then=Value(delta[field]))
+                for key, delta in deltas.items() if field in delta
+            ]
+            updates[field] = F(field) + Case(
+                *whens, default=Value(0), output_field=output_field)
+        PromoterDailyStats.objects.filter(
+            reduce(or_, conditions.values())).update(**updates)
+
+    @staticmethod
+    def totals(promoter_id: int, start_date: date, end_date: date) -> Dict:
+        """Soma dos contadores do promotor no intervalo (inclusivo)"""
+        return PromoterStatsRepository.summary(
+            promoter_id, {"period": (start_date, end_date)})["period"]
+
+    @staticmethod
+    def summary(promoter_id: int, periods: Dict[str, Tuple[date, date]]) -> Dict:
+        """
+        Totais do promotor em vários períodos com uma única consulta.
+
+        Args:
+            periods: Intervalos (início, fim) por nome
+        """
+        start = min(period_start for period_start, _ in periods.values())
+        end = max(period_end for _, period_end in periods.values())
+        rows = list(PromoterDailyStats.objects.filter(
+            promoter_id=promoter_id, date__gte=start, date__lte=end
+        ).values("date", *COUNTER_FIELDS))
+
+        summary = {}
+        for name, (period_start, period_end) in periods.items():
+            totals = {field: 0 for field in STATUS_FIELDS.values()}
+            totals["total_value"] = ZERO
+            for row in rows:
+                if period_start <= row["date"] <= period_end:
+                    for field in COUNTER_FIELDS:
+                        totals[field] += row[field]
+            totals["total_visits"] = sum(
+                totals[field] for field in STATUS_FIELDS.values())
+            summary[name] = totals
+        return summary
+
+    # Conciliação com as visitas
+
+    @staticmethod
+    def _expected(start_date=None, end_date=None) -> Dict:
+        """Contadores calculados a partir das visitas do intervalo"""
+        return PromoterStatsRepository._aggregate(VisitModel.objects.filter(
+            **visit_date_filters(start_date, end_date)))
+
+    @staticmethod
+    def _aggregate(queryset) -> Dict:
+        """Contadores das visitas do queryset por (promotor, dia)"""
+        rows = queryset.values("promoter_id", "visit_date").annotate(
+            **{
+                field: Count("id", filter=Q(status=status))
+                for status, field in STATUS_FIELDS.items()
+            },
+            total_value=Coalesce(
+                Sum("price"),
+                Value(ZERO),
+                output_field=DecimalField(max_digits=14, decimal_places=2)
+            ),
+        ).order_by()
+        return {
+            (row["promoter_id"], row["visit_date"]): {
+                field: row[field] for field in COUNTER_FIELDS
+            }
+            for row in rows
+        }
+
+    @staticmethod
+    def _stats_in_range(start_date=None, end_date=None):
+        queryset = PromoterDailyStats.objects.all()
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+        return queryset
+
+    @staticmethod
+    def _stored(start_date=None, end_date=None) -> Dict:
+        queryset = PromoterStatsRepository._stats_in_range(
+            start_date, end_date)
+        return {
+            (row["promoter_id"], row["date"]): {
+                field: row[field] for field in COUNTER_FIELDS
+            }
+            for row in queryset.values("promoter_id", "date", *COUNTER_FIELDS)
+        }
+
+    @staticmethod
+    def drift(start_date=None, end_date=None) -> List[Dict]:
+        """
+        Dias em que os contadores divergem das visitas.
+
+        Returns:
+            List[Dict]: promoter_id, date, stored e expected
+        """
+        empty = {field: 0 for field in COUNTER_FIELDS}
+        expected = PromoterStatsRepository._expected(start_date, end_date)
+        stored = PromoterStatsRepository._stored(start_date, end_date)
+        drift = []
+        for key in sorted(expected.keys() | stored.keys()):
+            stored_row = stored.get(key, empty)
+            expected_row = expected.get(key, empty)
+            if stored_row != expected_row:
+                drift.append({
+                    "promoter_id": key[0],
+                    "date": key[1],
+                    "stored": stored_row,
+                    "expected": expected_row,
+                })
+        return drift
+
+    @staticmethod
+    def rebuild(start_date=None, end_date=None) -> int:
+        """
+        Recalcula os contadores do intervalo a partir das visitas.
+
+        Returns:
+            int: Quantidade de linhas gravadas
+        """
+        expected = PromoterStatsRepository._expected(start_date, end_date)
+        with transaction.atomic():
+            PromoterStatsRepository._stats_in_range(
+                start_date, end_date).delete()
+            PromoterDailyStats.objects.bulk_create(
+                [
+                    PromoterDailyStats(
+                        promoter_id=promoter_id, date=day, **counters)
+                    for (promoter_id, day), counters in expected.items()
+                ],
+                batch_size=1_000,
+            )
+        return len(expected)
@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+from typing import Dict
+from django.db import transaction
+from django.db.models import Count
+from core.infrastructure.cache.dashboard_cache import DashboardCache
+from core.infrastructure.domain.use_cases.schedule_generator import (
+    generate_schedule,
+)
+from core.infrastructure.models.promoter_brand_model import PromoterBrand
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.models.visit_price_model import VisitPriceModel
+from core.infrastructure.repositories.planning_repository import (
+    PlanningRepository,
+)
+from core.infrastructure.repositories.promoter_stats_repository import (
+    PromoterStatsRepository,
+)
+
+
+class ScheduleRepository:
+    """
+    Gera e grava a agenda semanal de visitas pendentes a partir da matriz
+    marca x loja (BrandStore) e dos vínculos promotor-marca.
+    """
+
+    BATCH_SIZE = 1_000
+    # Visitas sem promotor listadas na resposta (o total vem à parte)
+    UNASSIGNED_LIMIT = 100
+
+    @staticmethod
+    def generate_week(
+        week_start: date,
+        max_visits_per_day: int = 10,
+        workdays: int = 6,
+        dry_run: bool = False
+    ) -> Dict:
+        """
+        Planeja a semana de week_start (ajustada para a segunda-feira) e
+        cria as visitas pendentes em lote.
+
+        As visitas já existentes na semana (exceto canceladas) contam:
+        reduzem a quantidade a agendar da loja/marca e ocupam a agenda do
+        promotor. Executar de novo agenda apenas o que faltar.
+
+        Args:
+            week_start: Qualquer data da semana planejada
+            max_visits_per_day: Limite de visitas de um promotor por dia
+            workdays: Dias úteis a partir da segunda-feira (1 a 7)
+            dry_run: Apenas calcula o plano, sem gravar
+        """
+        monday = week_start - timedelta(days=week_start.weekday())
+        days = [monday + timedelta(days=offset) for offset in range(workdays)]
+        week_visits = VisitModel.objects.filter(
+            visit_date__gte=monday,
+            visit_date__lte=monday + timedelta(days=6),
+        ).exclude(status=4).order_by()
+
+        promoters_by_brand = {}
+        for brand_id, promoter_id in PromoterBrand.objects.filter(
+            promoter__role=1, promoter__is_active=True
+        ).values_list("brand_id", "promoter_id").order_by():
+            promoters_by_brand.setdefault(brand_id, []).append(promoter_id)
+
+        schedule = generate_schedule(
+            days,
+            PlanningRepository.get_matrix()["matrix"],
+            promoters_by_brand,
+            max_visits_per_day,
+            scheduled={
+                (row["brand_id"], row["store_id"]): row["count"]
+                for row in week_visits.values(
+                    "brand_id", "store_id").annotate(count=Count("id"))
+            },
+            existing_load={
+                (row["promoter_id"], row["visit_date"]): row["count"]
+                for row in week_visits.values(
+                    "promoter_id", "visit_date").annotate(count=Count("id"))
+            },
+        )
+
+        if not dry_run and schedule.visits:
+            # Preço congelado na criação, como em DjangoVisitRepository
+            prices = {
+                (store_id, brand_id): price
+                for store_id, brand_id, price in VisitPriceModel.objects.filter(
+                    brand_id__in={visit.brand_id for visit in schedule.visits}
+                ).values_list("store_id", "brand_id", "price")
+            }
+            visits = [
+                VisitModel(
+                    promoter_id=visit.promoter_id,
+                    store_id=visit.store_id,
+                    brand_id=visit.brand_id,
+                    visit_date=visit.visit_date,
+                    status=1,
+                    price=prices.get((visit.store_id, visit.brand_id)),
+                )
+                for visit in schedule.visits
+            ]
+            with transaction.atomic():
+                VisitModel.objects.bulk_create(
+                    visits, batch_size=ScheduleRepository.BATCH_SIZE)
+                PromoterStatsRepository.apply(
+                    added=map(PromoterStatsRepository.state, visits))
+            DashboardCache.invalidate_dates(days)
+
+        loads = list(schedule.load.values()) or [0]
+        return {
+            "week_start": monday,
+            "days": len(days),
+            "dry_run": dry_run,
+            "scheduled": len(schedule.visits),
+            "unassigned": len(schedule.unassigned),
+            "promoters": len(schedule.load),
+            "min_load": min(loads),
+            "max_load": max(loads),
+            "unassigned_visits": [
+                {
+                    "store_id": visit.store_id,
+                    "brand_id": visit.brand_id,
+                    "visit_date": visit.visit_date,
+                }
+                for visit in schedule.unassigned[
+                    :ScheduleRepository.UNASSIGNED_LIMIT]
+            ],
+        }
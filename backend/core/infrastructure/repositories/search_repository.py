@@ -0,0 +1,172 @@
+from functools import reduce
+from operator import add, and_, or_
+from typing import Dict, Iterable, List
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+from core.infrastructure.database.search import (
+    SEARCH_CONFIG,
+    SEARCH_TARGETS,
+    SearchTarget,
+)
+
+ROLE_NAMES = {1: "Promotor", 2: "Analista", 3: "Gestor"}
+
+
+def _store_result(row: Dict) -> Dict:
+    number = f" - {row['number']}" if row["number"] else ""
+    return {
+        "label": f"{row['name']}{number}",
+        "detail": f"{row['city']}/{row['state']}",
+    }
+
+
+def _brand_result(row: Dict) -> Dict:
+    return {"label": row["name"], "detail": ""}
+
+
+def _user_result(row: Dict) -> Dict:
+    return {
+        "label": f"{row['first_name']} {row['last_name']}".strip(),
+        "detail": ROLE_NAMES.get(row["role"], ""),
+    }
+
+
+# Colunas lidas e montagem do resultado de cada tabela
+RESULT_FORMATS = {
+    "stores": (("name", "number", "city", "state"), _store_result),
+    "brands": (("name",), _brand_result),
+    "users": (("first_name", "last_name", "role"), _user_result),
+}
+
+
+def _rank_expression(word: str, fields) -> Greatest:
+    """Versão em SQL do _text_score (inteira), para escolher os candidatos
+    antes do limite"""
+    def field_rank(field):
+        return Case(
+            When(**{f"{field}__iexact": word}, then=Value(4)),
+            When(**{f"{field}__istartswith": word}, then=Value(3)),
+            When(**{f"{field}__icontains": f" {word}"}, then=Value(2)),
+            When(**{f"{field}__icontains": word}, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    if len(fields) == 1:
+        return field_rank(fields[0])
+    return Greatest(*(field_rank(field) for field in fields))
+
+
+def _text_score(word: str, value) -> float:
+    """Relevância de uma palavra num texto, para a busca sem PostgreSQL"""
+    value = str(value or "").lower()
+    if value == word:
+        return 1.0
+    if value.startswith(word):
+        return 0.8
+    if any(part.startswith(word) for part in value.split()):
+        return 0.6
+    if word in value:
+        return 0.4
+    return 0.0
+
+
+class SearchRepository:
+    """
+    Busca em lojas, marcas e usuários com os k resultados mais relevantes.
+
+    No PostgreSQL usa a similaridade de trigramas (pg_trgm, tolera erros
+    de digitação) e o full-text (tsvector), servidos pelos índices do
+    comando search_indexes. Nos demais bancos (SQLite) filtra com
+    icontains e ordena em Python um número limitado de candidatos.
+    """
+
+    # Candidatos lidos por tabela na busca sem PostgreSQL
+    FALLBACK_CANDIDATES = 200
+
+    @staticmethod
+    def search(term: str, targets: Iterable[str], limit: int = 10) -> Dict:
+        """
+        Args:
+            term: Texto pesquisado
+            targets: Tabelas pesquisadas (chaves de SEARCH_TARGETS)
+            limit: Resultados por tabela
+
+        Returns:
+            Dict: Lista de resultados (id, label, detail, score) por tabela
+        """
+        term = " ".join(term.split())
+        search = (
+            SearchRepository._postgres
+            if connection.vendor == "postgresql"
+            else SearchRepository._fallback
+        )
+        results = {}
+        for name in targets:
+            columns, build = RESULT_FORMATS[name]
+            rows = search(SEARCH_TARGETS[name], term, columns, limit)
+            results[name] = [
+                {
+                    "id": row["id"],
+                    **build(row),
+                    "score": round(float(row["score"] or 0), 4),
+                }
+                for row in rows
+            ]
+        return results
+
+    @staticmethod
+    def _postgres(
+        target: SearchTarget, term: str, columns, limit: int
+    ) -> List[Dict]:
+        query = SearchQuery(
+            term, config=SEARCH_CONFIG, search_type="websearch")
+        matches = Q(document=query) | reduce(or_, (
+            Q(TrigramWordSimilar(F(field), term)) for field in target.fields
+        ))
+        return list(
+            target.model.objects.alias(document=target.document())
+            .filter(matches)
+            .annotate(score=Greatest(
+                SearchRank(F("document"), query),
+                *(TrigramWordSimilarity(term, field)
+                  for field in target.fields)
+            ))
+            .order_by("-score", "id")
+            .values("id", "score", *columns)[:limit]
+        )
+
+    @staticmethod
+    def _fallback(
+        target: SearchTarget, term: str, columns, limit: int
+    ) -> List[Dict]:
+        # Cada palavra precisa aparecer em alguma das colunas
+        words = term.lower().split()
+        matches = reduce(and_, (
+            reduce(or_, (
+                Q(**{f"{field}__icontains": word}) for field in target.fields
+            ))
+            for word in words
+        ))
+        # Os candidatos mais relevantes primeiro, para que o limite não
+        # descarte os melhores resultados
+        rank = reduce(add, (
+            _rank_expression(word, target.fields) for word in words
+        ))
+        rows = list(
+            target.model.objects.filter(matches)
+            .annotate(rank=rank)
+            .order_by("-rank", "id")
+            .values("id", *set(columns) | set(target.fields))
+            [:SearchRepository.FALLBACK_CANDIDATES]
+        )
+        for row in rows:
+            row["score"] = sum(
+                max(_text_score(word, row[field]) for field in target.fields)
+                for word in words
+            ) / len(words)
+        rows.sort(key=lambda row: (-row["score"], row["id"]))
+        return rows[:limit]
@@ -0,0 +1,97 @@
+import io
+import os
+from typing import Dict, Iterable, List, Optional
+import pandas as pd
+
+
+class SpreadsheetImportError(Exception):
+    """Arquivo de importação ilegível ou fora do formato esperado"""
+
+
+# Primeira linha de dados na planilha (a linha 1 é o cabeçalho)
+FIRST_DATA_ROW = 2
+
+
+def read_spreadsheet(
+    uploaded_file,
+    required_columns: List[str],
+    optional_columns: Iterable[str] = (),
+    aliases: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Lê um arquivo CSV ou XLSX enviado como texto.
+
+    O separador do CSV é detectado automaticamente (vírgula ou ponto e
+    vírgula, comum em planilhas exportadas no Brasil) e os cabeçalhos são
+    normalizados pelos apelidos informados.
+
+    Args:
+        uploaded_file: Arquivo enviado
+        required_columns: Colunas obrigatórias
+        optional_columns: Colunas opcionais (preenchidas com "" se ausentes)
+        aliases: Apelidos de cabeçalho {apelido: coluna}
+
+    Returns:
+        pd.DataFrame: Apenas as colunas pedidas, com os valores sem espaços
+
+    Raises:
+        SpreadsheetImportError: Formato não suportado, arquivo ilegível ou
+            colunas obrigatórias ausentes
+    """
+    aliases = aliases or {}
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    try:
+        if extension == ".csv":
+            dataframe = pd.read_csv(
+                io.TextIOWrapper(uploaded_file, encoding="utf-8-sig"),
+                dtype=str, keep_default_na=False,
+                sep=None, engine="python"
+            )
+        elif extension in (".xlsx", ".xls"):
+            dataframe = pd.read_excel(
+                uploaded_file, dtype=str, keep_default_na=False)
+        else:
+            raise SpreadsheetImportError(
+                "Formato não suportado. Envie um arquivo .csv ou .xlsx.")
+    except SpreadsheetImportError:
+        raise
+    except Exception as e:
+        raise SpreadsheetImportError(f"Não foi possível ler o arquivo: {e}")
+
+    dataframe.columns = [
+        aliases.get(str(column).strip().lower(), str(column).strip().lower())
+        for column in dataframe.columns
+    ]
+    missing = [
+        column for column in required_columns
+        if column not in dataframe.columns
+    ]
+    if missing:
+        raise SpreadsheetImportError(
+            f"Colunas obrigatórias ausentes: {', '.join(missing)}")
+
+    optional_columns = list(optional_columns)
+    for column in optional_columns:
+        if column not in dataframe.columns:
+            dataframe[column] = ""
+
+    columns = list(required_columns) + optional_columns
+    return dataframe[columns].fillna("").astype(str).apply(
+        lambda column: column.str.strip())
+
+
+def error_report(errors: Dict[int, List[str]]) -> List[Dict]:
+    """
+    Relatório de erros por linha, no formato devolvido pelas importações.
+
+    Args:
+        errors: {posição da linha no arquivo (0 = primeira linha de dados):
+            [mensagens]}
+
+    Returns:
+        List: [{"row": linha na planilha, "errors": [mensagens]}]
+    """
+    return [
+        {"row": int(position) + FIRST_DATA_ROW, "errors": messages}
+        for position, messages in sorted(errors.items())
+    ]
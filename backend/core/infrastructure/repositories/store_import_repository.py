@@ -0,0 +1,169 @@
+from typing import Dict, List, Tuple
+import pandas as pd
+from django.db import transaction
+from core.infrastructure.cache.autocomplete_index import autocomplete_index
+from core.infrastructure.models.state_model import StateChoices
+from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.repositories.spreadsheet_import import (
+    error_report,
+    read_spreadsheet,
+)
+from core.infrastructure.validators.cnpj_validator import (
+    normalize_cnpjs,
+    validate_cnpjs,
+)
+
+
+class StoreImportRepository:
+    """
+    Importação de lojas em lote a partir de planilhas CSV/XLSX.
+
+    Toda a validação é feita sobre colunas inteiras (pandas/numpy): dígitos
+    verificadores do CNPJ, duplicidade dentro do arquivo e duplicidade no
+    banco, esta última com uma única consulta. As linhas válidas são
+    inseridas com bulk_create em lotes.
+    """
+
+    REQUIRED_COLUMNS = ["name", "city", "state"]
+    OPTIONAL_COLUMNS = ["number", "cnpj"]
+    # Cabeçalhos aceitos em português
+    COLUMN_ALIASES = {
+        "nome": "name",
+        "numero": "number",
+        "número": "number",
+        "cidade": "city",
+        "estado": "state",
+        "uf": "state",
+    }
+    CHUNK_SIZE = 1000
+    # Limites das colunas do StoreModel (IntegerField é de 32 bits)
+    NAME_MAX_LENGTH = StoreModel._meta.get_field("name").max_length
+    CITY_MAX_LENGTH = StoreModel._meta.get_field("city").max_length
+    NUMBER_RANGE = (-2 ** 31, 2 ** 31 - 1)
+
+    @staticmethod
+    def read_file(uploaded_file) -> pd.DataFrame:
+        """Lê o arquivo enviado (CSV ou XLSX) como texto"""
+        return read_spreadsheet(
+            uploaded_file,
+            StoreImportRepository.REQUIRED_COLUMNS,
+            StoreImportRepository.OPTIONAL_COLUMNS,
+            StoreImportRepository.COLUMN_ALIASES,
+        )
+
+    @staticmethod
+    def validate(dataframe: pd.DataFrame) -> Tuple[pd.DataFrame, List[Dict]]:
+        """
+        Valida todas as linhas de uma vez.
+
+        Returns:
+            Tuple: (linhas válidas normalizadas, relatório de erros por linha)
+        """
+        errors = pd.DataFrame(index=dataframe.index)
+
+        errors["name"] = dataframe["name"].eq("")
+        errors["name_length"] = dataframe["name"].str.len().gt(
+            StoreImportRepository.NAME_MAX_LENGTH)
+        errors["city"] = dataframe["city"].eq("")
+        errors["city_length"] = dataframe["city"].str.len().gt(
+            StoreImportRepository.CITY_MAX_LENGTH)
+
+        states = dataframe["state"].str.upper()
+        errors["state"] = ~states.isin(StateChoices.values)
+
+        numbers = pd.to_numeric(dataframe["number"], errors="coerce")
+        errors["number"] = dataframe["number"].ne("") & (
+            numbers.isna() | (numbers % 1 != 0))
+        minimum, maximum = StoreImportRepository.NUMBER_RANGE
+        errors["number_range"] = numbers.notna() & ~numbers.between(
+            minimum, maximum)
+
+        cnpjs = normalize_cnpjs(dataframe["cnpj"])
+        has_cnpj = cnpjs.ne("")
+        errors["cnpj"] = has_cnpj & ~validate_cnpjs(cnpjs)
+
+        errors["cnpj_file"] = has_cnpj & cnpjs.duplicated(keep=False)
+
+        # Uma única consulta para todos os CNPJs do arquivo
+        existing = set(
+            StoreModel.objects.filter(
+                cnpj__in=set(cnpjs[has_cnpj])
+            ).values_list("cnpj", flat=True)
+        )
+        errors["cnpj_db"] = cnpjs.isin(existing)
+
+        messages = {
+            "name": "Nome é obrigatório.",
+            "name_length": (
+                f"Nome deve ter no máximo "
+                f"{StoreImportRepository.NAME_MAX_LENGTH} caracteres."
+            ),
+            "city": "Cidade é obrigatória.",
+            "city_length": (
+                f"Cidade deve ter no máximo "
+                f"{StoreImportRepository.CITY_MAX_LENGTH} caracteres."
+            ),
+            "state": "Estado inválido.",
+            "number": "Número da loja deve ser um inteiro.",
+            "number_range": "Número da loja fora do intervalo permitido.",
+            "cnpj": "CNPJ inválido.",
+            "cnpj_file": "CNPJ duplicado no arquivo.",
+            "cnpj_db": "CNPJ já cadastrado.",
+        }
+        report = error_report({
+            position: [
+                messages[column] for column, failed in row.items() if failed
+            ]
+            for position, row in enumerate(errors.to_dict("records"))
+            if any(row.values())
+        })
+
+        is_valid = ~errors.any(axis=1)
+        valid = dataframe[is_valid].assign(
+            state=states[is_valid],
+            number=numbers[is_valid].astype("Int64"),
+            cnpj=cnpjs[is_valid],
+        )
+        return valid, report
+
+    @staticmethod
+    def bulk_create(dataframe: pd.DataFrame, chunk_size: int = CHUNK_SIZE) -> int:
+        """Insere as lojas válidas em lotes, numa única transação"""
+        stores = [
+            StoreModel(
+                name=row.name,
+                number=None if pd.isna(row.number) else int(row.number),
+                city=row.city,
+                state=row.state,
+                cnpj=row.cnpj or None,
+            )
+            for row in dataframe.itertuples(index=False)
+        ]
+        with transaction.atomic():
+            for start in range(0, len(stores), chunk_size):
+                StoreModel.objects.bulk_create(
+                    stores[start:start + chunk_size])
+        # bulk_create não dispara os sinais que atualizam o autocomplete
+        autocomplete_index.invalidate()
+        return len(stores)
+
+    @staticmethod
+    def import_stores(uploaded_file, dry_run: bool = False) -> Dict:
+        """
+        Lê, valida e importa as lojas do arquivo.
+
+        As linhas com erro são ignoradas e descritas no relatório; as demais
+        são inseridas (a menos que dry_run seja verdadeiro).
+        """
+        dataframe = StoreImportRepository.read_file(uploaded_file)
+        valid, report = StoreImportRepository.validate(dataframe)
+        created = 0
+        if not dry_run and not valid.empty:
+            created = StoreImportRepository.bulk_create(valid)
+        return {
+            "total_rows": len(dataframe),
+            "valid_rows": len(valid),
+            "created": created,
+            "dry_run": dry_run,
+            "errors": report,
+        }
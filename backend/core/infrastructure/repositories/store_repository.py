@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional
+from django.db.models import Count, Exists, OuterRef, QuerySet
+from core.infrastructure.models.brand_model import BrandStore
+from core.infrastructure.models.state_model import StateChoices
+from core.infrastructure.models.store_model import StoreModel
+
+# Colunas devolvidas na listagem (as mesmas de STORE_LIST_PROJECTION)
+STORE_LIST_FIELDS = ("id", "name", "number", "city", "state", "cnpj")
+
+
+class StoreFilters:
+    """
+    Filtros da listagem de lojas (estado, cidade e marca).
+
+    Cada faceta é contada com os demais filtros, mas sem o seu próprio:
+    filtrando por SP, a faceta de estados continua mostrando quantas lojas
+    há nos outros estados.
+    """
+
+    def __init__(
+        self,
+        state: Optional[str] = None,
+        city: Optional[str] = None,
+        brand_id: Optional[int] = None
+    ):
+        self.state = state
+        self.city = city
+        self.brand_id = brand_id
+
+    @classmethod
+    def from_query_params(cls, query_params) -> "StoreFilters":
+        """
+        Raises:
+            ValueError: Estado ou marca inválidos
+        """
+        state = (query_params.get("state") or "").strip().upper() or None
+        if state and state not in StateChoices.values:
+            raise ValueError(f"Estado inválido: {state}.")
+
+        brand_id = query_params.get("brand")
+        if brand_id:
+            try:
+                brand_id = int(brand_id)
+            except ValueError:
+                raise ValueError("brand deve ser o ID da marca.")
+
+        city = (query_params.get("city") or "").strip() or None
+        return cls(state=state, city=city, brand_id=brand_id or None)
+
+    def apply(self, queryset: QuerySet, exclude: str = None) -> QuerySet:
+        """Aplica os filtros, exceto o indicado em exclude"""
+        if self.state and exclude != "state":
+            queryset = queryset.filter(state=self.state)
+        if self.city and exclude != "city":
+            queryset = queryset.filter(city__iexact=self.city)
+        if self.brand_id:
+            # EXISTS em vez de JOIN: sem linhas duplicadas
+            queryset = queryset.filter(Exists(BrandStore.objects.filter(
+                store_id=OuterRef("pk"), brand_id=self.brand_id)))
+        return queryset
+
+
+class StoreRepository:
+    """
+    Consultas da listagem de lojas
+    """
+
+    # Cidades listadas na faceta (as com mais lojas)
+    CITY_FACET_LIMIT = 100
+
+    @staticmethod
+    def list(filters: StoreFilters) -> QuerySet:
+        return filters.apply(StoreModel.objects.all()).values(
+            *STORE_LIST_FIELDS)
+
+    @staticmethod
+    def facets(filters: StoreFilters) -> Dict[str, List[Dict]]:
+        """Lojas por estado e por cidade, com uma consulta agrupada cada"""
+        labels = dict(StateChoices.choices)
+        states = filters.apply(
+            StoreModel.objects.all(), exclude="state"
+        ).values("state").annotate(count=Count("id")).order_by(
+            "-count", "state")
+        cities = filters.apply(
+            StoreModel.objects.all(), exclude="city"
+        ).values("city", "state").annotate(count=Count("id")).order_by(
+            "-count", "city", "state")[:StoreRepository.CITY_FACET_LIMIT]
+        return {
+            "state": [
+                {
+                    "value": row["state"],
+                    "label": labels.get(row["state"], row["state"]),
+                    "count": row["count"],
+                }
+                for row in states
+            ],
+            "city": [
+                {
+                    "value": row["city"],
+                    "state": row["state"],
+                    "count": row["count"],
+                }
+                for row in cities
+            ],
+        }
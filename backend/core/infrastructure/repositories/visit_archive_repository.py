@@ -0,0 +1,339 @@
+import json
+import logging
+import os
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+import pandas as pd
+from django.conf import settings
+from django.db import transaction
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.cache.dashboard_cache import DashboardCache
+from core.infrastructure.database.partitioning import add_months, month_start
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.serializers.visit_serializer import (
+    VISIT_REPORT_PROJECTION,
+    _full_name,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:  # pragma: no cover - dependência opcional
+    PARQUET_AVAILABLE = False
+
+DEFAULTS = {
+    "DIRECTORY": "archive",
+    # "parquet", "csv" (CSV gzip) ou "auto" (parquet se o pyarrow estiver
+    # instalado)
+    "FORMAT": "auto",
+}
+
+EXTENSIONS = {"parquet": ".parquet", "csv": ".csv.gz"}
+
+# Colunas gravadas (as de VISIT_REPORT_PROJECTION, sem as calculadas).
+# Os nomes de promotor, loja e marca são os vigentes no arquivamento.
+COLUMNS = VISIT_REPORT_PROJECTION.keys
+
+
+def get_archive_config():
+    """Configuração VISIT_ARCHIVE mesclada com os valores padrão"""
+    return {**DEFAULTS, **getattr(settings, "VISIT_ARCHIVE", {})}
+
+
+class VisitArchiveRepository:
+    """
+    Arquivo frio das visitas antigas em arquivos mensais compactados
+    (Parquet ou CSV gzip) no disco local.
+
+    A marca d'água (archived_before) separa os dados: visitas anteriores a
+    ela são lidas apenas dos arquivos; as demais, apenas do banco. Assim um
+    arquivamento interrompido antes de remover as linhas do banco não gera
+    duplicidade, e basta executá-lo de novo.
+    """
+
+    WATERMARK_FILE = "watermark.json"
+    DELETE_BATCH_SIZE = 5_000
+
+    @staticmethod
+    def directory() -> str:
+        return get_archive_config()["DIRECTORY"]
+
+    @staticmethod
+    def file_format() -> str:
+        file_format = get_archive_config()["FORMAT"]
+        if file_format == "auto":
+            return "parquet" if PARQUET_AVAILABLE else "csv"
+        return file_format
+
+    @staticmethod
+    def _month_path(month: date, file_format: str) -> str:
+        return os.path.join(
+            VisitArchiveRepository.directory(),
+            f"visits_{month:%Y_%m}{EXTENSIONS[file_format]}"
+        )
+
+    @staticmethod
+    def _write_atomic(path: str, write) -> None:
+        """Grava num arquivo temporário e o move para o destino"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(descriptor)
+        try:
+            write(temporary)
+            os.replace(temporary, path)
+        except Exception:
+            os.remove(temporary)
+            raise
+
+    # Marca d'água
+
+    @staticmethod
+    def watermark() -> Optional[date]:
+        """Data a partir da qual as visitas estão no banco (None: nenhuma
+        visita arquivada)"""
+        path = os.path.join(
+            VisitArchiveRepository.directory(),
+            VisitArchiveRepository.WATERMARK_FILE
+        )
+        try:
+            with open(path) as file:
+                return date.fromisoformat(json.load(file)["archived_before"])
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _set_watermark(cutoff: date) -> None:
+        path = os.path.join(
+            VisitArchiveRepository.directory(),
+            VisitArchiveRepository.WATERMARK_FILE
+        )
+
+        def write(temporary):
+            with open(temporary, "w") as file:
+                json.dump({
+                    "archived_before": cutoff.isoformat(),
+                    "updated_at": datetime.now().isoformat(),
+                }, file)
+
+        VisitArchiveRepository._write_atomic(path, write)
+
+    # Leitura e gravação dos arquivos mensais
+
+    @staticmethod
+    def _read_month(month: date) -> Optional[pd.DataFrame]:
+        """Linhas de um mês como texto (None se o mês não foi arquivado)"""
+        for file_format in EXTENSIONS:
+            path = VisitArchiveRepository._month_path(month, file_format)
+            if not os.path.exists(path):
+                continue
+            if file_format == "parquet":
+                return pd.read_parquet(path).astype(str)
+            return pd.read_csv(
+                path, compression="gzip", dtype=str, keep_default_na=False)
+        return None
+
+    @staticmethod
+    def _write_month(month: date, frame: pd.DataFrame) -> str:
+        file_format = VisitArchiveRepository.file_format()
+        path = VisitArchiveRepository._month_path(month, file_format)
+        if file_format == "parquet":
+            VisitArchiveRepository._write_atomic(
+                path, lambda temporary: frame.to_parquet(
+                    temporary, index=False, compression="zstd"))
+        else:
+            VisitArchiveRepository._write_atomic(
+                path, lambda temporary: frame.to_csv(
+                    temporary, index=False, compression="gzip"))
+
+        # Um mês reescrito em outro formato não deve ser lido duas vezes
+        for other_format in EXTENSIONS:
+            other = VisitArchiveRepository._month_path(month, other_format)
+            if other != path and os.path.exists(other):
+                os.remove(other)
+        return path
+
+    @staticmethod
+    def _to_frame(rows: List[Dict]) -> pd.DataFrame:
+        """Linhas de VISIT_REPORT_PROJECTION como texto, sem perda no preço"""
+        frame = pd.DataFrame(rows, columns=COLUMNS)
+        frame["visit_date"] = frame["visit_date"].map(date.isoformat)
+        frame["store_number"] = frame["store_number"].map(
+            lambda number: "" if number is None else str(number))
+        frame["price"] = frame["price"].map(str)
+        return frame.fillna("").astype(str)
+
+    @staticmethod
+    def archive_month(month: date) -> int:
+        """
+        Grava as visitas do mês no arquivo mensal, mesclando com o arquivo
+        existente (visitas do mesmo id são substituídas).
+
+        Returns:
+            int: Quantidade de visitas do banco gravadas
+        """
+        queryset = VisitModel.objects.filter(
+            visit_date__gte=month,
+            visit_date__lt=add_months(month, 1)
+        ).order_by("id")
+        rows = VISIT_REPORT_PROJECTION.project(queryset)
+        if not rows:
+            return 0
+
+        frame = VisitArchiveRepository._to_frame(rows)
+        existing = VisitArchiveRepository._read_month(month)
+        if existing is not None:
+            frame = pd.concat([existing[COLUMNS], frame]).drop_duplicates(
+                subset="id", keep="last")
+        VisitArchiveRepository._write_month(month, frame)
+        return len(rows)
+
+    @staticmethod
+    def delete_archived(cutoff: date, batch_size: int = DELETE_BATCH_SIZE) -> int:
+        """Remove do banco, em lotes, as visitas anteriores ao corte"""
+        deleted = 0
+        while True:
+            ids = list(
+                VisitModel.objects.filter(
+                    visit_date__lt=cutoff
+                ).order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return deleted
+            with transaction.atomic():
+                VisitModel.objects.filter(id__in=ids).delete()
+            CacheConfig.delete_many(
+                CacheConfig.get_key(CacheConfig.VISIT_PREFIX, visit_id)
+                for visit_id in ids
+            )
+            deleted += len(ids)
+
+    @staticmethod
+    def months_to_archive(cutoff: date) -> List[date]:
+        """Meses com visitas no banco anteriores ao corte"""
+        first = VisitModel.objects.filter(
+            visit_date__lt=cutoff
+        ).order_by("visit_date").values_list("visit_date", flat=True).first()
+        if first is None:
+            return []
+        months, month = [], month_start(first)
+        while month < cutoff:
+            months.append(month)
+            month = add_months(month, 1)
+        return months
+
+    # Consulta
+
+    @staticmethod
+    def read_rows(
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        promoter_id: Optional[int] = None,
+        store_id: Optional[int] = None,
+        brand_id: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Visitas arquivadas do intervalo, no formato de
+        VISIT_REPORT_PROJECTION (ordenadas por data e id, decrescentes).
+
+        Apenas os arquivos dos meses do intervalo são lidos.
+        """
+        watermark = VisitArchiveRepository.watermark()
+        if watermark is None or (start_date and start_date >= watermark):
+            return []
+
+        last = watermark if end_date is None else min(
+            watermark, add_months(month_start(end_date), 1))
+        if start_date is None:
+            # Sem data inicial: todos os meses arquivados até o fim
+            months = sorted(
+                month for month in (
+                    date(int(name[7:11]), int(name[12:14]), 1)
+                    for name in os.listdir(VisitArchiveRepository.directory())
+                    if name.startswith("visits_")
+                )
+                if month < last
+            )
+        else:
+            months, month = [], month_start(start_date)
+            while month < last:
+                months.append(month)
+                month = add_months(month, 1)
+
+        frames = [
+            frame for frame in map(VisitArchiveRepository._read_month, months)
+            if frame is not None
+        ]
+        if not frames:
+            return []
+
+        frame = pd.concat(frames)
+        dates = pd.to_datetime(frame["visit_date"]).dt.date
+        mask = dates < watermark
+        if start_date:
+            mask &= dates >= start_date
+        if end_date:
+            mask &= dates <= end_date
+        for column, value in (("promoter_id", promoter_id),
+                              ("store_id", store_id),
+                              ("brand_id", brand_id)):
+            if value is not None:
+                mask &= frame[column].astype(int) == int(value)
+
+        frame = frame[mask].assign(visit_date=dates[mask])
+        frame = frame.sort_values(
+            ["visit_date", "id"], ascending=False,
+            key=lambda column: (
+                column.astype(int) if column.name == "id" else column)
+        )
+        return [
+            {
+                **row,
+                "id": int(row["id"]),
+                "status": int(row["status"]),
+                "promoter_id": int(row["promoter_id"]),
+                "store_id": int(row["store_id"]),
+                "brand_id": int(row["brand_id"]),
+                "store_number": (
+                    int(row["store_number"]) if row["store_number"] else None
+                ),
+                "price": Decimal(row["price"]),
+                "promoter_name": _full_name(
+                    row["promoter_first_name"], row["promoter_last_name"]),
+            }
+            for row in frame[COLUMNS].to_dict("records")
+        ]
+
+    @staticmethod
+    def archive_before(cutoff: date, log=None) -> Dict:
+        """
+        Arquiva as visitas anteriores ao corte (início de mês), avança a
+        marca d'água e remove as visitas arquivadas do banco.
+
+        Returns:
+            Dict: months, archived e deleted
+        """
+        cutoff = month_start(cutoff)
+        watermark = VisitArchiveRepository.watermark()
+        if watermark and cutoff < watermark:
+            raise ValueError(
+                f"O corte ({cutoff}) é anterior à marca d'água atual "
+                f"({watermark}).")
+
+        archived = 0
+        months = VisitArchiveRepository.months_to_archive(cutoff)
+        for month in months:
+            count = VisitArchiveRepository.archive_month(month)
+            archived += count
+            if log:
+                log(f"{month:%Y-%m}: {count} visitas arquivadas")
+
+        # A partir daqui os relatórios leem o período apenas dos arquivos
+        VisitArchiveRepository._set_watermark(cutoff)
+        deleted = VisitArchiveRepository.delete_archived(cutoff)
+        DashboardCache.invalidate_dates(months)
+        return {"months": len(months), "archived": archived, "deleted": deleted}
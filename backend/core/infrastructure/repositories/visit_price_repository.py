@@ -0,0 +1,223 @@
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.db import transaction
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.models.brand_model import BrandModel
+from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.models.visit_price_model import VisitPriceModel
+from core.infrastructure.repositories.spreadsheet_import import (
+    error_report,
+    read_spreadsheet,
+)
+
+PriceKey = Tuple[int, int]
+
+
+class VisitPriceRepository:
+    """
+    Acesso aos preços de visita por (loja, marca).
+
+    Os preços individuais ficam em cache apenas para exibição: o preço
+    congelado na visita é lido direto do VisitPriceModel (ver
+    DjangoVisitRepository). As gravações em lote fazem um
+    único INSERT ... ON CONFLICT (store_id, brand_id) DO UPDATE e limpam o
+    cache das combinações afetadas numa única operação.
+    """
+
+    PREFIX = "visit_price:"
+    BATCH_SIZE = 1000
+    # Cabeçalhos aceitos na importação por arquivo
+    COLUMN_ALIASES = {
+        "store_id": "store",
+        "loja": "store",
+        "brand_id": "brand",
+        "marca": "brand",
+        "preco": "price",
+        "preço": "price",
+        "valor": "price",
+    }
+    MAX_PRICE = Decimal("99999999.99")  # max_digits=10, decimal_places=2
+
+    @staticmethod
+    def _cache_key(store_id: int, brand_id: int) -> str:
+        return CacheConfig.get_key(
+            VisitPriceRepository.PREFIX, f"{store_id}:{brand_id}")
+
+    @staticmethod
+    def get_price(store_id: int, brand_id: int) -> Optional[Decimal]:
+        """
+        Preço configurado para a loja/marca (None se não houver), com cache
+        de curta duração. Use apenas para exibição.
+        """
+        cache_key = VisitPriceRepository._cache_key(store_id, brand_id)
+        cached = CacheConfig.get(cache_key)
+        if cached is not None:
+            # Decimal("0") representa "sem preço" no cache
+            return cached or None
+
+        price = VisitPriceModel.objects.filter(
+            store_id=store_id, brand_id=brand_id
+        ).values_list("price", flat=True).first()
+        CacheConfig.set(
+            cache_key,
+            Decimal("0") if price is None else price,
+            CacheConfig.SHORT_TIMEOUT
+        )
+        return price
+
+    @staticmethod
+    def clear_cache(pairs: Iterable[PriceKey]) -> None:
+        """Limpa o cache das combinações informadas numa única operação"""
+        keys = [
+            VisitPriceRepository._cache_key(store_id, brand_id)
+            for store_id, brand_id in pairs
+        ]
+        if keys:
+            CacheConfig.delete_many(keys)
+
+    @staticmethod
+    def find_reference_errors(items: List[Dict]) -> Dict[int, List[str]]:
+        """
+        Verifica duplicidade e existência de lojas/marcas de um lote
+        (uma consulta para lojas e outra para marcas).
+
+        Returns:
+            Dict: {posição no lote: [mensagens de erro]}
+        """
+        errors: Dict[int, List[str]] = {}
+        seen = set()
+        for position, item in enumerate(items):
+            pair = (item["store"], item["brand"])
+            if pair in seen:
+                errors.setdefault(position, []).append(
+                    "Combinação loja/marca duplicada no lote.")
+            seen.add(pair)
+
+        store_ids = set(
+            StoreModel.objects.filter(
+                id__in={item["store"] for item in items}
+            ).values_list("id", flat=True)
+        )
+        brand_ids = set(
+            BrandModel.objects.filter(
+                id__in={item["brand"] for item in items}
+            ).values_list("id", flat=True)
+        )
+        for position, item in enumerate(items):
+            if item["store"] not in store_ids:
+                errors.setdefault(position, []).append(
+                    "Loja não encontrada.")
+            if item["brand"] not in brand_ids:
+                errors.setdefault(position, []).append(
+                    "Marca não encontrada.")
+        return errors
+
+    @staticmethod
+    def bulk_upsert(items: List[Dict], batch_size: int = BATCH_SIZE) -> int:
+        """
+        Grava os preços com INSERT ... ON CONFLICT (store_id, brand_id)
+        DO UPDATE SET price numa única transação.
+
+        Args:
+            items: Lista de dicts com store, brand e price (Decimal)
+
+        Returns:
+            int: Quantidade de preços gravados
+        """
+        prices = [
+            VisitPriceModel(
+                store_id=item["store"],
+                brand_id=item["brand"],
+                price=item["price"],
+            )
+            for item in items
+        ]
+        with transaction.atomic():
+            VisitPriceModel.objects.bulk_create(
+                prices,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["store", "brand"],
+                update_fields=["price"],
+            )
+
+        VisitPriceRepository.clear_cache(
+            (item["store"], item["brand"]) for item in items)
+        return len(prices)
+
+    @staticmethod
+    def read_file(uploaded_file) -> List[Dict]:
+        """Lê o arquivo (CSV ou XLSX) como uma lista de linhas em texto"""
+        rows = read_spreadsheet(
+            uploaded_file,
+            ["store", "brand", "price"],
+            aliases=VisitPriceRepository.COLUMN_ALIASES,
+        )
+        # Aceita vírgula como separador decimal (ex: "12,50")
+        rows["price"] = rows["price"].str.replace(",", ".", regex=False)
+        return rows.to_dict("records")
+
+    @staticmethod
+    def _parse_row(row: Dict) -> Tuple[Dict, List[str]]:
+        """Converte uma linha do arquivo mantendo o preço em Decimal"""
+        item, messages = {}, []
+        for field, label in (("store", "Loja"), ("brand", "Marca")):
+            try:
+                item[field] = int(row[field])
+            except (TypeError, ValueError):
+                messages.append(f"{label} deve ser um ID inteiro.")
+        try:
+            price = Decimal(row["price"])
+            if not price.is_finite():
+                raise InvalidOperation
+        except (InvalidOperation, TypeError):
+            messages.append("Preço inválido.")
+        else:
+            if price <= 0:
+                messages.append("O preço deve ser um valor positivo.")
+            elif price.as_tuple().exponent < -2:
+                messages.append("O preço deve ter no máximo 2 casas decimais.")
+            elif price > VisitPriceRepository.MAX_PRICE:
+                messages.append("Preço acima do valor máximo.")
+            item["price"] = price
+        return item, messages
+
+    @staticmethod
+    def import_prices(uploaded_file, dry_run: bool = False) -> Dict:
+        """
+        Importa preços de um arquivo CSV/XLSX (colunas store, brand, price).
+
+        As linhas com erro são ignoradas e descritas no relatório; as demais
+        são gravadas num único upsert (a menos que dry_run seja verdadeiro).
+        """
+        rows = VisitPriceRepository.read_file(uploaded_file)
+
+        errors: Dict[int, List[str]] = {}
+        parsed: List[Tuple[int, Dict]] = []
+        for position, row in enumerate(rows):
+            item, messages = VisitPriceRepository._parse_row(row)
+            if messages:
+                errors[position] = messages
+            else:
+                parsed.append((position, item))
+
+        reference_errors = VisitPriceRepository.find_reference_errors(
+            [item for _position, item in parsed])
+        valid = []
+        for index, (position, item) in enumerate(parsed):
+            if index in reference_errors:
+                errors[position] = reference_errors[index]
+            else:
+                valid.append(item)
+
+        saved = 0
+        if not dry_run and valid:
+            saved = VisitPriceRepository.bulk_upsert(valid)
+
+        return {
+            "total_rows": len(rows),
+            "valid_rows": len(valid),
+            "saved": saved,
+            "dry_run": dry_run,
+            "errors": error_report(errors),
+        }
@@ -1,16 +1,35 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
+from django.db import transaction
+from django.utils import timezone
 from django.db.models import QuerySet
 from django.contrib.auth import get_user_model
 from core.infrastructure.domain.repositories.visit_repository import VisitRepository  # noqa: E501
-from core.infrastructure.domain.entities.visit import Visit
+from core.infrastructure.domain.entities.visit import Visit, allowed_sources
 from core.infrastructure.models.visit_model import VisitModel
 from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.cache.dashboard_cache import DashboardCache
+from core.infrastructure.database.partitioning import visit_date_filters
+from core.infrastructure.models.visit_price_model import VisitPriceModel
+from core.infrastructure.repositories.promoter_stats_repository import (
+    PromoterStatsRepository,
+    VisitState,
+)
 
 User = get_user_model()
 
 
 class DjangoVisitRepository(VisitRepository):
+    @staticmethod
+    def _current_price(store_id: int, brand_id: int):
+        """
+        Preço vigente da loja/marca lido direto do banco (sem cache), para
+        que o valor congelado na visita nunca seja um preço desatualizado
+        """
+        return VisitPriceModel.objects.filter(
+            store_id=store_id, brand_id=brand_id
+        ).values_list("price", flat=True).first()
+
     def get_by_id(self, visit_id: int) -> Optional[Visit]:
         """Busca uma visita pelo ID, primeiro no cache, depois no banco"""
         cache_key = CacheConfig.get_key(CacheConfig.VISIT_PREFIX, visit_id)
@@ -27,35 +46,59 @@ class DjangoVisitRepository(VisitRepository):
             return None
 
     def create(self, visit: Visit) -> Visit:
-        """Cria uma nova visita"""
+        """Cria uma nova visita com o preço vigente da loja/marca"""
         visit_model = VisitModel(
             promoter_id=visit.promoter_id,
             store_id=visit.store_id,
             brand_id=visit.brand_id,
-            visit_date=visit.visit_date
+            visit_date=visit.visit_date,
+            price=self._current_price(visit.store_id, visit.brand_id)
         )
-        visit_model.save()
+        with transaction.atomic():
+            visit_model.save()
+            PromoterStatsRepository.apply(
+                added=[PromoterStatsRepository.state(visit_model)])
 
         # Atualiza o cache
         cache_key = CacheConfig.get_key(
             CacheConfig.VISIT_PREFIX, visit_model.id)
         CacheConfig.set(cache_key, visit_model)
+        DashboardCache.invalidate_dates([visit_model.visit_date])
 
         return self._to_entity(visit_model)
 
     def update(self, visit: Visit) -> Visit:
         """Atualiza uma visita existente"""
         try:
-            visit_model = VisitModel.objects.get(id=visit.id)
-            visit_model.promoter_id = visit.promoter_id
-            visit_model.store_id = visit.store_id
-            visit_model.brand_id = visit.brand_id
-            visit_model.visit_date = visit.visit_date
-            visit_model.save()
+            with transaction.atomic():
+                # Linha travada: uma mudança de status concorrente
+                # (transition_status) espera e não é sobrescrita
+                visit_model = VisitModel.objects.select_for_update().get(
+                    id=visit.id)
+                previous = PromoterStatsRepository.state(visit_model)
+                # O preço só é recalculado se a loja ou a marca mudarem
+                if (visit_model.store_id, visit_model.brand_id) != (
+                        visit.store_id, visit.brand_id):
+                    visit_model.price = self._current_price(
+                        visit.store_id, visit.brand_id)
+                visit_model.promoter_id = visit.promoter_id
+                visit_model.store_id = visit.store_id
+                visit_model.brand_id = visit.brand_id
+                visit_model.visit_date = visit.visit_date
+                visit_model.save(update_fields=[
+                    "promoter", "store", "brand", "visit_date", "price",
+                    "updated_at"
+                ])
+                PromoterStatsRepository.apply(
+                    removed=[previous],
+                    added=[PromoterStatsRepository.state(visit_model)]
+                )
 
             # Atualiza o cache
             cache_key = CacheConfig.get_key(CacheConfig.VISIT_PREFIX, visit.id)
             CacheConfig.set(cache_key, visit_model)
+            DashboardCache.invalidate_dates(
+                [previous.visit_date, visit_model.visit_date])
 
             return self._to_entity(visit_model)
         except VisitModel.DoesNotExist:
@@ -64,15 +107,97 @@ class DjangoVisitRepository(VisitRepository):
     def delete(self, visit_id: int) -> None:
         """Remove uma visita"""
         try:
-            visit = VisitModel.objects.get(id=visit_id)
-            visit.delete()
+            with transaction.atomic():
+                visit = VisitModel.objects.select_for_update().get(
+                    id=visit_id)
+                visit.delete()
+                PromoterStatsRepository.apply(
+                    removed=[PromoterStatsRepository.state(visit)])
 
             # Remove do cache
             cache_key = CacheConfig.get_key(CacheConfig.VISIT_PREFIX, visit_id)
             CacheConfig.delete(cache_key)
+            DashboardCache.invalidate_dates([visit.visit_date])
         except VisitModel.DoesNotExist:
             raise ValueError(f"Visita com ID {visit_id} não encontrada")
 
+    def transition_status(
+        self,
+        visit_ids: Iterable[int],
+        target: int,
+        promoter_id: Optional[int] = None
+    ) -> Dict:
+        """
+        Move várias visitas para o status de destino.
+
+        As transições permitidas (ALLOWED_TRANSITIONS) viram a condição
+        status IN (...) do UPDATE único. As linhas são travadas antes para
+        que os contadores dos promotores recebam exatamente as visitas
+        alteradas; os caches são limpos numa única operação.
+
+        Args:
+            visit_ids: IDs das visitas
+            target: Status de destino
+            promoter_id: Restringe às visitas do promotor
+
+        Returns:
+            Dict: updated (IDs alterados) e skipped (id e motivo)
+        """
+        visit_ids = list(dict.fromkeys(visit_ids))
+        sources = allowed_sources(target)
+        queryset = VisitModel.objects.filter(id__in=visit_ids)
+        if promoter_id:
+            queryset = queryset.filter(promoter_id=promoter_id)
+
+        with transaction.atomic():
+            rows = list(
+                queryset.filter(status__in=sources).select_for_update()
+                .order_by().values(
+                    "id", "promoter_id", "visit_date", "status", "price")
+            )
+            updated = [row["id"] for row in rows]
+            if updated:
+                VisitModel.objects.filter(
+                    id__in=updated, status__in=sources
+                ).update(status=target, updated_at=timezone.now())
+                previous = [
+                    VisitState(row["promoter_id"], row["visit_date"],
+                               row["status"], row["price"])
+                    for row in rows
+                ]
+                PromoterStatsRepository.apply(
+                    removed=previous,
+                    added=[state._replace(status=target) for state in previous]
+                )
+
+        if updated:
+            CacheConfig.delete_many(
+                CacheConfig.get_key(CacheConfig.VISIT_PREFIX, visit_id)
+                for visit_id in updated
+            )
+            DashboardCache.invalidate_dates(
+                row["visit_date"] for row in rows)
+
+        skipped = []
+        missing = set(visit_ids) - set(updated)
+        if missing:
+            statuses = dict(VisitModel.STATUS_CHOICES)
+            current = dict(
+                queryset.filter(id__in=missing).values_list("id", "status"))
+            for visit_id in visit_ids:
+                if visit_id not in missing:
+                    continue
+                if visit_id not in current:
+                    reason = "Visita não encontrada"
+                else:
+                    reason = (
+                        f"Transição de {statuses[current[visit_id]]} para "
+                        f"{statuses[target]} não permitida"
+                    )
+                skipped.append({"id": visit_id, "reason": reason})
+
+        return {"updated": updated, "skipped": skipped}
+
     def list_all(self) -> List[Visit]:
         """Lista todas as visitas"""
         visits = VisitModel.objects.all()
@@ -115,10 +240,8 @@ class DjangoVisitRepository(VisitRepository):
             queryset = queryset.filter(store_id=store_id)
         if brand_id:
             queryset = queryset.filter(brand_id=brand_id)
-        if start_date:
-            queryset = queryset.filter(visit_date__gte=start_date)
-        if end_date:
-            queryset = queryset.filter(visit_date__lte=end_date)
+        # Limites como date para o PostgreSQL podar as partições mensais
+        queryset = queryset.filter(**visit_date_filters(start_date, end_date))
 
         return [self._to_entity(visit) for visit in queryset]
 
@@ -137,8 +260,7 @@ class DjangoVisitRepository(VisitRepository):
             user_id: ID do usuário (para filtrar visitas de um promotor)
         """
         queryset = VisitModel.objects.filter(
-            visit_date__gte=start_date,
-            visit_date__lte=end_date
+            **visit_date_filters(start_date, end_date)
         ).select_related("promoter", "store", "brand")
 
         if user_id:
@@ -157,5 +279,7 @@ class DjangoVisitRepository(VisitRepository):
             promoter_id=model.promoter_id,
             store_id=model.store_id,
             brand_id=model.brand_id,
-            visit_date=str(model.visit_date)
+            visit_date=str(model.visit_date),
+            status=model.status,
+            price=model.price
         )
@@ -103,3 +103,44 @@ class BrandSerializer(serializers.ModelSerializer):
                     {"store_id": "Loja não encontrada."})
 
         return instance
+
+
+class BrandStoreAssignmentSerializer(serializers.Serializer):
+    brand_id = serializers.IntegerField()
+    store_id = serializers.IntegerField()
+    # 0 remove a associação da loja com a marca
+    visit_frequency = serializers.IntegerField(min_value=0)
+
+
+class BrandStoreMatrixSerializer(serializers.Serializer):
+    """
+    Matriz marca x loja x periodicidade aplicada de uma só vez.
+    """
+    assignments = BrandStoreAssignmentSerializer(many=True, allow_empty=False)
+
+    def validate_assignments(self, value):
+        pairs = [(item["brand_id"], item["store_id"]) for item in value]
+        if len(set(pairs)) != len(pairs):
+            raise serializers.ValidationError(
+                "A mesma combinação marca/loja aparece mais de uma vez.")
+
+        brand_ids = {brand_id for brand_id, _store_id in pairs}
+        store_ids = {store_id for _brand_id, store_id in pairs}
+
+        missing_brands = brand_ids - set(
+            BrandModel.objects.filter(
+                id__in=brand_ids).values_list("id", flat=True)
+        )
+        if missing_brands:
+            raise serializers.ValidationError(
+                f"Marcas não encontradas: {sorted(missing_brands)}")
+
+        missing_stores = store_ids - set(
+            StoreModel.objects.filter(
+                id__in=store_ids).values_list("id", flat=True)
+        )
+        if missing_stores:
+            raise serializers.ValidationError(
+                f"Lojas não encontradas: {sorted(missing_stores)}")
+
+        return value
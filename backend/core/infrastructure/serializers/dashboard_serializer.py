@@ -34,4 +34,22 @@ class DashboardSerializer(serializers.Serializer):
         swagger_schema_fields = {
             "title": "Dashboard Data",
             "description": "Dados completos do dashboard incluindo progresso de marcas, lojas e promotores"
-        }
\ No newline at end of file
+        }
+
+
+class PlanningProgressSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    number = serializers.CharField(allow_null=True)
+    expected_visits = serializers.FloatField()
+    visits_done = serializers.IntegerField()
+    completion = serializers.FloatField(allow_null=True)
+
+class PlanningSerializer(serializers.Serializer):
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    total_expected = serializers.FloatField()
+    total_done = serializers.IntegerField()
+    completion = serializers.FloatField(allow_null=True)
+    brands_progress = PlanningProgressSerializer(many=True)
+    stores_progress = PlanningProgressSerializer(many=True)
@@ -0,0 +1,70 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+from django.db.models import QuerySet
+
+FieldSpec = Union[str, Tuple[str, Callable[[Any], Any]]]
+
+
+class ValuesProjection:
+    """
+    Projeção somente leitura de um queryset para dicionários.
+
+    Substitui o ``ModelSerializer`` nas ações de listagem: a consulta usa
+    ``values_list()`` (sem instanciar modelos) e cada linha é convertida
+    por uma função montada uma única vez, sem introspecção de campos.
+
+    Cada campo é declarado como ``"chave": "lookup"`` ou
+    ``"chave": ("lookup", conversor)``. Campos calculados são declarados
+    em ``computed`` como ``"chave": funcao(linha)``, recebendo o
+    dicionário já projetado.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, FieldSpec],
+        computed: Dict[str, Callable[[Dict[str, Any]], Any]] = None
+    ):
+        self.keys = []
+        self.lookups = []
+        self.converters = []
+
+        for key, spec in fields.items():
+            lookup, converter = (
+                spec if isinstance(spec, tuple) else (spec, None)
+            )
+            self.keys.append(key)
+            self.lookups.append(lookup)
+            self.converters.append(converter)
+
+        self.computed = list((computed or {}).items())
+        self._project_row = self._compile()
+
+    def _compile(self) -> Callable[[tuple], Dict[str, Any]]:
+        """Monta a função de conversão linha -> dicionário"""
+        keys = tuple(self.keys)
+        converted = tuple(
+            (index, key, converter)
+            for index, (key, converter) in enumerate(
+                zip(self.keys, self.converters)
+            )
+            if converter is not None
+        )
+        computed = tuple(self.computed)
+
+        def project_row(row: tuple) -> Dict[str, Any]:
+            data = dict(zip(keys, row))
+            for index, key, converter in converted:
+                data[key] = converter(row[index])
+            for key, function in computed:
+                data[key] = function(data)
+            return data
+
+        return project_row
+
+    def project(self, queryset: QuerySet) -> List[Dict[str, Any]]:
+        """Executa o queryset e retorna a lista de dicionários"""
+        rows = queryset.values_list(*self.lookups)
+        return self.project_rows(rows)
+
+    def project_rows(self, rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+        """Converte linhas já carregadas (na ordem dos lookups)"""
+        return list(map(self._project_row, rows))
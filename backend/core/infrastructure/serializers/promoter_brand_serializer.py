@@ -1,8 +1,12 @@
 from rest_framework import serializers
+from django.contrib.auth import get_user_model
+from core.infrastructure.models.brand_model import BrandModel
 from core.infrastructure.models.promoter_brand_model import PromoterBrand
 from core.infrastructure.serializers.brand_serializer import BrandSerializer
 from core.infrastructure.serializers.user_serializer import UserSerializer
 
+User = get_user_model()
+
 
 class PromoterBrandSerializer(serializers.ModelSerializer):
     brand = BrandSerializer(read_only=True)
@@ -24,3 +28,66 @@ class PromoterBrandSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
         return instance
+
+
+class PromoterBrandAssignmentSerializer(serializers.Serializer):
+    promoter_id = serializers.IntegerField()
+    # Lista vazia remove todas as marcas do promotor
+    brand_ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=True)
+
+
+class PromoterBrandReplaceSerializer(serializers.Serializer):
+    """
+    Marcas desejadas de vários promotores, aplicadas de uma só vez.
+    """
+    assignments = PromoterBrandAssignmentSerializer(
+        many=True, allow_empty=False)
+
+    def validate_assignments(self, value):
+        promoter_ids = [item["promoter_id"] for item in value]
+        if len(set(promoter_ids)) != len(promoter_ids):
+            raise serializers.ValidationError(
+                "O mesmo promotor aparece mais de uma vez.")
+
+        missing_promoters = set(promoter_ids) - set(
+            User.objects.filter(
+                id__in=promoter_ids, role=1).values_list("id", flat=True)
+        )
+        if missing_promoters:
+            raise serializers.ValidationError(
+                f"Promotores não encontrados: {sorted(missing_promoters)}")
+
+        brand_ids = {
+            brand_id for item in value for brand_id in item["brand_ids"]}
+        missing_brands = brand_ids - set(
+            BrandModel.objects.filter(
+                id__in=brand_ids).values_list("id", flat=True)
+        )
+        if missing_brands:
+            raise serializers.ValidationError(
+                f"Marcas não encontradas: {sorted(missing_brands)}")
+
+        return value
+
+
+class AllowedBrandSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+
+
+class AllowedStoreSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    number = serializers.IntegerField(allow_null=True)
+    city = serializers.CharField()
+    state = serializers.CharField()
+    brands = AllowedBrandSerializer(many=True)
+
+
+class AllowedStoresSerializer(serializers.Serializer):
+    """
+    Lojas que o promotor pode visitar, com as marcas de cada uma.
+    """
+    promoter_id = serializers.IntegerField()
+    stores = AllowedStoreSerializer(many=True)
@@ -0,0 +1,31 @@
+from rest_framework import serializers
+
+
+class ScheduleRequestSerializer(serializers.Serializer):
+    """
+    Parâmetros da geração da agenda semanal.
+    """
+    # Qualquer data da semana (padrão: a próxima semana)
+    week_start = serializers.DateField(required=False)
+    max_visits_per_day = serializers.IntegerField(
+        min_value=1, max_value=50, default=10)
+    workdays = serializers.IntegerField(min_value=1, max_value=7, default=6)
+    dry_run = serializers.BooleanField(default=False)
+
+
+class UnassignedVisitSerializer(serializers.Serializer):
+    store_id = serializers.IntegerField()
+    brand_id = serializers.IntegerField()
+    visit_date = serializers.DateField()
+
+
+class ScheduleResultSerializer(serializers.Serializer):
+    week_start = serializers.DateField()
+    days = serializers.IntegerField()
+    dry_run = serializers.BooleanField()
+    scheduled = serializers.IntegerField()
+    unassigned = serializers.IntegerField()
+    promoters = serializers.IntegerField()
+    min_load = serializers.IntegerField()
+    max_load = serializers.IntegerField()
+    unassigned_visits = UnassignedVisitSerializer(many=True)
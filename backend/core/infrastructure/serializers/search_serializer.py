@@ -0,0 +1,32 @@
+from rest_framework import serializers
+
+
+class SearchResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    label = serializers.CharField()
+    detail = serializers.CharField()
+    score = serializers.FloatField()
+
+
+class SearchSerializer(serializers.Serializer):
+    """
+    Resultados da busca por tabela; só as tabelas pesquisadas aparecem.
+    """
+    stores = SearchResultSerializer(many=True, required=False)
+    brands = SearchResultSerializer(many=True, required=False)
+    users = SearchResultSerializer(many=True, required=False)
+
+
+class SuggestionSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    label = serializers.CharField()
+    detail = serializers.CharField()
+
+
+class AutocompleteSerializer(serializers.Serializer):
+    """
+    Sugestões por tipo; só os tipos pedidos aparecem.
+    """
+    stores = SuggestionSerializer(many=True, required=False)
+    brands = SuggestionSerializer(many=True, required=False)
+    promoters = SuggestionSerializer(many=True, required=False)
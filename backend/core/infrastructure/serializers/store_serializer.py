@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.serializers.projection import ValuesProjection
 
 
 class StoreSerializer(serializers.ModelSerializer):
@@ -42,3 +43,14 @@ class StoreSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("CNPJ inválido.")
 
         return cnpj
+
+
+# Projeção somente leitura usada na listagem de lojas
+STORE_LIST_PROJECTION = ValuesProjection({
+    "id": "id",
+    "name": "name",
+    "number": "number",
+    "city": "city",
+    "state": "state",
+    "cnpj": "cnpj",
+})
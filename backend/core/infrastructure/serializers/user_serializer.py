@@ -2,6 +2,12 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
+from core.infrastructure.serializers.projection import ValuesProjection
+from core.infrastructure.repositories.promoter_stats_repository import (
+    PromoterStatsRepository,
+)
+from django.utils import timezone
+from datetime import timedelta
 
 User = get_user_model()
 
@@ -40,11 +46,81 @@ class BaseUserSerializer(serializers.ModelSerializer):
         return data
 
 
+_ROLE_DISPLAY = dict(User.ROLE_CHOICES)
+_STATUS_DISPLAY = dict(User.STATUS_CHOICES)
+_datetime_to_representation = serializers.DateTimeField().to_representation
+
+# Projeção somente leitura com a mesma saída do BaseUserSerializer
+USER_LIST_PROJECTION = ValuesProjection(
+    {
+        "id": "id",
+        "username": "username",
+        "email": "email",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "is_active": ("is_active", bool),
+        "is_staff": ("is_staff", bool),
+        "role": "role",
+        "status": "status",
+        "created_at": ("created_at", _datetime_to_representation),
+        "updated_at": ("updated_at", _datetime_to_representation),
+        "last_login": ("last_login", _datetime_to_representation),
+        "phone": "phone",
+        "cpf": "cpf",
+    },
+    computed={
+        "full_name": lambda row: f"{row['first_name']} {row['last_name']}",
+        "role_display": lambda row: _ROLE_DISPLAY.get(row["role"], ""),
+        "status_display": lambda row: _STATUS_DISPLAY.get(row["status"], ""),
+    }
+)
+
+
 class UserSerializer(BaseUserSerializer):
     """Serializador para leitura de usuários"""
     pass
 
 
+class PromoterStatsSerializer(serializers.Serializer):
+    total_visits = serializers.IntegerField()
+    pending = serializers.IntegerField()
+    in_progress = serializers.IntegerField()
+    completed = serializers.IntegerField()
+    cancelled = serializers.IntegerField()
+    total_value = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class PromoterStatsSummarySerializer(serializers.Serializer):
+    today = PromoterStatsSerializer()
+    week = PromoterStatsSerializer()
+    month = PromoterStatsSerializer()
+
+
+class UserMeSerializer(UserSerializer):
+    """
+    Usuário logado; para promotores inclui os totais de visitas de hoje,
+    da semana e do mês, lidos dos contadores diários
+    """
+    stats = serializers.SerializerMethodField()
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ['stats']
+
+    @extend_schema_field(PromoterStatsSummarySerializer(allow_null=True))
+    def get_stats(self, obj):
+        if obj.role != 1:  # Apenas promotores
+            return None
+        today = timezone.now().date()
+        week_start = today - timedelta(days=today.weekday())
+        next_month = (today.replace(day=28) + timedelta(days=4)).replace(day=1)
+        summary = PromoterStatsRepository.summary(obj.id, {
+            "today": (today, today),
+            "week": (week_start, week_start + timedelta(days=6)),
+            "month": (today.replace(day=1), next_month - timedelta(days=1)),
+        })
+        return PromoterStatsSummarySerializer(summary).data
+
+
 class UserCreateSerializer(BaseUserSerializer):
     """Serializador para criação de usuários"""
     password = serializers.CharField(write_only=True)
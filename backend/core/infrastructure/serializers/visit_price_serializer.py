@@ -1,5 +1,9 @@
 from rest_framework import serializers
 from core.infrastructure.models.visit_price_model import VisitPriceModel
+from core.infrastructure.repositories.visit_price_repository import (
+    VisitPriceRepository,
+)
+from core.infrastructure.serializers.projection import ValuesProjection
 
 
 class VisitPriceSerializer(serializers.ModelSerializer):
@@ -21,7 +25,8 @@ class VisitPriceSerializer(serializers.ModelSerializer):
         if value <= 0:
             raise serializers.ValidationError(
                 "O preço deve ser um valor positivo.")
-        return float(value)  # Converte para float para garantir o formato
+        # Mantém o Decimal para não perder precisão ao gravar
+        return value
 
     def to_representation(self, instance):
         """
@@ -30,3 +35,41 @@ class VisitPriceSerializer(serializers.ModelSerializer):
         data = super().to_representation(instance)
         data['price'] = float(data['price'])  # Garante que o preço seja float
         return data
+
+
+class VisitPriceBulkItemSerializer(serializers.Serializer):
+    store = serializers.IntegerField()
+    brand = serializers.IntegerField()
+    price = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+    def validate_price(self, value):
+        if value <= 0:
+            raise serializers.ValidationError(
+                "O preço deve ser um valor positivo.")
+        return value
+
+
+class VisitPriceBulkSerializer(serializers.Serializer):
+    """
+    Lote de preços (loja, marca, preço) gravado de uma só vez.
+    """
+    prices = VisitPriceBulkItemSerializer(many=True, allow_empty=False)
+
+    def validate_prices(self, value):
+        errors = VisitPriceRepository.find_reference_errors(value)
+        if errors:
+            # Erros indexados pela posição do item no lote
+            raise serializers.ValidationError(dict(sorted(errors.items())))
+        return value
+
+
+# Projeção somente leitura usada na listagem de preços de visita
+VISIT_PRICE_LIST_PROJECTION = ValuesProjection({
+    "id": "id",
+    "store": "store_id",
+    "store_name": "store__name",
+    "store_number": "store__number",
+    "brand": "brand_id",
+    "brand_name": "brand__name",
+    "price": ("price", float),
+})
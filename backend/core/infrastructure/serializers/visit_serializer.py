@@ -1,9 +1,13 @@
+from decimal import Decimal
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from ..models.visit_model import VisitModel
-from ..models.visit_price_model import VisitPriceModel
-from .visit_price_serializer import VisitPriceSerializer
+from ..repositories.allowed_stores_repository import AllowedStoresRepository
+from .projection import ValuesProjection
 from django.contrib.auth import get_user_model
+import logging
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
@@ -26,7 +30,11 @@ class VisitSerializer(serializers.ModelSerializer):
     def get_promoter(self, obj):
         """Retorna os dados do promoter"""
         try:
-            promoter = User.objects.get(id=obj.promoter_id)
+            # Usa a relação já carregada (select_related) quando disponível
+            if isinstance(obj, VisitModel):
+                promoter = obj.promoter
+            else:
+                promoter = User.objects.get(id=obj.promoter_id)
             return {
                 "id": promoter.id,
                 "name": promoter.get_full_name(),
@@ -42,7 +50,10 @@ class VisitSerializer(serializers.ModelSerializer):
         """Retorna os dados da loja"""
         from ..models.store_model import StoreModel
         try:
-            store = StoreModel.objects.get(id=obj.store_id)
+            if isinstance(obj, VisitModel):
+                store = obj.store
+            else:
+                store = StoreModel.objects.get(id=obj.store_id)
             return {
                 "id": store.id,
                 "name": store.name,
@@ -58,7 +69,10 @@ class VisitSerializer(serializers.ModelSerializer):
         """Retorna os dados da marca"""
         from ..models.brand_model import BrandModel
         try:
-            brand = BrandModel.objects.get(id=obj.brand_id)
+            if isinstance(obj, VisitModel):
+                brand = obj.brand
+            else:
+                brand = BrandModel.objects.get(id=obj.brand_id)
             return {
                 "brand_id": brand.id,
                 "brand_name": brand.name
@@ -71,21 +85,11 @@ class VisitSerializer(serializers.ModelSerializer):
     )
     def get_visit_price(self, obj):
         """
-        Busca o preço da visita baseado na marca e loja.
-        Retorna 0 se não encontrar preço configurado.
+        Retorna o preço congelado na criação da visita.
+        Visitas sem preço congelado valem 0, como nos relatórios e
+        exportações (execute backfill_visit_prices para preenchê-las).
         """
-        try:
-            price = VisitPriceModel.objects.filter(
-                brand_id=obj.brand_id,
-                store_id=obj.store_id
-            ).first()
-            
-            if price:
-                return price.price
-            return 0
-        except Exception as e:
-            logger.error(f"Erro ao buscar preço da visita: {str(e)}")
-            return 0
+        return obj.price if obj.price is not None else 0
 
     @extend_schema_field(
         serializers.DecimalField(max_digits=10, decimal_places=2)
@@ -101,6 +105,15 @@ class VisitSerializer(serializers.ModelSerializer):
         """
         internal_data = {}
 
+        # Converte promoter_id
+        if "promoter" in data:
+            try:
+                internal_data["promoter_id"] = int(data["promoter"])
+            except (ValueError, TypeError):
+                raise serializers.ValidationError(
+                    {"promoter": "ID do promotor inválido"}
+                )
+
         # Converte store_id
         if "store" in data:
             try:
@@ -134,12 +147,102 @@ class VisitSerializer(serializers.ModelSerializer):
 
         # Se o usuário for promotor, força o uso do próprio usuário
         if user.role == 1:  # Promotor
-            data['promoter'] = user
-        else:
+            data['promoter_id'] = user.id
+        elif 'promoter_id' in data:
             # Se for gestor ou analista, valida o promotor informado
-            if 'promoter' not in data:
+            if not User.objects.filter(
+                    id=data['promoter_id'], role=1).exists():
                 raise serializers.ValidationError(
-                    "O campo promoter é obrigatório."
+                    {"promoter": "Promotor não encontrado."}
                 )
+        elif self.instance is None:
+            raise serializers.ValidationError(
+                "O campo promoter é obrigatório."
+            )
+
+        if self.instance is None:
+            required = {
+                "store_id": "store",
+                "brand_id": "brand",
+                "visit_date": "visit_date",
+            }
+            missing = {
+                field: "Este campo é obrigatório."
+                for key, field in required.items() if key not in data
+            }
+            if missing:
+                raise serializers.ValidationError(missing)
 
+        self.validate_allowed_store(data)
         return data
+
+    def validate_allowed_store(self, data):
+        """
+        A marca precisa estar vinculada ao promotor e atender a loja.
+        Só é conferido quando o promotor, a loja ou a marca mudam, para
+        que visitas antigas continuem editáveis após mudanças de vínculo.
+        """
+        fields = ("promoter_id", "store_id", "brand_id")
+        current = {
+            field: getattr(self.instance, field, None) for field in fields}
+        merged = {field: data.get(field, current[field]) for field in fields}
+        if self.instance is not None and merged == current:
+            return
+        if not AllowedStoresRepository.is_allowed(
+            merged["promoter_id"], merged["store_id"], merged["brand_id"]
+        ):
+            raise serializers.ValidationError(
+                {"store": "A marca não está vinculada ao promotor nesta "
+                          "loja."}
+            )
+
+
+def _full_name(first_name, last_name):
+    return f"{first_name} {last_name}".strip()
+
+
+# Linhas planas (values) usadas nos relatórios e exportações de visitas.
+# O preço é a coluna local congelada na criação (0 se não houver).
+VISIT_REPORT_PROJECTION = ValuesProjection(
+    {
+        "id": "id",
+        "visit_date": "visit_date",
+        "status": "status",
+        "promoter_id": "promoter_id",
+        "promoter_first_name": "promoter__first_name",
+        "promoter_last_name": "promoter__last_name",
+        "store_id": "store_id",
+        "store_name": "store__name",
+        "store_number": "store__number",
+        "brand_id": "brand_id",
+        "brand_name": "brand__name",
+        "price": ("price", lambda price: price or Decimal("0.00")),
+    },
+    computed={
+        "promoter_name": lambda row: _full_name(
+            row["promoter_first_name"], row["promoter_last_name"]),
+    }
+)
+
+
+class VisitTransitionSerializer(serializers.Serializer):
+    """
+    Mudança de status de várias visitas de uma vez.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=5_000
+    )
+    status = serializers.ChoiceField(choices=VisitModel.STATUS_CHOICES)
+
+
+class SkippedVisitSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    reason = serializers.CharField()
+
+
+class VisitTransitionResultSerializer(serializers.Serializer):
+    status = serializers.IntegerField()
+    updated = serializers.ListField(child=serializers.IntegerField())
+    skipped = SkippedVisitSerializer(many=True)
@@ -0,0 +1,171 @@
+"""
+Invalidação de caches derivados de várias tabelas (matriz do planejamento
+e lojas permitidas por promotor) e atualização do índice do autocomplete.
+
+Os receivers são conectados em CoreConfig.ready. Escritas em massa
+(bulk_create, update) não disparam sinais: quem as faz limpa o cache
+explicitamente.
+"""
+from django.db import transaction
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.cache.dashboard_cache import DashboardCache
+from core.infrastructure.cache.autocomplete_index import (
+    autocomplete_index,
+    brand_entry,
+    is_indexed_promoter,
+    promoter_entry,
+    store_entry,
+)
+from core.infrastructure.models.brand_model import BrandModel, BrandStore
+from core.infrastructure.models.promoter_brand_model import PromoterBrand
+from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.models.user_model import User
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.repositories.allowed_stores_repository import (
+    AllowedStoresRepository,
+)
+from core.infrastructure.repositories.planning_repository import (
+    PlanningRepository,
+)
+from core.infrastructure.repositories.promoter_stats_repository import (
+    PromoterStatsRepository,
+)
+
+
+@receiver(post_save, sender=BrandStore)
+@receiver(post_delete, sender=BrandStore)
+@receiver(post_save, sender=BrandModel)
+@receiver(post_delete, sender=BrandModel)
+@receiver(post_save, sender=StoreModel)
+@receiver(post_delete, sender=StoreModel)
+def clear_planning_matrix(sender, **kwargs):
+    """A matriz do planejamento inclui a periodicidade e os nomes de marcas
+    e lojas"""
+    PlanningRepository.clear_matrix_cache()
+
+
+def _on_commit(function, *args):
+    # O índice em memória só reflete o que foi confirmado no banco
+    transaction.on_commit(lambda: function(*args))
+
+
+@receiver(post_save, sender=StoreModel)
+def index_store(sender, instance, **kwargs):
+    _on_commit(autocomplete_index.upsert, "stores", store_entry(instance))
+
+
+@receiver(post_save, sender=BrandModel)
+def index_brand(sender, instance, **kwargs):
+    _on_commit(autocomplete_index.upsert, "brands", brand_entry(instance))
+
+
+# Campos do usuário que alteram a entrada no índice de promotores
+PROMOTER_INDEX_FIELDS = {"first_name", "last_name", "role", "is_active"}
+
+
+def _was_indexed_promoter(user) -> bool:
+    """Se o usuário estava no índice quando foi lido do banco. Com role ou
+    is_active adiados (only/defer) não há como saber: assume que sim."""
+    if user.pk is None:
+        return False
+    if "role" not in user.__dict__ or "is_active" not in user.__dict__:
+        return True
+    return is_indexed_promoter(user)
+
+
+@receiver(post_init, sender=User)
+def remember_promoter_index_state(sender, instance, **kwargs):
+    instance._indexed_promoter = _was_indexed_promoter(instance)
+
+
+@receiver(post_save, sender=User)
+def index_promoter(sender, instance, update_fields=None, **kwargs):
+    # Ex: last_login no login, troca de senha
+    if update_fields is not None and \
+            not PROMOTER_INDEX_FIELDS.intersection(update_fields):
+        return
+
+    was_indexed = getattr(instance, "_indexed_promoter", True)
+    instance._indexed_promoter = is_indexed_promoter(instance)
+    if instance._indexed_promoter:
+        _on_commit(
+            autocomplete_index.upsert, "promoters", promoter_entry(instance))
+    elif was_indexed:
+        _on_commit(autocomplete_index.remove, "promoters", instance.id)
+
+
+@receiver(post_delete, sender=StoreModel)
+@receiver(post_delete, sender=BrandModel)
+@receiver(post_delete, sender=User)
+def unindex(sender, instance, **kwargs):
+    if sender is User and \
+            not getattr(instance, "_indexed_promoter", True):
+        # Analistas e gestores não estão no índice
+        return
+    kind = {StoreModel: "stores", BrandModel: "brands", User: "promoters"}
+    _on_commit(autocomplete_index.remove, kind[sender], instance.id)
+
+
+# Índice de lojas permitidas por promotor. As chaves são calculadas já
+# (antes da remoção em cascata, nos pre_delete) e removidas após o commit.
+
+def _clear_allowed_stores(keys):
+    keys = list(keys)
+    if keys:
+        transaction.on_commit(lambda: CacheConfig.delete_many(keys))
+
+
+@receiver(post_save, sender=PromoterBrand)
+@receiver(post_delete, sender=PromoterBrand)
+def clear_promoter_allowed_stores(sender, instance, **kwargs):
+    _clear_allowed_stores(
+        AllowedStoresRepository.cache_keys([instance.promoter_id]))
+
+
+@receiver(post_save, sender=BrandStore)
+@receiver(post_delete, sender=BrandStore)
+def clear_brand_store_allowed_stores(sender, instance, **kwargs):
+    origin = kwargs.get("origin")
+    if origin is not None and origin is not instance:
+        # Cascata de marca/loja (tratada no pre_delete delas) ou
+        # QuerySet.delete() (quem remove limpa o cache)
+        return
+    _clear_allowed_stores(
+        AllowedStoresRepository.keys_for_brands([instance.brand_id]))
+
+
+@receiver(post_save, sender=BrandModel)
+@receiver(pre_delete, sender=BrandModel)
+def clear_brand_allowed_stores(sender, instance, **kwargs):
+    _clear_allowed_stores(
+        AllowedStoresRepository.keys_for_brands([instance.id]))
+
+
+@receiver(post_save, sender=StoreModel)
+@receiver(pre_delete, sender=StoreModel)
+def clear_store_allowed_stores(sender, instance, **kwargs):
+    if kwargs.get("created"):
+        return  # Loja nova ainda não está em nenhuma marca
+    _clear_allowed_stores(
+        AllowedStoresRepository.keys_for_stores([instance.id]))
+
+
+# Visitas removidas em cascata com a marca ou a loja. Descontadas com uma
+# consulta agrupada no pre_delete (mesma transação da remoção); um receiver
+# em VisitModel impediria a remoção rápida (sem carregar as visitas).
+
+@receiver(pre_delete, sender=BrandModel)
+@receiver(pre_delete, sender=StoreModel)
+def discount_cascaded_visits(sender, instance, **kwargs):
+    field = "brand_id" if sender is BrandModel else "store_id"
+    dates = PromoterStatsRepository.remove_visits(
+        VisitModel.objects.filter(**{field: instance.id}))
+    if dates:
+        transaction.on_commit(lambda: DashboardCache.invalidate_dates(dates))
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+_WEIGHTS_1 = np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+_WEIGHTS_2 = np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+
+
+def normalize_cnpjs(cnpjs: pd.Series) -> pd.Series:
+    """Remove a formatação (pontos, barra, hífen) de uma série de CNPJs"""
+    return cnpjs.fillna("").astype(str).str.replace(
+        r"[^0-9]", "", regex=True)
+
+
+def _check_digit(digits: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    digit = 11 - (digits @ weights) % 11
+    digit[digit >= 10] = 0
+    return digit
+
+
+def validate_cnpjs(cnpjs: pd.Series) -> np.ndarray:
+    """
+    Valida os dígitos verificadores de uma série de CNPJs de uma só vez
+
+    Os CNPJs são convertidos em uma matriz N x 14 de dígitos e os dois
+    dígitos verificadores são calculados com um produto matricial.
+
+    Args:
+        cnpjs: Série de CNPJs já normalizados (apenas dígitos)
+
+    Returns:
+        np.ndarray: Máscara booleana com os CNPJs válidos
+    """
+    result = np.zeros(len(cnpjs), dtype=bool)
+    has_14_digits = (cnpjs.str.len() == 14).to_numpy()
+    if not has_14_digits.any():
+        return result
+
+    digits = np.frombuffer(
+        "".join(cnpjs[has_14_digits]).encode("ascii"), dtype=np.uint8
+    ).reshape(-1, 14).astype(np.int64) - ord("0")
+
+    valid = (
+        (digits[:, 12] == _check_digit(digits[:, :12], _WEIGHTS_1))
+        & (digits[:, 13] == _check_digit(digits[:, :13], _WEIGHTS_2))
+        # Todos os dígitos iguais (ex: 11.111.111/1111-11) é inválido
+        & (digits != digits[:, :1]).any(axis=1)
+    )
+    result[has_14_digits] = valid
+    return result
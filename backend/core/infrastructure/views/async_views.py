@@ -0,0 +1,195 @@
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.infrastructure.models.user_model import User
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.repositories.dashboard_repository import (
+    DashboardRepository,
+)
+from core.infrastructure.serializers.dashboard_serializer import (
+    DashboardSerializer,
+)
+from core.infrastructure.views.dashboard_view import dashboard_period
+from core.infrastructure.serializers.user_serializer import UserMeSerializer
+from core.infrastructure.serializers.visit_serializer import VisitSerializer
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    """JSON no mesmo formato do JSONRenderer do DRF (Decimal como número)"""
+    return JsonResponse(
+        data,
+        status=status_code,
+        safe=False,
+        encoder=JSONEncoder,
+        json_dumps_params={"ensure_ascii": False}
+    )
+
+
+class AsyncAPIView(View):
+    """
+    Base das views assíncronas (deploy ASGI, settings.ASYNC_VIEWS).
+
+    Autentica o token JWT como o DRF (mesmas respostas 401), mas sem
+    bloquear o event loop: apenas a busca do usuário vai ao banco, via
+    sync_to_async. As subclasses implementam métodos async (get...) e
+    encontram o usuário em request.user.
+    """
+
+    authenticator = JWTAuthentication()
+
+    async def authenticate(self, request):
+        header = self.authenticator.get_header(request)
+        if header is None:
+            raise NotAuthenticated()
+        raw_token = self.authenticator.get_raw_token(header)
+        if raw_token is None:
+            raise NotAuthenticated()
+        validated_token = self.authenticator.get_validated_token(raw_token)
+        return await sync_to_async(self.authenticator.get_user)(
+            validated_token)
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            request.user = await self.authenticate(request)
+        except APIException as e:
+            detail = e.detail if isinstance(e.detail, dict) else {
+                "detail": e.detail}
+            response = json_response(detail, e.status_code)
+            response["WWW-Authenticate"] = (
+                self.authenticator.authenticate_header(request))
+            return response
+        return await super().dispatch(request, *args, **kwargs)
+
+
+def visits_for(user):
+    """Visitas visíveis ao usuário (mesma regra do VisitViewSet)"""
+    queryset = VisitModel.objects.select_related("promoter", "store", "brand")
+    if user.role == 1:  # Promotor
+        return queryset.filter(promoter=user)
+    if user.role in [2, 3]:  # Analista e Gestor
+        return queryset
+    return queryset.none()
+
+
+class AsyncVisitListView(AsyncAPIView):
+    """ Lista as visitas (versão assíncrona de GET /api/visits/) """
+
+    async def get(self, request):
+        visits = [visit async for visit in visits_for(request.user)]
+        # As relações já vieram no select_related: serializar não consulta
+        return json_response(VisitSerializer(visits, many=True).data)
+
+
+class AsyncVisitDetailView(AsyncAPIView):
+    """ Busca uma visita (versão assíncrona de GET /api/visits/{id}/) """
+
+    async def get(self, request, id):
+        visit = await visits_for(request.user).filter(pk=id).afirst()
+        if visit is None:
+            return json_response(
+                {"error": "Visita não encontrada"},
+                status.HTTP_404_NOT_FOUND
+            )
+        return json_response(VisitSerializer(visit).data)
+
+
+class AsyncDashboardView(AsyncAPIView):
+    """ Dados do dashboard (versão assíncrona de GET /api/dashboard/) """
+
+    repository = DashboardRepository()
+
+    async def get(self, request):
+        today = timezone.now().date()
+        try:
+            period = dashboard_period(request.GET, today)
+        except ValueError as e:
+            return json_response(
+                {"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        try:
+            dashboard_data = await sync_to_async(self.repository.get_dashboard)(
+                period,
+                today,
+                promoter_id=request.user.id if request.user.role == 1 else None
+            )
+
+            return json_response(DashboardSerializer(dashboard_data).data)
+        except Exception as e:
+            logger.error(f"Erro ao gerar dados do dashboard: {e}")
+            return json_response(
+                {"error": "Erro ao gerar dados do dashboard."},
+                status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AsyncUserMeView(AsyncAPIView):
+    """ Dados do usuário logado (versão assíncrona de GET /api/users/me/) """
+
+    async def get(self, request):
+        try:
+            # Busca o usuário do banco de dados para garantir dados atualizados
+            user = await User.objects.aget(id=request.user.id)
+            # Os totais do promotor vêm de uma consulta síncrona
+            data = await sync_to_async(
+                lambda: UserMeSerializer(
+                    user, context={"request": request}).data)()
+            return json_response(data)
+        except User.DoesNotExist:
+            logger.error(f"Usuário não encontrado: {request.user.id}")
+            return json_response(
+                {"error": "Usuário não encontrado"},
+                status.HTTP_404_NOT_FOUND
+            )
+
+
+def async_get(async_view, sync_view):
+    """
+    Rota que atende GET/HEAD com a view assíncrona e os demais métodos
+    com a view síncrona do DRF (executada pelo sync_to_async).
+    """
+    run_sync = sync_to_async(sync_view)
+
+    @csrf_exempt
+    async def view(request, *args, **kwargs):
+        if request.method in ("GET", "HEAD"):
+            return await async_view(request, *args, **kwargs)
+        return await run_sync(request, *args, **kwargs)
+
+    return view
+
+
+def offload(sync_view):
+    """
+    Executa uma view síncrona pesada (exportações) no pool de threads,
+    fora da thread compartilhada que o Django usa para o código síncrono
+    sob ASGI. Cada thread usa a própria conexão com o banco, fechada ao
+    fim da requisição conforme CONN_MAX_AGE.
+    """
+
+    def run(request, *args, **kwargs):
+        close_old_connections()
+        try:
+            response = sync_view(request, *args, **kwargs)
+            if hasattr(response, "render"):
+                response.render()
+            return response
+        finally:
+            close_old_connections()
+
+    run_in_pool = sync_to_async(run, thread_sensitive=False)
+
+    @csrf_exempt
+    async def view(request, *args, **kwargs):
+        return await run_in_pool(request, *args, **kwargs)
+
+    return view
@@ -0,0 +1,118 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
+from ..cache.autocomplete_index import AutocompleteIndex, autocomplete_index
+from ..serializers.search_serializer import AutocompleteSerializer
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_LIMIT = 50
+
+
+class AutocompleteView(APIView):
+    """
+    View das sugestões por prefixo, respondidas do índice em memória
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = AutocompleteSerializer
+
+    @staticmethod
+    def allowed_kinds(user) -> list:
+        """Promotores são escolhidos apenas por analistas e gestores"""
+        if user.role in [2, 3]:  # 2 = Analista, 3 = Gestor
+            return list(AutocompleteIndex.KINDS)
+        return [kind for kind in AutocompleteIndex.KINDS if kind != "promoters"]
+
+    @extend_schema(
+        description=(
+            "Sugestões de lojas (nome ou número), marcas e promotores cujo "
+            "nome tenha alguma palavra começando pelo texto digitado, sem "
+            "diferenciar maiúsculas e acentos. Respondidas de um índice em "
+            "memória, sem consultar o banco. Promotores apenas para "
+            "analistas e gestores."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=str,
+                required=True,
+                description="Início do texto digitado"
+            ),
+            OpenApiParameter(
+                name="types",
+                type=str,
+                description="Tipos separados por vírgula: stores, brands, "
+                            "promoters (padrão: todos os permitidos)"
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=int,
+                description=f"Sugestões por tipo (padrão 10, máximo "
+                            f"{MAX_LIMIT})"
+            ),
+        ],
+        responses={
+            200: AutocompleteSerializer,
+            400: OpenApiTypes.STR,
+            401: OpenApiTypes.STR,
+            403: OpenApiTypes.STR,
+            500: OpenApiTypes.STR
+        },
+        tags=['Busca']
+    )
+    def get(self, request):
+        prefix = request.query_params.get("q", "").strip()
+        if not prefix:
+            return Response(
+                {"error": "Informe o texto em q."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_LIMIT:
+            return Response(
+                {"error": f"limit deve estar entre 1 e {MAX_LIMIT}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        allowed = self.allowed_kinds(request.user)
+        kinds = allowed
+        if request.query_params.get("types"):
+            kinds = [
+                kind.strip()
+                for kind in request.query_params["types"].split(",")
+                if kind.strip()
+            ]
+            unknown = [
+                kind for kind in kinds if kind not in AutocompleteIndex.KINDS]
+            if unknown:
+                return Response(
+                    {"error": f"Tipos inválidos: {', '.join(unknown)}."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if any(kind not in allowed for kind in kinds):
+                return Response(
+                    {"error": "Apenas gerentes e analistas podem buscar "
+                              "promotores."},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+
+        try:
+            suggestions = autocomplete_index.search(prefix, kinds, limit)
+            return Response(
+                self.serializer_class(suggestions).data,
+                status=status.HTTP_200_OK
+            )
+        except Exception as e:
+            logger.error(f"Erro no autocomplete: {e}")
+            return Response(
+                {"error": "Erro no autocomplete."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
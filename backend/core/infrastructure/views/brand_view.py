@@ -1,9 +1,14 @@
 from rest_framework.response import Response
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from core.infrastructure.models.brand_model import BrandModel, BrandStore
+from django.db.models import F
+from core.infrastructure.models.brand_model import BrandStore
 from core.infrastructure.models.store_model import StoreModel
-from core.infrastructure.serializers.brand_serializer import BrandSerializer
+from core.infrastructure.serializers.brand_serializer import (
+    BrandSerializer,
+    BrandStoreMatrixSerializer,
+)
 from core.infrastructure.repositories.brand_repository import BrandRepository
 from drf_spectacular.utils import extend_schema, extend_schema_view
 import logging
@@ -128,7 +133,7 @@ logger = logging.getLogger(__name__)
 class BrandViewSet(viewsets.ModelViewSet):
     """ ViewSet para gerenciar Marcas e seu relacionamento com Lojas """
 
-    queryset = BrandModel.objects.prefetch_related('stores').all()
+    queryset = BrandRepository.with_stores()
     serializer_class = BrandSerializer
     permission_classes = [IsAuthenticated, IsManagerOrAnalyst]
 
@@ -146,20 +151,14 @@ class BrandViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         """ Lista todas as marcas com suas lojas e periodicidade """
         try:
-            # Busca todos os registros de BrandStore com suas relações
-            brand_stores = BrandStore.objects.select_related(
-                'brand', 'store').all()
-
-            # Formata os dados para o response
-            results = []
-            for brand_store in brand_stores:
-                results.append({
-                    "brand_id": brand_store.brand.id,
-                    "brand_name": brand_store.brand.name,
-                    "store_id": brand_store.store.id,
-                    "store_name": brand_store.store.name,
-                    "visit_frequency": brand_store.visit_frequency,
-                })
+            # Uma linha por associação marca-loja, sem instanciar modelos
+            results = list(BrandStore.objects.values(
+                "brand_id",
+                "visit_frequency",
+                "store_id",
+                brand_name=F("brand__name"),
+                store_name=F("store__name"),
+            ))
 
             return Response(results, status=status.HTTP_200_OK)
 
@@ -191,7 +190,8 @@ class BrandViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             try:
                 brand = serializer.save()
-                response_data = self.get_serializer(brand).data
+                response_data = self.get_serializer(
+                    self.get_queryset().get(pk=brand.pk)).data
                 return Response(response_data, status=status.HTTP_201_CREATED)
             except Exception as e:
                 logger.error(f"Erro ao criar marca: {e}")
@@ -227,7 +227,10 @@ class BrandViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             try:
                 brand = serializer.save()
-                response_data = self.get_serializer(brand).data
+                # Recarrega com as lojas: a pré-carga de get_object é
+                # anterior à alteração
+                response_data = self.get_serializer(
+                    self.get_queryset().get(pk=brand.pk)).data
                 return Response(response_data, status=status.HTTP_200_OK)
             except Exception as e:
                 logger.error(f"Erro ao atualizar marca: {e}")
@@ -264,3 +267,88 @@ class BrandViewSet(viewsets.ModelViewSet):
                 {"error": "Erro ao excluir marca."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    @extend_schema(
+        description="""Aplica uma matriz marca x loja x periodicidade em lote.
+        - Requer papel de Analista (role=2) ou Gestor (role=3)
+        - visit_frequency > 0 cria ou atualiza a associação
+        - visit_frequency = 0 remove a associação
+        - Todas as alterações são aplicadas numa única transação""",
+        request=BrandStoreMatrixSerializer,
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "saved": {"type": "integer"},
+                    "removed": {"type": "integer"}
+                }
+            },
+            400: {
+                "type": "object",
+                "properties": {"error": {"type": "object"}}
+            },
+            403: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            },
+            500: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            }
+        }
+    )
+    @action(detail=False, methods=["post"], url_path="matrix")
+    def matrix(self, request):
+        """ Aplica a matriz marca x loja x periodicidade """
+        try:
+            self.check_manager_analyst_permission()
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = BrandStoreMatrixSerializer(data=request.data)
+        if not serializer.is_valid():
+            logger.warning(
+                f"Erro de validação na matriz de marcas: {serializer.errors}")
+            return Response(
+                {"error": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            result = BrandRepository.bulk_set_store_frequencies(
+                serializer.validated_data["assignments"])
+            return Response(result, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Erro ao aplicar matriz de marcas: {e}")
+            return Response(
+                {"error": "Erro ao atualizar lojas das marcas."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @extend_schema(
+        description="""Lista as marcas com as lojas agrupadas, no mesmo
+        formato do detalhe da marca. Marcas sem lojas aparecem com a lista
+        vazia.""",
+        responses={
+            200: BrandSerializer(many=True),
+            500: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            }
+        }
+    )
+    @action(detail=False, methods=["get"], url_path="grouped")
+    def grouped(self, request):
+        """ Lista as marcas com as lojas agrupadas """
+        try:
+            return Response(
+                BrandRepository.grouped_stores(), status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Erro ao listar marcas agrupadas: {e}")
+            return Response(
+                {"error": "Erro ao buscar marcas."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -3,15 +3,61 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
-from datetime import timedelta
-from drf_spectacular.utils import extend_schema
+from django.utils.dateparse import parse_date
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
+from ..domain.entities.dashboard import DashboardPeriod
 from ..repositories.dashboard_repository import DashboardRepository
-from ..serializers.dashboard_serializer import DashboardSerializer
+from ..repositories.planning_repository import PlanningRepository
+from ..serializers.dashboard_serializer import (
+    DashboardSerializer,
+    PlanningSerializer,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+PERIOD_PARAMETERS = [
+    OpenApiParameter(
+        name="period",
+        type=str,
+        enum=list(DashboardPeriod.PERIODS),
+        description="Período exibido (padrão: current_week)"
+    ),
+    OpenApiParameter(
+        name="start_date",
+        type=OpenApiTypes.DATE,
+        description="Data inicial do período custom (YYYY-MM-DD)"
+    ),
+    OpenApiParameter(
+        name="end_date",
+        type=OpenApiTypes.DATE,
+        description="Data final do período custom (YYYY-MM-DD)"
+    ),
+]
+
+
+def dashboard_period(query_params, today):
+    """
+    Período pedido na query string (period, start_date, end_date).
+
+    Raises:
+        ValueError: Período ou datas inválidos
+    """
+    dates = {}
+    for name in ("start_date", "end_date"):
+        value = query_params.get(name)
+        if value:
+            try:
+                dates[name] = parse_date(value)
+            except ValueError:  # ex: 2024-02-30
+                dates[name] = None
+            if dates[name] is None:
+                raise ValueError("Data inválida. Use o formato YYYY-MM-DD.")
+    return DashboardPeriod.resolve(
+        query_params.get("period") or "current_week", today, **dates)
+
+
 class DashboardView(APIView):
     """
     View para obter dados do dashboard
@@ -25,8 +71,10 @@ class DashboardView(APIView):
 
     @extend_schema(
         description="Obtém os dados do dashboard baseado no papel do usuário",
+        parameters=PERIOD_PARAMETERS,
         responses={
             200: DashboardSerializer,
+            400: OpenApiTypes.STR,
             401: OpenApiTypes.STR,
             403: OpenApiTypes.STR,
             500: OpenApiTypes.STR
@@ -38,23 +86,24 @@ class DashboardView(APIView):
         Retorna os dados do dashboard baseado no papel do usuário.
         Para promotores: retorna apenas seus dados.
         Para analistas e gestores: retorna todos os dados.
+        Períodos encerrados ficam em cache até uma edição retroativa.
         """
+        today = timezone.now().date()
+        try:
+            period = dashboard_period(request.query_params, today)
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         try:
-            today = timezone.now().date()
-            start_of_week = today - timedelta(days=today.weekday())
-            end_of_week = start_of_week + timedelta(days=6)
-
-            if request.user.role == 1:  # Promoter
-                dashboard_data = self.repository.get_promoter_dashboard(
-                    user_id=request.user.id,
-                    start_date=start_of_week,
-                    end_date=end_of_week
-                )
-            else:  # Manager or Analyst
-                dashboard_data = self.repository.get_manager_dashboard(
-                    start_date=start_of_week,
-                    end_date=end_of_week
-                )
+            dashboard_data = self.repository.get_dashboard(
+                period,
+                today,
+                # Promotor: apenas as próprias visitas
+                promoter_id=request.user.id if request.user.role == 1 else None
+            )
 
             serializer = self.serializer_class(dashboard_data)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -65,3 +114,55 @@ class DashboardView(APIView):
                 {"error": "Erro ao gerar dados do dashboard."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class DashboardPlanningView(APIView):
+    """
+    View do planejamento: visitas esperadas x concluídas
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = PlanningSerializer
+
+    @extend_schema(
+        description=(
+            "Visitas esperadas (periodicidade semanal de cada marca na "
+            "loja, proporcional aos dias do período) x visitas concluídas, "
+            "por marca e por loja. Apenas analistas e gestores."
+        ),
+        parameters=PERIOD_PARAMETERS,
+        responses={
+            200: PlanningSerializer,
+            400: OpenApiTypes.STR,
+            401: OpenApiTypes.STR,
+            403: OpenApiTypes.STR,
+            500: OpenApiTypes.STR
+        },
+        tags=['Dashboard']
+    )
+    def get(self, request):
+        if request.user.role not in [2, 3]:  # 2 = Analista, 3 = Gestor
+            return Response(
+                {"error": "Apenas gerentes e analistas podem ver o "
+                          "planejamento."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            period = dashboard_period(
+                request.query_params, timezone.now().date())
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            planning = PlanningRepository.get_planning(period)
+            serializer = self.serializer_class(planning)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Erro ao gerar o planejamento: {e}")
+            return Response(
+                {"error": "Erro ao gerar o planejamento."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
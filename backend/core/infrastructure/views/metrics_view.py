@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views import View
+from core.infrastructure.monitoring.metrics import registry
+
+
+class MetricsView(View):
+    """
+    Exporta as métricas no formato texto do Prometheus.
+    Disponível apenas para os IPs em METRICS["ALLOWED_IPS"] (localhost).
+    """
+
+    def get(self, request):
+        allowed_ips = getattr(settings, "METRICS", {}).get(
+            "ALLOWED_IPS", ["127.0.0.1", "::1"])
+        if request.META.get("REMOTE_ADDR") not in allowed_ips:
+            return HttpResponseForbidden()
+
+        return HttpResponse(
+            registry.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class NameCursorPagination(CursorPagination):
+    """
+    Paginação por cursor em ordem alfabética (desempate pelo id).
+
+    O cursor guarda a posição do último nome da página: cada página é
+    um WHERE name > ... LIMIT, sem OFFSET crescente.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = ("name", "id")
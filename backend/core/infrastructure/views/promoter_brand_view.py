@@ -1,22 +1,52 @@
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from core.infrastructure.models.promoter_brand_model import PromoterBrand
-from core.infrastructure.serializers.promoter_brand_serializer import PromoterBrandSerializer
+from rest_framework.decorators import action
+from core.infrastructure.serializers.promoter_brand_serializer import (
+    AllowedStoresSerializer,
+    PromoterBrandReplaceSerializer,
+    PromoterBrandSerializer,
+)
 from core.infrastructure.repositories.promoter_brand_repository import PromoterBrandRepository
+from core.infrastructure.repositories.allowed_stores_repository import (
+    AllowedStoresRepository,
+)
 from rest_framework.permissions import IsAuthenticated
+from django.db.models import Prefetch
+from core.infrastructure.models.brand_model import BrandStore
+from core.infrastructure.views.query_plan import QueryPlan, QueryPlanMixin
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+import logging
 
+logger = logging.getLogger(__name__)
 
-class PromoterBrandViewSet(viewsets.ModelViewSet):
+
+class PromoterBrandViewSet(QueryPlanMixin, viewsets.ModelViewSet):
     serializer_class = PromoterBrandSerializer
     permission_classes = [IsAuthenticated]
     repository = PromoterBrandRepository()
+    # O serializer lê o promotor, a marca e as lojas da marca
+    # (brand.brandstore_set com store.name)
+    query_plans = {
+        "default": QueryPlan(
+            select_related=("promoter", "brand"),
+            prefetch_related=(
+                Prefetch(
+                    "brand__brandstore_set",
+                    queryset=BrandStore.objects.select_related("store")
+                ),
+            )
+        ),
+    }
 
     def get_queryset(self):
         promoter_id = self.request.query_params.get('promoter_id', None)
+        query_plan = self.get_query_plan()
 
         if promoter_id:
-            return self.repository.get_promoter_brands_by_promoter(promoter_id)
-        return self.repository.get_all_promoter_brands()
+            return self.repository.get_promoter_brands_by_promoter(
+                promoter_id, query_plan)
+        return self.repository.get_all_promoter_brands(query_plan)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -37,10 +67,118 @@ class PromoterBrandViewSet(viewsets.ModelViewSet):
         except PromoterBrand.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-    def update_promoter_brands(self, request, promoter_id):
+    @extend_schema(
+        description="""Define as marcas de um ou mais promotores.
+        - Requer papel de Analista (role=2) ou Gestor (role=3)
+        - Apenas os vínculos que mudaram são criados ou removidos
+        - brand_ids vazio remove todas as marcas do promotor
+        - Todas as alterações são aplicadas numa única transação""",
+        request=PromoterBrandReplaceSerializer,
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "added": {"type": "integer"},
+                    "removed": {"type": "integer"},
+                    "unchanged": {"type": "integer"}
+                }
+            },
+            400: {
+                "type": "object",
+                "properties": {"error": {"type": "object"}}
+            },
+            403: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            },
+            500: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            }
+        }
+    )
+    @action(detail=False, methods=["put"], url_path="replace")
+    def update_promoter_brands(self, request):
         """
-        Atualiza todas as marcas de um promotor de uma vez.
+        Atualiza todas as marcas de um ou mais promotores de uma vez.
         """
-        brand_ids = request.data.get('brand_ids', [])
-        self.repository.update_promoter_brands(promoter_id, brand_ids)
-        return Response(status=status.HTTP_200_OK)
+        if request.user.role not in [2, 3]:  # 2 = Analista, 3 = Gestor
+            return Response(
+                {"error": "Apenas gerentes e analistas podem alterar as "
+                          "marcas dos promotores."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = PromoterBrandReplaceSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            result = self.repository.replace_promoter_brands({
+                item["promoter_id"]: item["brand_ids"]
+                for item in serializer.validated_data["assignments"]
+            })
+            return Response(result, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Erro ao alterar as marcas dos promotores: {e}")
+            return Response(
+                {"error": "Erro ao alterar as marcas dos promotores."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @extend_schema(
+        description="""Lojas que o promotor pode visitar (lojas das marcas
+        vinculadas a ele), com as marcas de cada loja.
+        - Promotores veem as próprias lojas
+        - Analistas e gestores informam promoter_id""",
+        parameters=[
+            OpenApiParameter(
+                name="promoter_id",
+                type=int,
+                description="ID do promotor (analistas e gestores)"
+            ),
+        ],
+        responses={
+            200: AllowedStoresSerializer,
+            400: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            },
+            500: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            }
+        }
+    )
+    @action(detail=False, methods=["get"], url_path="allowed-stores")
+    def allowed_stores(self, request):
+        """ Lojas e marcas permitidas do promotor """
+        if request.user.role == 1:  # Promotor
+            promoter_id = request.user.id
+        else:
+            try:
+                promoter_id = int(request.query_params["promoter_id"])
+            except (KeyError, ValueError):
+                return Response(
+                    {"error": "Informe o promoter_id."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        try:
+            index = AllowedStoresRepository.get(promoter_id)
+            return Response(
+                AllowedStoresSerializer({
+                    "promoter_id": promoter_id,
+                    "stores": index["stores"],
+                }).data,
+                status=status.HTTP_200_OK
+            )
+        except Exception as e:
+            logger.error(f"Erro ao buscar as lojas do promotor: {e}")
+            return Response(
+                {"error": "Erro ao buscar as lojas do promotor."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
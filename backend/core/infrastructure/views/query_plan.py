@@ -0,0 +1,62 @@
+from typing import Dict, Optional, Sequence
+from django.db.models import QuerySet
+
+
+class QueryPlan:
+    """
+    Declara os joins necessários para serializar um queryset.
+
+    Args:
+        select_related: Relações carregadas via JOIN na mesma consulta
+        prefetch_related: Relações carregadas em consultas separadas
+            (nomes ou objetos ``Prefetch``)
+    """
+
+    def __init__(
+        self,
+        select_related: Sequence[str] = (),
+        prefetch_related: Sequence = ()
+    ):
+        self.select_related = tuple(select_related)
+        self.prefetch_related = tuple(prefetch_related)
+
+    @property
+    def cache_id(self) -> str:
+        """Identifica o plano em chaves de cache de querysets já avaliados,
+        que guardam os joins carregados"""
+        prefetches = (
+            getattr(lookup, "prefetch_to", lookup)
+            for lookup in self.prefetch_related
+        )
+        return "select:{}|prefetch:{}".format(
+            ",".join(self.select_related), ",".join(prefetches))
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Aplica o plano ao queryset"""
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+
+class QueryPlanMixin:
+    """
+    Mixin para ViewSets que declaram um plano de consulta por ação.
+
+    ``query_plans`` mapeia o nome da ação (``list``, ``retrieve``...) para
+    um ``QueryPlan``. A chave ``default`` é usada para as ações sem plano
+    próprio.
+    """
+
+    query_plans: Dict[str, QueryPlan] = {}
+
+    def get_query_plan(self) -> Optional[QueryPlan]:
+        """Retorna o plano da ação atual"""
+        action = getattr(self, "action", None)
+        return self.query_plans.get(action, self.query_plans.get("default"))
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        plan = self.get_query_plan()
+        return plan.apply(queryset) if plan else queryset
@@ -0,0 +1,119 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
+from ..database.search import SEARCH_TARGETS
+from ..repositories.search_repository import SearchRepository
+from ..serializers.search_serializer import SearchSerializer
+import logging
+
+logger = logging.getLogger(__name__)
+
+MIN_TERM_LENGTH = 2
+MAX_LIMIT = 50
+
+
+class SearchView(APIView):
+    """
+    View da busca em lojas, marcas e usuários
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = SearchSerializer
+
+    @staticmethod
+    def allowed_targets(user) -> list:
+        """Usuários só aparecem para gestores, como na listagem"""
+        if user.role == 3:  # 3 = Gestor
+            return list(SEARCH_TARGETS)
+        return [name for name in SEARCH_TARGETS if name != "users"]
+
+    @extend_schema(
+        description=(
+            "Busca lojas (nome, cidade, CNPJ), marcas (nome) e usuários "
+            "(nome, sobrenome, CPF) e devolve os resultados mais "
+            "relevantes de cada tabela, tolerando erros de digitação no "
+            "PostgreSQL. Usuários apenas para gestores."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=str,
+                required=True,
+                description=f"Texto pesquisado (mínimo {MIN_TERM_LENGTH} "
+                            f"caracteres)"
+            ),
+            OpenApiParameter(
+                name="types",
+                type=str,
+                description="Tabelas separadas por vírgula: stores, brands, "
+                            "users (padrão: todas as permitidas)"
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=int,
+                description=f"Resultados por tabela (padrão 10, máximo "
+                            f"{MAX_LIMIT})"
+            ),
+        ],
+        responses={
+            200: SearchSerializer,
+            400: OpenApiTypes.STR,
+            401: OpenApiTypes.STR,
+            403: OpenApiTypes.STR,
+            500: OpenApiTypes.STR
+        },
+        tags=['Busca']
+    )
+    def get(self, request):
+        term = " ".join(request.query_params.get("q", "").split())
+        if len(term) < MIN_TERM_LENGTH:
+            return Response(
+                {"error": f"Informe ao menos {MIN_TERM_LENGTH} caracteres "
+                          f"em q."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_LIMIT:
+            return Response(
+                {"error": f"limit deve estar entre 1 e {MAX_LIMIT}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        allowed = self.allowed_targets(request.user)
+        targets = allowed
+        if request.query_params.get("types"):
+            targets = [
+                name.strip()
+                for name in request.query_params["types"].split(",")
+                if name.strip()
+            ]
+            unknown = [name for name in targets if name not in SEARCH_TARGETS]
+            if unknown:
+                return Response(
+                    {"error": f"Tipos inválidos: {', '.join(unknown)}."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if any(name not in allowed for name in targets):
+                return Response(
+                    {"error": "Apenas gestores podem buscar usuários."},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+
+        try:
+            results = SearchRepository.search(term, targets, limit)
+            return Response(
+                self.serializer_class(results).data,
+                status=status.HTTP_200_OK
+            )
+        except Exception as e:
+            logger.error(f"Erro na busca: {e}")
+            return Response(
+                {"error": "Erro na busca."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,123 @@
+from rest_framework import status
+from rest_framework.response import Response
+from drf_spectacular.utils import OpenApiParameter
+from core.infrastructure.repositories.spreadsheet_import import (
+    SpreadsheetImportError,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+ERROR_RESPONSE = {
+    "type": "object",
+    "properties": {"error": {"type": "string"}}
+}
+
+IMPORT_REQUEST = {
+    "multipart/form-data": {
+        "type": "object",
+        "properties": {
+            "file": {"type": "string", "format": "binary"}
+        },
+        "required": ["file"]
+    }
+}
+
+
+def dry_run_parameter(description: str) -> OpenApiParameter:
+    """Parâmetro dry_run das importações por arquivo"""
+    return OpenApiParameter(name="dry_run", type=bool, description=description)
+
+
+def import_responses(count_field: str) -> dict:
+    """
+    Respostas das importações por arquivo.
+
+    Args:
+        count_field: Campo com a quantidade de registros gravados
+    """
+    return {
+        200: {
+            "type": "object",
+            "properties": {
+                "total_rows": {"type": "integer"},
+                "valid_rows": {"type": "integer"},
+                count_field: {"type": "integer"},
+                "dry_run": {"type": "boolean"},
+                "errors": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "row": {"type": "integer"},
+                            "errors": {
+                                "type": "array",
+                                "items": {"type": "string"}
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        400: ERROR_RESPONSE,
+        403: ERROR_RESPONSE,
+        500: ERROR_RESPONSE,
+    }
+
+
+class SpreadsheetImportMixin:
+    """
+    Fluxo comum das importações por arquivo CSV/XLSX: permissão de
+    analista/gestor, arquivo no campo 'file', parâmetro dry_run e
+    tradução dos erros de leitura em 400.
+    """
+
+    def check_manager_analyst_permission(self):
+        """Verifica se o usuário é gerente ou analista"""
+        user_role = self.request.user.role
+        if user_role not in [2, 3]:  # 2 = Analista, 3 = Gestor
+            raise PermissionError(
+                "Apenas gerentes e analistas podem realizar esta operação."
+            )
+
+    def run_import(self, request, importer, label: str) -> Response:
+        """
+        Executa a importação do arquivo enviado.
+
+        Args:
+            request: Requisição multipart com o arquivo em 'file'
+            importer: Função (arquivo, dry_run) -> relatório da importação
+            label: Nome do que é importado, usado nas mensagens de erro
+        """
+        try:
+            self.check_manager_analyst_permission()
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        uploaded_file = request.FILES.get("file")
+        if uploaded_file is None:
+            return Response(
+                {"error": "Envie o arquivo no campo 'file'."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        dry_run = request.query_params.get("dry_run", "").lower() in (
+            "1", "true")
+
+        try:
+            result = importer(uploaded_file, dry_run=dry_run)
+            return Response(result, status=status.HTTP_200_OK)
+        except SpreadsheetImportError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Erro ao importar {label}: {e}")
+            return Response(
+                {"error": f"Erro ao importar {label}."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
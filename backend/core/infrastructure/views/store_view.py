@@ -1,9 +1,33 @@
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from core.infrastructure.models.store_model import StoreModel
-from core.infrastructure.serializers.store_serializer import StoreSerializer
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from core.infrastructure.repositories.store_import_repository import (
+    StoreImportRepository,
+)
+from core.infrastructure.repositories.store_repository import (
+    StoreFilters,
+    StoreRepository,
+)
+from core.infrastructure.serializers.store_serializer import (
+    StoreSerializer,
+    STORE_LIST_PROJECTION,
+)
+from core.infrastructure.views.pagination import NameCursorPagination
+from core.infrastructure.views.spreadsheet_import import (
+    IMPORT_REQUEST,
+    SpreadsheetImportMixin,
+    dry_run_parameter,
+    import_responses,
+)
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,11 +35,39 @@ logger = logging.getLogger(__name__)
 
 @extend_schema_view(
     list=extend_schema(
-        description="""Lista todas as lojas cadastradas.
+        description="""Lista as lojas cadastradas.
         - Todos os usuários autenticados podem listar
-        - Não requer papel específico""",
+        - Filtros opcionais: state, city e brand
+        - Com cursor, page_size ou facets=true a resposta é paginada por cursor
+          em ordem alfabética: {next, previous, results}; com facets=true
+          a primeira página inclui as quantidades de lojas por estado e
+          por cidade
+        - Sem esses parâmetros devolve a lista completa""",
+        parameters=[
+            OpenApiParameter(
+                name="state", type=str, description="UF (ex: SP)"),
+            OpenApiParameter(
+                name="city", type=str,
+                description="Cidade (sem diferenciar maiúsculas)"),
+            OpenApiParameter(
+                name="brand", type=int,
+                description="Apenas lojas atendidas pela marca"),
+            OpenApiParameter(
+                name="cursor", type=str,
+                description="Cursor da página (links next/previous)"),
+            OpenApiParameter(
+                name="page_size", type=int,
+                description="Lojas por página (padrão 50, máximo 200)"),
+            OpenApiParameter(
+                name="facets", type=bool,
+                description="Inclui as facetas de estado e cidade"),
+        ],
         responses={
             200: StoreSerializer(many=True),
+            400: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            },
             500: {
                 "type": "object",
                 "properties": {"error": {"type": "string"}}
@@ -106,7 +158,7 @@ logger = logging.getLogger(__name__)
         }
     )
 )
-class StoreViewSet(viewsets.ModelViewSet):
+class StoreViewSet(SpreadsheetImportMixin, viewsets.ModelViewSet):
     """ ViewSet para gerenciar Lojas """
 
     queryset = StoreModel.objects.all()
@@ -115,20 +167,40 @@ class StoreViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         return [IsAuthenticated()]
 
-    def check_manager_analyst_permission(self):
-        """Verifica se o usuário é gerente ou analista"""
-        user_role = self.request.user.role
-        if user_role not in [2, 3]:  # 2 = Analista, 3 = Gestor
-            raise PermissionError(
-                "Apenas gerentes e analistas podem realizar esta operação."
-            )
+    # Parâmetros que ativam a resposta paginada (além de facets=true)
+    PAGINATION_PARAMS = ("cursor", "page_size")
 
     def list(self, request, *args, **kwargs):
-        """ Lista todas as lojas """
+        """ Lista as lojas, com filtros e paginação opcionais """
+        try:
+            filters = StoreFilters.from_query_params(request.query_params)
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        facets = request.query_params.get("facets") in ("true", "1")
+        paginated = facets or any(
+            param in request.query_params for param in self.PAGINATION_PARAMS)
+
         try:
-            stores = self.get_queryset()
-            serializer = self.get_serializer(stores, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            if not paginated:
+                stores = STORE_LIST_PROJECTION.project(
+                    filters.apply(self.get_queryset()))
+                return Response(stores, status=status.HTTP_200_OK)
+
+            paginator = NameCursorPagination()
+            page = paginator.paginate_queryset(
+                StoreRepository.list(filters), request, view=self)
+            response = paginator.get_paginated_response(page)
+            # Facetas só na primeira página: o link next repete facets=true
+            if facets and "cursor" not in request.query_params:
+                response.data["facets"] = StoreRepository.facets(filters)
+            return response
+        except APIException:
+            # Ex: cursor inválido (404 do DRF)
+            raise
         except Exception as e:
             logger.error(f"Erro ao listar lojas: {e}")
             return Response(
@@ -228,3 +300,25 @@ class StoreViewSet(viewsets.ModelViewSet):
                 {"error": "Erro ao excluir loja."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    @extend_schema(
+        description="""Importa lojas em lote a partir de um arquivo CSV ou XLSX.
+        - Requer papel de Analista (role=2) ou Gestor (role=3)
+        - Colunas: name (nome), city (cidade), state (estado/uf) e,
+          opcionalmente, number (numero) e cnpj
+        - Linhas inválidas são ignoradas e listadas no relatório de erros
+        - Use dry_run=true para apenas validar o arquivo""",
+        request=IMPORT_REQUEST,
+        parameters=[dry_run_parameter("Apenas valida, sem inserir as lojas")],
+        responses=import_responses("created")
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser]
+    )
+    def bulk_import(self, request):
+        """ Importa lojas em lote a partir de um arquivo CSV/XLSX """
+        return self.run_import(
+            request, StoreImportRepository.import_stores, "lojas")
@@ -6,6 +6,8 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 import logging
 from django.contrib.auth import get_user_model
 from ..serializers.user_serializer import UserSerializer, UserCreateSerializer, UserUpdateSerializer
+from ..serializers.user_serializer import UserMeSerializer
+from ..serializers.user_serializer import USER_LIST_PROJECTION
 from ..permissions import IsManagerOrAnalyst
 
 logger = logging.getLogger(__name__)
@@ -87,6 +89,20 @@ class UserViewSet(viewsets.ModelViewSet):
             return [IsManagerOrAnalyst()]
         return [IsAuthenticated()]
 
+    def list(self, request, *args, **kwargs):
+        """Lista os usuários usando a projeção somente leitura"""
+        try:
+            users = USER_LIST_PROJECTION.project(
+                self.filter_queryset(self.get_queryset())
+            )
+            return Response(users)
+        except Exception as e:
+            logger.error(f"Erro ao listar usuários: {str(e)}")
+            return Response(
+                {"error": "Erro ao listar usuários"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
     @extend_schema(
         summary="Cria um novo usuário",
         description="""
@@ -163,8 +179,11 @@ class UserViewSet(viewsets.ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
     @extend_schema(
-        description="Retorna os dados do usuário logado",
-        responses={200: UserSerializer}
+        description=(
+            "Retorna os dados do usuário logado. Para promotores, stats traz "
+            "os totais de visitas de hoje, da semana e do mês."
+        ),
+        responses={200: UserMeSerializer}
     )
     @action(detail=False, methods=['get'])
     def me(self, request):
@@ -179,8 +198,8 @@ class UserViewSet(viewsets.ModelViewSet):
             # Busca o usuário do banco de dados para garantir dados atualizados
             user = User.objects.get(id=request.user.id)
 
-            # Usa o serializador principal do usuário
-            serializer = UserSerializer(
+            # Serializador do usuário com os totais do promotor
+            serializer = UserMeSerializer(
                 user,
                 context={'request': request}
             )
@@ -1,9 +1,23 @@
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from core.infrastructure.models.visit_price_model import VisitPriceModel
+from core.infrastructure.repositories.visit_price_repository import (
+    VisitPriceRepository,
+)
 from core.infrastructure.serializers.visit_price_serializer import (
+    VisitPriceBulkSerializer,
     VisitPriceSerializer,
+    VISIT_PRICE_LIST_PROJECTION,
+)
+from core.infrastructure.views.query_plan import QueryPlan, QueryPlanMixin
+from core.infrastructure.views.spreadsheet_import import (
+    IMPORT_REQUEST,
+    SpreadsheetImportMixin,
+    dry_run_parameter,
+    import_responses,
 )
 from drf_spectacular.utils import extend_schema, extend_schema_view
 import logging
@@ -63,11 +77,17 @@ logger = logging.getLogger(__name__)
         }
     )
 )
-class VisitPriceViewSet(viewsets.ModelViewSet):
+class VisitPriceViewSet(SpreadsheetImportMixin, QueryPlanMixin,
+                        viewsets.ModelViewSet):
     """ ViewSet para gerenciar Preços de Visita """
 
     queryset = VisitPriceModel.objects.all()
     serializer_class = VisitPriceSerializer
+    # A listagem usa a projeção (values); as demais ações serializam
+    # store.name, store.number e brand.name
+    query_plans = {
+        "default": QueryPlan(select_related=("store", "brand")),
+    }
 
     def get_permissions(self):
         return [IsAuthenticated()]
@@ -75,9 +95,10 @@ class VisitPriceViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         """ Lista todos os preços de visita """
         try:
-            visit_prices = self.get_queryset()
-            serializer = self.get_serializer(visit_prices, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            visit_prices = VISIT_PRICE_LIST_PROJECTION.project(
+                self.get_queryset()
+            )
+            return Response(visit_prices, status=status.HTTP_200_OK)
         except Exception as e:
             logger.error(f"Erro ao listar preços de visita: {e}")
             return Response(
@@ -92,6 +113,8 @@ class VisitPriceViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             try:
                 visit_price = serializer.save()
+                VisitPriceRepository.clear_cache(
+                    [(visit_price.store_id, visit_price.brand_id)])
                 return Response(self.get_serializer(visit_price).data,
                                 status=status.HTTP_201_CREATED)
             except Exception as e:
@@ -112,12 +135,17 @@ class VisitPriceViewSet(viewsets.ModelViewSet):
     def update(self, request, *args, **kwargs):
         """ Atualiza um preço de visita existente """
         instance = self.get_object()
+        previous_pair = (instance.store_id, instance.brand_id)
         serializer = self.get_serializer(
             instance, data=request.data, partial=True)
 
         if serializer.is_valid():
             try:
                 visit_price = serializer.save()
+                VisitPriceRepository.clear_cache([
+                    previous_pair,
+                    (visit_price.store_id, visit_price.brand_id),
+                ])
                 return Response(self.get_serializer(visit_price).data,
                                 status=status.HTTP_200_OK)
             except Exception as e:
@@ -141,6 +169,8 @@ class VisitPriceViewSet(viewsets.ModelViewSet):
 
         try:
             instance.delete()
+            VisitPriceRepository.clear_cache(
+                [(instance.store_id, instance.brand_id)])
             return Response(
                 {"message": "Preço de visita excluído com sucesso."},
                 status=status.HTTP_204_NO_CONTENT
@@ -151,3 +181,80 @@ class VisitPriceViewSet(viewsets.ModelViewSet):
                 {"error": "Erro ao excluir preço de visita."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    @extend_schema(
+        description="""Grava preços de visita em lote (loja x marca).
+        - Requer papel de Analista (role=2) ou Gestor (role=3)
+        - Combinações existentes têm o preço atualizado
+        - O lote é validado por completo e gravado numa única operação""",
+        request=VisitPriceBulkSerializer,
+        responses={
+            200: {
+                "type": "object",
+                "properties": {"saved": {"type": "integer"}}
+            },
+            400: {
+                "type": "object",
+                "properties": {"error": {"type": "object"}}
+            },
+            403: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            },
+            500: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            }
+        }
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_upsert(self, request):
+        """ Grava preços de visita em lote """
+        try:
+            self.check_manager_analyst_permission()
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = VisitPriceBulkSerializer(data=request.data)
+        if not serializer.is_valid():
+            logger.warning(
+                f"Erro de validação nos preços em lote: {serializer.errors}")
+            return Response(
+                {"error": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            saved = VisitPriceRepository.bulk_upsert(
+                serializer.validated_data["prices"])
+            return Response({"saved": saved}, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Erro ao gravar preços em lote: {e}")
+            return Response(
+                {"error": "Erro ao gravar preços de visita."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @extend_schema(
+        description="""Importa preços de visita de um arquivo CSV ou XLSX.
+        - Requer papel de Analista (role=2) ou Gestor (role=3)
+        - Colunas: store (loja), brand (marca) e price (preco/valor)
+        - Linhas inválidas são ignoradas e listadas no relatório de erros
+        - Use dry_run=true para apenas validar o arquivo""",
+        request=IMPORT_REQUEST,
+        parameters=[dry_run_parameter("Apenas valida, sem gravar os preços")],
+        responses=import_responses("saved")
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser]
+    )
+    def bulk_import(self, request):
+        """ Importa preços de visita de um arquivo CSV/XLSX """
+        return self.run_import(
+            request, VisitPriceRepository.import_prices, "preços de visita")
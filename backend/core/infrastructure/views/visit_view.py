@@ -2,19 +2,37 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.http import HttpResponse
-from core.infrastructure.serializers.visit_serializer import VisitSerializer
+from core.infrastructure.serializers.visit_serializer import (
+    VisitSerializer,
+    VisitTransitionSerializer,
+    VisitTransitionResultSerializer,
+    VISIT_REPORT_PROJECTION,
+)
 from core.infrastructure.repositories.visit_repository import DjangoVisitRepository  # noqa: E501
+from core.infrastructure.repositories.visit_archive_repository import (
+    VisitArchiveRepository,
+)
+from core.infrastructure.repositories.schedule_repository import (
+    ScheduleRepository,
+)
+from core.infrastructure.serializers.schedule_serializer import (
+    ScheduleRequestSerializer,
+    ScheduleResultSerializer,
+)
 from core.infrastructure.domain.entities.visit import Visit
 from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.views.query_plan import QueryPlan, QueryPlanMixin
 from reportlab.pdfgen import canvas
 from io import BytesIO
 from rest_framework.decorators import action
 from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
 import pandas as pd
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from datetime import datetime, timedelta
 import logging
-from core.infrastructure.models.user_model import User
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -25,6 +43,17 @@ from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Ordem das linhas nas exportações: agrupadas por promotor, depois por data
+EXPORT_ORDERING = (
+    "promoter__first_name", "promoter__last_name", "promoter_id",
+    "visit_date", "id"
+)
+# Mesma ordem sobre as linhas de VISIT_REPORT_PROJECTION (banco + arquivo)
+EXPORT_SORT_KEY = itemgetter(
+    "promoter_first_name", "promoter_last_name", "promoter_id",
+    "visit_date", "id"
+)
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -143,7 +172,7 @@ logger = logging.getLogger(__name__)
         }
     )
 )
-class VisitViewSet(viewsets.ModelViewSet):
+class VisitViewSet(QueryPlanMixin, viewsets.ModelViewSet):
     """ ViewSet para gerenciar Visitas """
 
     serializer_class = VisitSerializer
@@ -152,29 +181,31 @@ class VisitViewSet(viewsets.ModelViewSet):
     lookup_field = 'pk'
     lookup_url_kwarg = 'id'
     permission_classes = [IsAuthenticated]
+    # O VisitSerializer e os relatórios leem promotor, loja e marca
+    query_plans = {
+        "default": QueryPlan(select_related=("promoter", "store", "brand")),
+    }
 
     def get_queryset(self):
         """
         Filtra as visitas com base no papel do usuário:
         - Promotores veem apenas suas próprias visitas
-        - Gerentes veem visitas de suas marcas
-        - Administradores veem todas as visitas
+        - Analistas e Gestores veem todas as visitas
         """
         user = self.request.user
-        queryset = VisitModel.objects.all()
+        queryset = super().get_queryset()
 
         if user.role == 1:  # Promotor
             return queryset.filter(promoter=user)
-        elif user.role == 2:  # Gerente
-            return queryset.filter(brand__manager=user)
-        elif user.role == 3:  # Administrador
+        elif user.role in [2, 3]:  # Analista e Gestor
             return queryset
 
         return queryset.none()
 
     def retrieve(self, request, *args, **kwargs):
         """Busca uma visita específica"""
-        visit = self.visit_repository.get_by_id(int(kwargs['pk']))
+        visit = self.visit_repository.get_by_id(
+            int(kwargs[self.lookup_url_kwarg]))
         if not visit:
             return Response(
                 {"error": "Visita não encontrada"},
@@ -187,14 +218,15 @@ class VisitViewSet(viewsets.ModelViewSet):
         """Cria uma nova visita"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
 
         # Cria a entidade Visit
         visit = Visit(
             id=None,
-            promoter_id=serializer.validated_data['promoter'].id,
-            store_id=serializer.validated_data['store'].id,
-            brand=serializer.validated_data['brand'],
-            visit_date=str(serializer.validated_data['visit_date'])
+            promoter_id=data['promoter_id'],
+            store_id=data['store_id'],
+            brand_id=data['brand_id'],
+            visit_date=str(data['visit_date'])
         )
 
         # Salva usando o repositório
@@ -212,14 +244,15 @@ class VisitViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data)
         serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
 
-        # Cria a entidade Visit
+        # Cria a entidade Visit (campos omitidos mantêm o valor atual)
         visit = Visit(
             id=instance.id,
-            promoter_id=serializer.validated_data['promoter'].id,
-            store_id=serializer.validated_data['store'].id,
-            brand=serializer.validated_data['brand'],
-            visit_date=str(serializer.validated_data['visit_date'])
+            promoter_id=data.get('promoter_id', instance.promoter_id),
+            store_id=data.get('store_id', instance.store_id),
+            brand_id=data.get('brand_id', instance.brand_id),
+            visit_date=str(data.get('visit_date', instance.visit_date))
         )
 
         # Atualiza usando o repositório
@@ -231,7 +264,7 @@ class VisitViewSet(viewsets.ModelViewSet):
 
     def destroy(self, request, *args, **kwargs):
         """Remove uma visita"""
-        visit_id = int(kwargs['pk'])
+        visit_id = int(kwargs[self.lookup_url_kwarg])
         try:
             self.visit_repository.delete(visit_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
@@ -296,57 +329,31 @@ class VisitViewSet(viewsets.ModelViewSet):
         - start_date: Data inicial (YYYY-MM-DD)
         - end_date: Data final (YYYY-MM-DD)
         """
-        # Se for promotor, força o filtro para mostrar apenas suas visitas
-        if request.user.role == 1:
-            try:
-                promoter = User.objects.get(
-                    user_profile=request.user.userprofile)
-                promoter_id = promoter.id
-            except User.DoesNotExist:
-                return Response(
-                    {"error": "Usuário não possui um promotor associado."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        else:
-            promoter_id = request.query_params.get("promoter")
-
-        # Busca visitas usando o repositório
-        visits = self.visit_repository.get_visits_by_filters(
-            promoter_id=promoter_id if promoter_id else None,
-            store_id=request.query_params.get("store"),
-            brand_id=request.query_params.get("brand"),
-            start_date=request.query_params.get("start_date"),
-            end_date=request.query_params.get("end_date"),
-            user_id=request.user.id if (
-                request.user.role == 1) else None
-        )
+        # O get_queryset já restringe promotores às próprias visitas
+        visits = self._filter_visits(request)
 
         # Agrupa as visitas por promotor para calcular totais
         promoter_totals = {}
-        visits_data = []
+        visits_data = self.get_serializer(visits, many=True).data
 
-        for visit in visits:
-            promoter_id = visit.promoter_id
-            visit_price = Decimal(
-                str(self.get_serializer().get_visit_price(visit)))
+        for visit_data in visits_data:
+            promoter_id = visit_data['promoter']['id']
+            visit_price = Decimal(str(visit_data['visit_price']))
 
             if promoter_id not in promoter_totals:
                 promoter_totals[promoter_id] = {
                     'total_visits': 0,
-                    'total_value': Decimal('0.00'),
-                    'promoter_name': visit.promoter.name
+                    'total_value': Decimal('0.00')
                 }
 
             promoter_totals[promoter_id]['total_visits'] += 1
             promoter_totals[promoter_id]['total_value'] += visit_price
 
-            visit_data = self.get_serializer(visit).data
             visit_data['promoter_total_visits'] = promoter_totals[
                 promoter_id]['total_visits']
             visit_data['promoter_total_value'] = float(
                 promoter_totals[promoter_id]['total_value'])
             visit_data['visit_price'] = float(visit_price)
-            visits_data.append(visit_data)
 
         return Response(visits_data, status=status.HTTP_200_OK)
 
@@ -373,6 +380,56 @@ class VisitViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def _archive_filters(self, start_date=None, end_date=None,
+                         promoter_id=None, store_id=None, brand_id=None):
+        """
+        Filtros das visitas arquivadas equivalentes ao get_queryset com os
+        filtros da requisição (None se o usuário não vê nenhuma visita)
+        """
+        user = self.request.user
+        if user.role == 1:  # Promotor: apenas as próprias visitas
+            if promoter_id and int(promoter_id) != user.id:
+                return None
+            promoter_id = user.id
+        elif user.role not in [2, 3]:
+            return None
+
+        if isinstance(start_date, str):
+            start_date = parse_date(start_date)
+        if isinstance(end_date, str):
+            end_date = parse_date(end_date)
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "promoter_id": int(promoter_id) if promoter_id else None,
+            "store_id": int(store_id) if store_id else None,
+            "brand_id": int(brand_id) if brand_id else None,
+        }
+
+    def _report_rows(self, queryset, archive_filters, ordering=None):
+        """
+        Linhas planas das visitas (values, sem instanciar modelos) com o
+        preço congelado de cada visita.
+
+        O período anterior à marca d'água do arquivo frio é lido dos
+        arquivos mensais (VisitArchiveRepository), e não do banco.
+        """
+        watermark = VisitArchiveRepository.watermark()
+        if watermark:
+            queryset = queryset.filter(visit_date__gte=watermark)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        rows = VISIT_REPORT_PROJECTION.project(queryset)
+
+        if watermark and archive_filters is not None:
+            # As visitas arquivadas são todas anteriores às do banco
+            archived = VisitArchiveRepository.read_rows(**archive_filters)
+            if archived:
+                rows.extend(archived)
+                if ordering:
+                    rows.sort(key=EXPORT_SORT_KEY)
+        return rows
+
     @extend_schema(
         description="Exporta relatório de visitas para Excel",
         parameters=[
@@ -418,57 +475,55 @@ class VisitViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export_excel(self, request):
         """Exporta visitas filtradas para Excel com totais por promotor"""
-        visits = self._filter_visits(request)
-
-        # Ordenar por promotor e data
-        visits = visits.order_by('promoter__name', 'visit_date')
+        rows = self._report_rows(
+            self._filter_visits(request),
+            self._archive_filters(
+                start_date=request.GET.get('start_date'),
+                end_date=request.GET.get('end_date'),
+                promoter_id=request.GET.get('promoter'),
+                store_id=request.GET.get('store'),
+                brand_id=request.GET.get('brand'),
+            ),
+            ordering=EXPORT_ORDERING
+        )
 
         # Preparar dados com totais por promotor
         data = []
-        promoter_totals = {}
 
-        for visit in visits:
-            visit_price = float(self.get_serializer().get_visit_price(visit))
-            promoter_name = visit.promoter.name.upper()
+        for _, promoter_rows in groupby(rows, key=itemgetter("promoter_id")):
+            promoter_total = Decimal("0.00")
+            promoter_name = ""
 
-            if promoter_name not in promoter_totals:
-                promoter_totals[promoter_name] = {
-                    'name': visit.promoter.name.upper(),
-                    'total': 0
-                }
-
-            promoter_totals[promoter_name]['total'] += visit_price
-
-            data.append({
-                "Data": visit.visit_date.strftime("%d/%m/%Y"),
-                "Promotor": visit.promoter.name.upper(),
-                "Loja": f"{visit.store.name.upper()} - {visit.store.number}",
-                "Marca": visit.brand.name.upper() if visit.brand else "N/A",
-                "Valor da Visita (R$)": f"R$ {visit_price:.2f}",
-            })
-
-            # Adiciona linha de total após a última visita de cada promotor
-            next_visit = visits.filter(id__gt=visit.id).first()
-            if not next_visit or next_visit.promoter.name.upper() != promoter_name:  # noqa: E501
+            for row in promoter_rows:
+                promoter_name = row["promoter_name"].upper()
+                promoter_total += row["price"]
                 data.append({
-                    "Data": "",
-                    "Promotor": (
-                        f"Total Acumulado ({promoter_name})"
-                    ),
-                    "Loja": "",
-                    "Marca": "",
-                    "Valor da Visita (R$)": (
-                        f"R$ {promoter_totals[promoter_name]['total']:.2f}"
+                    "Data": row["visit_date"].strftime("%d/%m/%Y"),
+                    "Promotor": promoter_name,
+                    "Loja": (
+                        f"{row['store_name'].upper()} - "
+                        f"{row['store_number']}"
                     ),
+                    "Marca": row["brand_name"].upper(),
+                    "Valor da Visita (R$)": f"R$ {row['price']:.2f}",
                 })
-                # Adiciona uma linha em branco após o total
-                data.append({
-                    "Data": "",
-                    "Promotor": "",
-                    "Loja": "",
-                    "Marca": "",
-                    "Valor da Visita (R$)": "",
-                })
+
+            # Adiciona linha de total após a última visita de cada promotor
+            data.append({
+                "Data": "",
+                "Promotor": f"Total Acumulado ({promoter_name})",
+                "Loja": "",
+                "Marca": "",
+                "Valor da Visita (R$)": f"R$ {promoter_total:.2f}",
+            })
+            # Adiciona uma linha em branco após o total
+            data.append({
+                "Data": "",
+                "Promotor": "",
+                "Loja": "",
+                "Marca": "",
+                "Valor da Visita (R$)": "",
+            })
 
         df = pd.DataFrame(data)
 
@@ -555,10 +610,17 @@ class VisitViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export_pdf(self, request):
         """Exporta visitas filtradas para PDF com totais por promotor"""
-        visits = self._filter_visits(request)
-
-        # Ordenar por promotor e data
-        visits = visits.order_by('promoter__name', 'visit_date')
+        rows = self._report_rows(
+            self._filter_visits(request),
+            self._archive_filters(
+                start_date=request.GET.get('start_date'),
+                end_date=request.GET.get('end_date'),
+                promoter_id=request.GET.get('promoter'),
+                store_id=request.GET.get('store'),
+                brand_id=request.GET.get('brand'),
+            ),
+            ordering=EXPORT_ORDERING
+        )
 
         buffer = BytesIO()
         pdf = canvas.Canvas(buffer)
@@ -573,21 +635,24 @@ class VisitViewSet(viewsets.ModelViewSet):
         y = 750
         line_height = 20  # Altura de cada linha
 
-        current_promoter_name = None
-        promoter_total = 0
-
-        for visit in visits:
-            # Se mudou o promotor, imprime o total do promoter anterior
-            visit_promoter_name = visit.promoter.name.upper()
-            if current_promoter_name and current_promoter_name != visit_promoter_name:  # noqa: E501
-                pdf.setFont("Helvetica-Bold", 10)
-                total_text = (
-                    f"Total Acumulado ({current_promoter_name}): "
-                    f"R$ {promoter_total:.2f}"
+        for _, promoter_rows in groupby(rows, key=itemgetter("promoter_id")):
+            promoter_total = Decimal("0.00")
+            promoter_name = ""
+
+            for row in promoter_rows:
+                promoter_name = row["promoter_name"].upper()
+                promoter_total += row["price"]
+
+                # Formata a data
+                visit_date = row["visit_date"].strftime("%d/%m/%Y")
+
+                # Informações da visita
+                pdf.setFont("Helvetica", 10)
+                visit_text = (
+                    f"{visit_date} - {promoter_name} - "
+                    f"{row['store_name'].upper()} ({row['store_number']}) - "
+                    f"{row['brand_name'].upper()} - R$ {row['price']:.2f}"
                 )
-                pdf.drawString(50, y, total_text)
-                y -= line_height * 2  # Espaço extra após o total
-                promoter_total = 0
 
                 # Nova página se necessário
                 if y < 50:
@@ -595,23 +660,17 @@ class VisitViewSet(viewsets.ModelViewSet):
                     pdf.setFont("Helvetica", 10)
                     y = 750
 
-            # Atualiza o promoter atual
-            current_promoter_name = visit_promoter_name
-            visit_price = float(
-                self.get_serializer().get_visit_price(visit)
-            )
-            promoter_total += visit_price
-
-            # Formata a data
-            visit_date = visit.visit_date.strftime("%d/%m/%Y")
+                pdf.drawString(50, y, visit_text)
+                y -= line_height
 
-            # Informações da visita
-            pdf.setFont("Helvetica", 10)
-            visit_text = (
-                f"{visit_date} - {visit.promoter.name.upper()} - "
-                f"{visit.store.name.upper()} ({visit.store.number}) - "
-                f"{visit.brand.name.upper()} - R$ {visit_price:.2f}"
+            # Imprime o total do promotor
+            pdf.setFont("Helvetica-Bold", 10)
+            total_text = (
+                f"Total Acumulado ({promoter_name}): "
+                f"R$ {promoter_total:.2f}"
             )
+            pdf.drawString(50, y, total_text)
+            y -= line_height * 2  # Espaço extra após o total
 
             # Nova página se necessário
             if y < 50:
@@ -619,18 +678,6 @@ class VisitViewSet(viewsets.ModelViewSet):
                 pdf.setFont("Helvetica", 10)
                 y = 750
 
-            pdf.drawString(50, y, visit_text)
-            y -= line_height
-
-        # Imprime o total do último promoter
-        if current_promoter_name:
-            pdf.setFont("Helvetica-Bold", 10)
-            total_text = (
-                f"Total Acumulado ({current_promoter_name}): "
-                f"R$ {promoter_total:.2f}"
-            )
-            pdf.drawString(50, y, total_text)
-
         pdf.save()
         buffer.seek(0)
 
@@ -639,6 +686,128 @@ class VisitViewSet(viewsets.ModelViewSet):
         response['Content-Disposition'] = filename
         return response
 
+    @extend_schema(
+        description="""Gera a agenda de visitas pendentes de uma semana.
+        Cada marca recebe na loja a quantidade de visitas da periodicidade
+        semanal (BrandStore), menos as já agendadas, atribuídas a promotores
+        vinculados à marca com a carga equilibrada.
+        Apenas analistas (role=2) e gestores (role=3).""",
+        request=ScheduleRequestSerializer,
+        responses={
+            200: ScheduleResultSerializer,
+            201: ScheduleResultSerializer,
+            400: {
+                "type": "object",
+                "properties": {"error": {"type": "object"}}
+            },
+            403: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            },
+            500: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            }
+        }
+    )
+    @action(detail=False, methods=["post"], url_path="generate-schedule")
+    def generate_schedule(self, request):
+        """ Gera as visitas pendentes da semana """
+        if request.user.role not in [2, 3]:  # 2 = Analista, 3 = Gestor
+            return Response(
+                {"error": "Apenas gerentes e analistas podem gerar a "
+                          "agenda."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = ScheduleRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        data = serializer.validated_data
+
+        try:
+            result = ScheduleRepository.generate_week(
+                week_start=data.get(
+                    "week_start", timezone.now().date() + timedelta(days=7)),
+                max_visits_per_day=data["max_visits_per_day"],
+                workdays=data["workdays"],
+                dry_run=data["dry_run"]
+            )
+            return Response(
+                ScheduleResultSerializer(result).data,
+                status=(
+                    status.HTTP_200_OK if data["dry_run"]
+                    else status.HTTP_201_CREATED
+                )
+            )
+        except Exception as e:
+            logger.error(f"Erro ao gerar a agenda: {e}")
+            return Response(
+                {"error": "Erro ao gerar a agenda."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @extend_schema(
+        description="""Altera o status de várias visitas de uma vez.
+        Apenas as transições permitidas são aplicadas (por exemplo, uma
+        visita cancelada só volta a pendente); as demais são devolvidas em
+        skipped com o motivo. Promotores alteram apenas as próprias visitas
+        e apenas para Em Andamento ou Concluída.""",
+        request=VisitTransitionSerializer,
+        responses={
+            200: VisitTransitionResultSerializer,
+            400: {
+                "type": "object",
+                "properties": {"error": {"type": "object"}}
+            },
+            403: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            },
+            500: {
+                "type": "object",
+                "properties": {"error": {"type": "string"}}
+            }
+        }
+    )
+    @action(detail=False, methods=["post"], url_path="transition")
+    def transition(self, request):
+        """ Altera o status de várias visitas """
+        serializer = VisitTransitionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        data = serializer.validated_data
+
+        promoter_id = None
+        if request.user.role == 1:  # Promotor
+            if data["status"] not in [2, 3]:
+                return Response(
+                    {"error": "Promotores só podem iniciar ou concluir "
+                              "visitas."},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            promoter_id = request.user.id
+
+        try:
+            result = self.visit_repository.transition_status(
+                data["ids"], data["status"], promoter_id=promoter_id)
+            return Response(
+                VisitTransitionResultSerializer(
+                    {"status": data["status"], **result}).data
+            )
+        except Exception as e:
+            logger.error(f"Erro ao alterar o status das visitas: {e}")
+            return Response(
+                {"error": "Erro ao alterar o status das visitas."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
     @extend_schema(
         description=(
             "Retorna dados para o dashboard com métricas de visitas por marca e loja"  # noqa: E501
@@ -793,40 +962,45 @@ class VisitViewSet(viewsets.ModelViewSet):
             unique_promoters = set()
             unique_stores = set()
             unique_brands = set()
-
-            for visit in queryset:
-                try:
-                    visit_price = float(self.get_serializer().get_visit_price(visit))
-                except (TypeError, ValueError):
-                    visit_price = 0.0
-
+            total_value = Decimal("0.00")
+
+            archive_filters = self._archive_filters(
+                start_date=start_date,
+                end_date=end_date,
+                promoter_id=filters.get('promoter_id'),
+                store_id=filters.get('store_id'),
+                brand_id=filters.get('brand_id'),
+            )
+            for row in self._report_rows(queryset, archive_filters):
                 visit_data = {
-                    'id': visit.id,
-                    'date': visit.visit_date.strftime('%Y-%m-%d'),
+                    'id': row['id'],
+                    'date': row['visit_date'].strftime('%Y-%m-%d'),
                     'promoter': {
-                        'id': visit.promoter.id,
-                        'name': visit.promoter.get_full_name()
+                        'id': row['promoter_id'],
+                        'name': row['promoter_name']
                     },
                     'store': {
-                        'id': visit.store.id,
-                        'name': visit.store.name,
-                        'number': visit.store.number
+                        'id': row['store_id'],
+                        'name': row['store_name'],
+                        'number': row['store_number']
                     },
                     'brand': {
-                        'id': visit.brand.id,
-                        'name': visit.brand.name
+                        'id': row['brand_id'],
+                        'name': row['brand_name']
                     },
-                    'value': visit_price,
-                    'status': visit.status
+                    'value': float(row['price']),
+                    'status': row['status']
                 }
-                
+
                 report_data['visits'].append(visit_data)
-                report_data['summary']['total_visits'] += 1
-                report_data['summary']['total_value'] += visit_price
-                
-                unique_promoters.add(visit.promoter_id)
-                unique_stores.add(visit.store_id)
-                unique_brands.add(visit.brand_id)
+                total_value += row['price']
+
+                unique_promoters.add(row['promoter_id'])
+                unique_stores.add(row['store_id'])
+                unique_brands.add(row['brand_id'])
+
+            report_data['summary']['total_visits'] = len(report_data['visits'])
+            report_data['summary']['total_value'] = float(total_value)
 
             # Update summary counts
             report_data['summary']['unique_promoters'] = len(unique_promoters)
@@ -0,0 +1,76 @@
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils.dateparse import parse_date
+from core.infrastructure.database.partitioning import (
+    VisitPartitionManager,
+    month_start,
+)
+from core.infrastructure.repositories.visit_archive_repository import (
+    VisitArchiveRepository,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move as visitas anteriores ao corte para o arquivo frio (arquivos "
+        "mensais Parquet ou CSV gzip) e as remove do banco."
+    )
+
+    def add_arguments(self, parser):
+        cutoff = parser.add_mutually_exclusive_group(required=True)
+        cutoff.add_argument(
+            "--older-than-days",
+            type=int,
+            help="Arquiva os meses inteiramente anteriores a N dias atrás"
+        )
+        cutoff.add_argument(
+            "--before",
+            help="Arquiva as visitas anteriores ao mês desta data (YYYY-MM-DD)"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas lista os meses que seriam arquivados"
+        )
+
+    def handle(self, *args, **options):
+        if options["before"]:
+            cutoff = parse_date(options["before"])
+            if cutoff is None:
+                raise CommandError("Data inválida. Use o formato YYYY-MM-DD.")
+        else:
+            cutoff = date.today() - timedelta(days=options["older_than_days"])
+        cutoff = month_start(cutoff)
+
+        if options["dry_run"]:
+            months = VisitArchiveRepository.months_to_archive(cutoff)
+            for month in months:
+                self.stdout.write(f"{month:%Y-%m}")
+            self.stdout.write(
+                f"{len(months)} meses anteriores a {cutoff:%Y-%m} seriam "
+                f"arquivados em {VisitArchiveRepository.directory()} "
+                f"({VisitArchiveRepository.file_format()})."
+            )
+            return
+
+        try:
+            result = VisitArchiveRepository.archive_before(
+                cutoff, log=self.stdout.write)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        # Com a tabela particionada, as partições dos meses arquivados já
+        # estão vazias e podem ser removidas
+        if connection.vendor == "postgresql":
+            manager = VisitPartitionManager()
+            if manager.is_partitioned():
+                for partition in manager.partitions_before(cutoff):
+                    manager.detach_partition(partition, drop=True)
+                    self.stdout.write(f"Partição removida: {partition.name}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['archived']} visitas de {result['months']} meses "
+            f"arquivadas; {result['deleted']} removidas do banco. Marca "
+            f"d'água: {cutoff}."
+        ))
@@ -0,0 +1,68 @@
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.core.management.base import BaseCommand
+from core.infrastructure.cache.cache_config import CacheConfig
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.models.visit_price_model import VisitPriceModel
+
+
+class Command(BaseCommand):
+    help = (
+        "Preenche o preço congelado (VisitModel.price) das visitas que "
+        "ainda não o possuem, em lotes, a partir do VisitPriceModel vigente."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5_000,
+            help="Quantidade de visitas atualizadas por transação"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        current_price = Subquery(
+            VisitPriceModel.objects.filter(
+                store_id=OuterRef("store_id"),
+                brand_id=OuterRef("brand_id")
+            ).values("price")[:1]
+        )
+
+        last_id = 0
+        filled = 0
+        unpriced = 0
+        while True:
+            # Paginação pelo id: visitas sem preço configurado continuam
+            # nulas e não são revisitadas
+            ids = list(
+                VisitModel.objects.filter(
+                    price__isnull=True, id__gt=last_id
+                ).order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            with transaction.atomic():
+                # O update também conta as linhas que receberam NULL (sem
+                # VisitPriceModel): estas são contadas à parte
+                matched = VisitModel.objects.filter(
+                    id__in=ids, price__isnull=True
+                ).update(price=current_price)
+                missing = VisitModel.objects.filter(
+                    id__in=ids, price__isnull=True
+                ).count()
+            filled += matched - missing
+            unpriced += missing
+
+            CacheConfig.delete_many(
+                CacheConfig.get_key(CacheConfig.VISIT_PREFIX, visit_id)
+                for visit_id in ids
+            )
+            last_id = ids[-1]
+            self.stdout.write(f"Visitas processadas até o id {last_id}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{filled} visitas com preço preenchido; {unpriced} sem preço "
+            f"(loja/marca sem VisitPriceModel)."
+        ))
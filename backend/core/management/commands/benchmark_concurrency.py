@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+from benchmarks.concurrency import ASYNC_SCENARIOS, ConcurrencyBenchmark
+from benchmarks.scenarios import SCENARIOS_BY_NAME
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara a vazão (requisições/s) e a latência p50/p95 das rotas de "
+        "leitura nos modos WSGI (views síncronas) e ASGI (views "
+        "assíncronas) com N requisições simultâneas. Use benchmark_seed antes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            choices=ASYNC_SCENARIOS,
+            help="Cenário a executar. Pode ser repetido (padrão: todos)."
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError(
+                "--requests e --concurrency devem ser pelo menos 1.")
+
+        scenarios = [
+            SCENARIOS_BY_NAME[name]
+            for name in options["scenarios"] or ASYNC_SCENARIOS
+        ]
+
+        def log(name, result):
+            for mode, summary in result.items():
+                self.stdout.write(
+                    f"{name:<22} {mode}  {summary['rps']:>8} req/s  "
+                    f"p50={summary['p50_ms']:>9} ms  "
+                    f"p95={summary['p95_ms']:>9} ms  "
+                    f"status={summary['statuses']}"
+                )
+            if result["wsgi"]["rps"]:
+                change = result["asgi"]["rps"] / result["wsgi"]["rps"] - 1
+                self.stdout.write(f"{name:<22} asgi/wsgi  {change:+.0%}")
+
+        ConcurrencyBenchmark(
+            scenarios,
+            requests=options["requests"],
+            concurrency=options["concurrency"]
+        ).run(log=log)
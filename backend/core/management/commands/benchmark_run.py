@@ -0,0 +1,69 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from benchmarks.runner import BenchmarkRunner
+from benchmarks.scenarios import SCENARIOS, SCENARIOS_BY_NAME
+
+
+class Command(BaseCommand):
+    help = (
+        "Executa os cenários de benchmark e reporta p50/p95/p99, consultas "
+        "e pico de memória. Use benchmark_seed antes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            choices=sorted(SCENARIOS_BY_NAME),
+            help="Cenário a executar. Pode ser repetido (padrão: todos)."
+        )
+        parser.add_argument(
+            "--compare",
+            help="Resultado JSON anterior para comparar o p95"
+        )
+        parser.add_argument(
+            "--no-save",
+            action="store_true",
+            help="Não salva o resultado em benchmarks/results"
+        )
+
+    def handle(self, *args, **options):
+        scenarios = (
+            [SCENARIOS_BY_NAME[name] for name in options["scenarios"]]
+            if options["scenarios"] else SCENARIOS
+        )
+        baseline = {}
+        if options["compare"]:
+            try:
+                with open(options["compare"], encoding="utf-8") as f:
+                    baseline = json.load(f)["scenarios"]
+            except (OSError, KeyError, ValueError) as e:
+                raise CommandError(f"Resultado inválido: {e}")
+
+        def log(name, result):
+            line = (
+                f"{name:<22} p50={result['p50_ms']:>9} ms  "
+                f"p95={result['p95_ms']:>9} ms  "
+                f"p99={result['p99_ms']:>9} ms  "
+                f"consultas={result['queries']:<5} "
+                f"rss={result['peak_rss_mb']} MB  "
+                f"status={result['statuses']}"
+            )
+            if name in baseline and baseline[name]["p95_ms"]:
+                change = result["p95_ms"] / baseline[name]["p95_ms"] - 1
+                line += f"  p95 {change:+.0%}"
+            self.stdout.write(line)
+
+        runner = BenchmarkRunner(
+            scenarios,
+            iterations=options["iterations"],
+            warmup=options["warmup"]
+        )
+        results = runner.run(log=log)
+
+        if not options["no_save"]:
+            path = BenchmarkRunner.save(results)
+            self.stdout.write(f"Resultado salvo em {path}")
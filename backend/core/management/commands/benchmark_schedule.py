@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from benchmarks.scheduling import run_schedule_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede o gerador de agenda semanal em dados sintéticos (sem banco): "
+        "tempo, visitas atribuídas e equilíbrio da carga entre promotores."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--promoters", type=int, default=300)
+        parser.add_argument("--stores", type=int, default=2_000)
+        parser.add_argument("--brands", type=int, default=100)
+        parser.add_argument("--brands-per-store", type=int, default=5)
+        parser.add_argument("--brands-per-promoter", type=int, default=5)
+        parser.add_argument("--max-frequency", type=int, default=2)
+        parser.add_argument("--max-visits-per-day", type=int, default=10)
+        parser.add_argument("--workdays", type=int, default=6)
+        parser.add_argument("--iterations", type=int, default=5)
+
+    def handle(self, *args, **options):
+        result = run_schedule_benchmark(
+            iterations=options["iterations"],
+            workdays=options["workdays"],
+            max_visits_per_day=options["max_visits_per_day"],
+            promoters=options["promoters"],
+            stores=options["stores"],
+            brands=options["brands"],
+            brands_per_store=options["brands_per_store"],
+            brands_per_promoter=options["brands_per_promoter"],
+            max_frequency=options["max_frequency"],
+        )
+        self.stdout.write(
+            f"{result['matrix']} combinações marca x loja, "
+            f"{result['demand']} visitas na semana\n"
+            f"tempo: min={result['min_ms']} ms  média={result['mean_ms']} ms\n"
+            f"atribuídas={result['assigned']}  "
+            f"sem promotor={result['unassigned']}  "
+            f"idas às lojas={result['store_trips']}\n"
+            f"carga por promotor: min={result['load_min']}  "
+            f"máx={result['load_max']}  média={result['load_mean']}  "
+            f"desvio={result['load_stdev']}"
+        )
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from benchmarks.data_generator import SCALES, DataGenerator
+from core.infrastructure.cache.autocomplete_index import autocomplete_index
+from core.infrastructure.repositories.promoter_stats_repository import (
+    PromoterStatsRepository,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Popula o banco (Postgres ou SQLite, conforme DATABASE_URL) com "
+        "dados sintéticos para os benchmarks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=sorted(SCALES),
+            default="small",
+            help="Volume de dados a gerar"
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Não remove os dados de benchmark gerados anteriormente"
+        )
+
+    def handle(self, *args, **options):
+        if not options["keep"]:
+            self.stdout.write("Removendo dados de benchmark anteriores...")
+            DataGenerator.clear()
+
+        generator = DataGenerator(
+            SCALES[options["scale"]],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write
+        )
+        generator.run()
+        # As visitas foram gravadas com bulk_create, sem os contadores
+        PromoterStatsRepository.rebuild()
+        # ...e lojas, marcas e usuários sem os sinais do autocomplete
+        autocomplete_index.invalidate()
+        self.stdout.write(self.style.SUCCESS("Dados de benchmark gerados."))
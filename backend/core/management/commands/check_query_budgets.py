@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+from django.urls import NoReverseMatch, URLResolver, get_resolver, reverse
+from rest_framework.test import APIClient
+from core.infrastructure.monitoring.query_collector import QueryCollector
+from core.management.sample_data import create_user, seed_sample_data
+
+# Rotas de documentação e métricas, fora do orçamento de consultas
+EXCLUDED_ROUTES = {"schema", "swagger-ui", "redoc-ui", "metrics"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Executa um GET em cada rota de config/urls.py, conta as consultas "
+        "e compara com o orçamento definido em QUERY_BUDGETS. Gera um "
+        "relatório JSON por endpoint."
+    )
+
+    dummy_caches = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+        }
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=20,
+            help="Registros de exemplo criados por entidade"
+        )
+        parser.add_argument(
+            "--output",
+            default=os.path.join(tempfile.gettempdir(), "query_report.json"),
+            help="Caminho do relatório JSON (padrão: diretório temporário)"
+        )
+
+    def handle(self, *args, **options):
+        budgets = getattr(settings, "QUERY_BUDGETS", {})
+        default_budget = budgets.get("default")
+        report = {}
+
+        with override_settings(CACHES=self.dummy_caches), \
+                transaction.atomic():
+            # Erros das views viram respostas 500 no relatório
+            client = APIClient(raise_request_exception=False)
+            client.force_authenticate(create_user(role=3))
+            seed_sample_data(options["rows"])
+
+            for name, url in self._get_routes().items():
+                with QueryCollector(track_shapes=True) as collector:
+                    response = client.get(url)
+
+                if response.status_code == 405:
+                    continue
+
+                budget = budgets.get(name, default_budget)
+                entry = {
+                    "url": url,
+                    "status": response.status_code,
+                    "budget": budget,
+                    **collector.summary(),
+                }
+                entry["ok"] = response.status_code < 500 and (
+                    budget is None or entry["queries"] <= budget
+                )
+                report[name] = entry
+
+            transaction.set_rollback(True)
+
+        with open(options["output"], "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2, ensure_ascii=False)
+
+        failures = []
+        for name, entry in report.items():
+            self.stdout.write(
+                f"{'OK  ' if entry['ok'] else 'FAIL'} {entry['url']} "
+                f"[{entry['status']}]: {entry['queries']} consultas "
+                f"(orçamento {entry['budget']}, "
+                f"repetição máx. {entry['max_duplicates']})"
+            )
+            if not entry["ok"]:
+                failures.append(name)
+
+        self.stdout.write(f"Relatório salvo em {options['output']}")
+        if failures:
+            raise CommandError(
+                "Orçamento de consultas excedido em: " + ", ".join(failures)
+            )
+
+    def _get_routes(self):
+        """Rotas nomeadas sem parâmetros, fora de namespaces (admin)"""
+        names = []
+
+        def walk(patterns):
+            for pattern in patterns:
+                if isinstance(pattern, URLResolver):
+                    if not pattern.namespace:
+                        walk(pattern.url_patterns)
+                elif pattern.name and pattern.name not in EXCLUDED_ROUTES:
+                    names.append(pattern.name)
+
+        walk(get_resolver().url_patterns)
+
+        routes = {}
+        for name in names:
+            try:
+                routes[name] = reverse(name)
+            except NoReverseMatch:
+                continue
+        return routes
@@ -0,0 +1,92 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core.management.sample_data import create_user, seed_sample_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Verifica se o número de consultas das listagens da API cresce "
+        "com o volume de dados. Executa dentro de uma transação que é "
+        "desfeita ao final."
+    )
+
+    # Sem cache, para que respostas em cache não escondam as consultas
+    dummy_caches = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+        }
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=5,
+            help="Registros criados por entidade em cada rodada"
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            dest="endpoints",
+            help="Basename da rota (ex: visit-price). Pode ser repetido."
+        )
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        endpoints = self._list_endpoints(options["endpoints"])
+
+        with override_settings(CACHES=self.dummy_caches), \
+                transaction.atomic():
+            client = APIClient()
+            client.force_authenticate(create_user(role=3))
+
+            seed_sample_data(rows)
+            first = self._count_queries(client, endpoints)
+            seed_sample_data(rows)
+            second = self._count_queries(client, endpoints)
+
+            transaction.set_rollback(True)
+
+        failures = []
+        for basename, url in endpoints.items():
+            before, after = first[basename], second[basename]
+            ok = before is not None and before == after
+            self.stdout.write(
+                f"{'OK  ' if ok else 'FAIL'} {url}: "
+                f"{before} -> {after} consultas"
+            )
+            if not ok:
+                failures.append(url)
+
+        if failures:
+            raise CommandError(
+                "Número de consultas cresce com o volume de dados em: "
+                + ", ".join(failures)
+            )
+
+    def _list_endpoints(self, basenames):
+        """Retorna as rotas de listagem registradas no router da API"""
+        from config.urls import router
+
+        endpoints = {}
+        for _prefix, viewset, basename in router.registry:
+            if basenames and basename not in basenames:
+                continue
+            if hasattr(viewset, "list"):
+                endpoints[basename] = reverse(f"{basename}-list")
+        return endpoints
+
+    def _count_queries(self, client, endpoints):
+        """Conta as consultas de cada rota (None se a resposta falhar)"""
+        counts = {}
+        for basename, url in endpoints.items():
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            counts[basename] = (
+                len(context.captured_queries)
+                if response.status_code == 200 else None
+            )
+        return counts
@@ -0,0 +1,104 @@
+import glob
+import io
+import json
+import os
+import pstats
+from django.core.management.base import BaseCommand, CommandError
+from core.infrastructure.monitoring.profiling_middleware import (
+    get_profiling_config,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Lista os perfis capturados pelo ProfilingMiddleware ou resume um "
+        "perfil específico (funções mais custosas e consultas mais lentas)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "profile",
+            nargs="?",
+            help="Nome do perfil (arquivo .json ou .prof) a resumir"
+        )
+        parser.add_argument(
+            "--directory",
+            default=None,
+            help="Diretório dos perfis (padrão: PROFILING['DIRECTORY'])"
+        )
+        parser.add_argument(
+            "--endpoint",
+            help="Lista apenas os perfis deste endpoint"
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Número de funções e consultas exibidas no resumo"
+        )
+
+    def handle(self, *args, **options):
+        directory = options["directory"] or get_profiling_config()["DIRECTORY"]
+        if not os.path.isdir(directory):
+            raise CommandError(f"Diretório de perfis não encontrado: {directory}")
+
+        if options["profile"]:
+            self._summarize(directory, options["profile"], options["top"])
+        else:
+            self._list(directory, options["endpoint"])
+
+    def _load_metadata(self, path):
+        with open(path, encoding="utf-8") as meta_file:
+            return json.load(meta_file)
+
+    def _list(self, directory, endpoint):
+        paths = sorted(glob.glob(os.path.join(directory, "*.json")))
+        if not paths:
+            self.stdout.write("Nenhum perfil capturado.")
+            return
+
+        for path in paths:
+            metadata = self._load_metadata(path)
+            if endpoint and metadata["endpoint"] != endpoint:
+                continue
+            self.stdout.write(
+                f"{os.path.basename(path)}  {metadata['method']} "
+                f"{metadata['endpoint']}  {metadata['duration_ms']} ms  "
+                f"{metadata['query_count']} consultas "
+                f"({metadata['query_time_ms']} ms)  "
+                f"filtros={metadata['filters']}"
+            )
+
+    def _summarize(self, directory, name, top):
+        base_name = os.path.join(directory, os.path.splitext(name)[0])
+        if not os.path.exists(f"{base_name}.json"):
+            raise CommandError(f"Perfil não encontrado: {name}")
+
+        metadata = self._load_metadata(f"{base_name}.json")
+        self.stdout.write(
+            f"{metadata['method']} {metadata['path']} "
+            f"[{metadata['status']}] {metadata['duration_ms']} ms"
+        )
+        self.stdout.write(f"Filtros: {metadata['filters']}")
+        self.stdout.write(
+            f"Consultas: {metadata['query_count']} "
+            f"({metadata['query_time_ms']} ms)"
+        )
+
+        profile_path = os.path.join(directory, metadata["profile"])
+        if metadata["engine"] == "cprofile":
+            output = io.StringIO()
+            stats = pstats.Stats(profile_path, stream=output)
+            stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+            self.stdout.write(output.getvalue())
+        else:
+            self.stdout.write(f"Perfil pyinstrument em {profile_path}")
+
+        slowest = sorted(
+            metadata["queries"], key=lambda query: query["time_ms"],
+            reverse=True
+        )[:top]
+        if slowest:
+            self.stdout.write("Consultas mais lentas:")
+            for query in slowest:
+                self.stdout.write(f"  {query['time_ms']} ms  {query['sql']}")
@@ -0,0 +1,72 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+from core.infrastructure.repositories.promoter_stats_repository import (
+    PromoterStatsRepository,
+)
+from core.infrastructure.repositories.visit_archive_repository import (
+    VisitArchiveRepository,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Confere os contadores diários dos promotores (PromoterDailyStats) "
+        "com as visitas e, com --fix, recalcula os dias divergentes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            help="Data inicial (YYYY-MM-DD). Padrão: a marca d'água do "
+                 "arquivo, pois as visitas arquivadas continuam nos "
+                 "contadores mas não estão mais no banco"
+        )
+        parser.add_argument("--end", help="Data final (YYYY-MM-DD)")
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Recalcula os contadores do intervalo a partir das visitas"
+        )
+        parser.add_argument(
+            "--show",
+            type=int,
+            default=20,
+            help="Quantidade de divergências listadas"
+        )
+
+    def handle(self, *args, **options):
+        dates = {}
+        for name in ("start", "end"):
+            if options[name]:
+                dates[name] = parse_date(options[name])
+                if dates[name] is None:
+                    raise CommandError(
+                        "Data inválida. Use o formato YYYY-MM-DD.")
+        start = dates.get("start") or VisitArchiveRepository.watermark()
+        end = dates.get("end")
+
+        drift = PromoterStatsRepository.drift(start, end)
+        for row in drift[:options["show"]]:
+            self.stdout.write(
+                f"promotor {row['promoter_id']} em {row['date']}: "
+                f"gravado {row['stored']} / esperado {row['expected']}"
+            )
+
+        period = f"{start or 'início'} a {end or 'hoje em diante'}"
+        if not drift:
+            self.stdout.write(self.style.SUCCESS(
+                f"Contadores conferem ({period})."))
+            return
+
+        if not options["fix"]:
+            self.stdout.write(self.style.WARNING(
+                f"{len(drift)} dias divergentes ({period}). "
+                f"Use --fix para recalcular."
+            ))
+            return
+
+        rows = PromoterStatsRepository.rebuild(start, end)
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(drift)} dias divergentes; {rows} linhas recalculadas "
+            f"({period})."
+        ))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.infrastructure.database.search import (
+    SearchIndexError,
+    SearchIndexManager,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Gerencia os índices da busca (PostgreSQL): trigramas (pg_trgm) "
+        "nos nomes, cidades e documentos e full-text (tsvector) de lojas, "
+        "marcas e usuários."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "action",
+            choices=["status", "create", "drop"],
+            help="status lista os índices; create cria os que faltam"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            manager = SearchIndexManager()
+        except SearchIndexError as e:
+            raise CommandError(str(e))
+
+        action = options["action"]
+        if action == "status":
+            for name, exists in manager.status():
+                state = "ok" if exists else "ausente"
+                self.stdout.write(f"{name}: {state}")
+            return
+
+        names = manager.create() if action == "create" else manager.drop()
+        for name in names:
+            self.stdout.write(f"{name}")
+        verb = "criados" if action == "create" else "removidos"
+        self.stdout.write(self.style.SUCCESS(f"{len(names)} índices {verb}."))
@@ -0,0 +1,117 @@
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from core.infrastructure.database.partitioning import (
+    PartitioningError,
+    VisitPartitionManager,
+    add_months,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Gerencia as partições mensais da tabela de visitas (PostgreSQL): "
+        "status, conversão da tabela, criação antecipada de partições e "
+        "desanexação das partições antigas."
+    )
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest="action", required=True)
+
+        subparsers.add_parser(
+            "status", help="Lista as partições e a quantidade de visitas")
+
+        convert = subparsers.add_parser(
+            "convert",
+            help="Converte a tabela comum em tabela particionada por mês"
+        )
+        convert.add_argument("--months-ahead", type=int, default=3)
+        convert.add_argument(
+            "--keep-legacy",
+            action="store_true",
+            help="Mantém a tabela original como core_visitmodel_legacy"
+        )
+
+        create = subparsers.add_parser(
+            "create",
+            help="Cria as partições do mês atual e dos próximos meses"
+        )
+        create.add_argument("--months-ahead", type=int, default=3)
+
+        detach = subparsers.add_parser(
+            "detach",
+            help="Desanexa as partições anteriores ao período mantido"
+        )
+        detach.add_argument(
+            "--keep-months",
+            type=int,
+            required=True,
+            help="Quantidade de meses mantidos, contando o mês atual"
+        )
+        detach.add_argument(
+            "--drop",
+            action="store_true",
+            help="Remove as partições desanexadas em vez de mantê-las"
+        )
+        detach.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas lista as partições que seriam desanexadas"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            manager = VisitPartitionManager()
+            action = options["action"]
+            if action != "convert" and not manager.is_partitioned():
+                raise PartitioningError(
+                    "A tabela de visitas não é particionada. "
+                    "Execute visit_partitions convert primeiro."
+                )
+            getattr(self, f"_{action}")(manager, options)
+        except PartitioningError as e:
+            raise CommandError(str(e))
+
+    def _status(self, manager, options):
+        partitions = manager.partitions(with_counts=True)
+        for partition in partitions:
+            self.stdout.write(f"{partition.name}: {partition.rows} visitas")
+        self.stdout.write(f"{len(partitions)} partições anexadas.")
+
+    def _convert(self, manager, options):
+        copied = manager.convert(
+            months_ahead=options["months_ahead"],
+            keep_legacy=options["keep_legacy"]
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Tabela de visitas particionada; {copied} visitas copiadas."))
+
+    def _create(self, manager, options):
+        created = manager.create_future_partitions(options["months_ahead"])
+        for name in created:
+            self.stdout.write(f"Partição criada: {name}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(created)} partições criadas."))
+
+    def _detach(self, manager, options):
+        if options["keep_months"] < 1:
+            raise CommandError("--keep-months deve ser pelo menos 1.")
+
+        cutoff = add_months(
+            month_start(date.today()), 1 - options["keep_months"])
+        partitions = manager.partitions_before(cutoff)
+        for partition in partitions:
+            self.stdout.write(
+                f"{partition.name}: {partition.rows} visitas")
+            if not options["dry_run"]:
+                manager.detach_partition(partition, drop=options["drop"])
+
+        if options["dry_run"]:
+            verb = "seriam desanexadas"
+        elif options["drop"]:
+            verb = "desanexadas e removidas"
+        else:
+            verb = "desanexadas"
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(partitions)} partições anteriores a {cutoff:%Y-%m} {verb}."
+        ))
@@ -0,0 +1,53 @@
+"""
+Dados de exemplo usados pelos comandos de verificação de consultas.
+"""
+from datetime import date
+from itertools import count
+from core.models import User
+from core.infrastructure.models.brand_model import BrandModel, BrandStore
+from core.infrastructure.models.promoter_brand_model import PromoterBrand
+from core.infrastructure.models.store_model import StoreModel
+from core.infrastructure.models.visit_model import VisitModel
+from core.infrastructure.models.visit_price_model import VisitPriceModel
+
+_sequence = count(1)
+
+
+def create_user(role):
+    """Cria um usuário de exemplo com o papel informado"""
+    n = next(_sequence)
+    return User.objects.create_user(
+        username=f"sample{n}",
+        email=f"sample{n}@sispromo.local",
+        first_name="Sample",
+        last_name=str(n),
+        cpf=f"sample{n}",
+        phone="0",
+        role=role
+    )
+
+
+def seed_sample_data(rows):
+    """Cria lojas, marcas, promotores e seus relacionamentos"""
+    stores = [
+        StoreModel.objects.create(
+            name=f"Loja {n}", number=n, city="São Paulo")
+        for n in (next(_sequence) for _ in range(rows))
+    ]
+    brands = [
+        BrandModel.objects.create(name=f"Marca {next(_sequence)}")
+        for _ in range(rows)
+    ]
+    promoters = [create_user(role=1) for _ in range(rows)]
+
+    for store, brand, promoter in zip(stores, brands, promoters):
+        BrandStore.objects.create(brand=brand, store=store)
+        VisitPriceModel.objects.create(
+            store=store, brand=brand, price="10.00")
+        PromoterBrand.objects.create(promoter=promoter, brand=brand)
+        VisitModel.objects.create(
+            promoter=promoter,
+            store=store,
+            brand=brand,
+            visit_date=date.today()
+        )